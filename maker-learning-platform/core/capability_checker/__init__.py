@@ -1,5 +1,6 @@
 """Capability checker module for detecting system capabilities."""
 
+from .async_checker import AsyncCapabilityChecker
 from .checker import CapabilityChecker, SystemCapabilities
 
-__all__ = ["CapabilityChecker", "SystemCapabilities"]
+__all__ = ["AsyncCapabilityChecker", "CapabilityChecker", "SystemCapabilities"]
@@ -0,0 +1,218 @@
+"""Asyncio-native capability probing.
+
+``AsyncCapabilityChecker`` runs the same probes as ``CapabilityChecker``
+without blocking the event loop, for services that embed capability
+detection next to other work. Command probes are started with
+``asyncio.create_subprocess_exec``; each has its own timeout and the
+whole run has a deadline. Results can be consumed as a stream of
+partial ``SystemCapabilities`` while probes finish::
+
+    checker = AsyncCapabilityChecker(cache_file=".maker-data/capabilities.json")
+    async for probe, capabilities in checker.stream():
+        publish(capabilities)
+
+Cancelling the task that awaits ``check_all`` (or leaving ``stream``
+early) cancels the outstanding probes and kills their processes.
+"""
+
+import asyncio
+import os
+import platform
+import signal
+import time
+from typing import AsyncIterator, Optional
+
+from .checker import PROBED_COMMANDS, CapabilityChecker, SystemCapabilities
+
+
+def _kill(proc: asyncio.subprocess.Process) -> None:
+    """Kill a probe process and its process group."""
+    try:
+        if os.name == "posix":
+            os.killpg(proc.pid, signal.SIGKILL)
+        else:
+            proc.kill()
+    except ProcessLookupError:
+        pass
+
+
+class AsyncCapabilityChecker(CapabilityChecker):
+    """Detects system capabilities without blocking the event loop."""
+
+    async def check_all(self, refresh: bool = False) -> SystemCapabilities:
+        """Run all capability checks and return the final results.
+
+        Args:
+            refresh: Ignore cached results and run every probe
+        """
+        async for _ in self.stream(refresh):
+            pass
+        return self.capabilities
+
+    async def stream(
+        self, refresh: bool = False
+    ) -> AsyncIterator[tuple[str, SystemCapabilities]]:
+        """Run all capability checks, yielding capabilities as they fill in.
+
+        The first update, named ``"cached"``, holds everything known
+        without starting a process: cached results, platform details and
+        commands missing from PATH. Each later update is named after the
+        probe that just finished. If the deadline passes first, a final
+        ``"deadline"`` update fills in the stragglers: commands that exist
+        but didn't report a version count as installed. Every update is a
+        new SystemCapabilities object.
+
+        The cache is written once every probe has finished or the deadline
+        has passed; probes cut off by the deadline are not cached.
+
+        Args:
+            refresh: Ignore cached results and run every probe
+        """
+        fingerprints, entries, stale = self._plan(refresh)
+        had_cache = bool(entries)
+        now = time.time()
+        finished = []
+
+        jobs = {}
+        for probe in stale:
+            if probe == "system":
+                self._results[probe] = self._probe_system()
+                finished.append(probe)
+            elif probe == "hardware":
+                jobs[probe] = self._probe_hardware
+            elif fingerprints[probe] is None:
+                self._results[probe] = None
+                finished.append(probe)
+            else:
+                jobs[probe] = self._probe_command
+        yield "cached", self._assemble()
+
+        limit = asyncio.Semaphore(self.max_workers)
+        tasks = {
+            asyncio.ensure_future(self._limited(limit, job, probe)): probe
+            for probe, job in jobs.items()
+        }
+        pending = set(tasks)
+        loop = asyncio.get_running_loop()
+        end = loop.time() + self.deadline
+        try:
+            while pending:
+                remaining = end - loop.time()
+                if remaining <= 0:
+                    break
+                done, pending = await asyncio.wait(
+                    pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    probe = tasks[task]
+                    self._results[probe] = task.result()
+                    finished.append(probe)
+                    yield probe, self._assemble()
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        if pending:
+            for task in pending:
+                probe = tasks[task]
+                self._results[probe] = (
+                    {"cpu_cores": os.cpu_count() or 0, "memory_gb": 0.0}
+                    if probe == "hardware" else "installed"
+                )
+            yield "deadline", self._assemble()
+
+        for probe in finished:
+            entries[probe] = {
+                "checked_at": now,
+                "fingerprint": fingerprints[probe],
+                "result": self._results[probe],
+            }
+        if self.cache_file and (finished or pending or not had_cache):
+            self._write_cache(entries)
+
+    @staticmethod
+    async def _limited(limit: asyncio.Semaphore, job, probe: str):
+        """Run a probe once a concurrency slot is free."""
+        async with limit:
+            return await job(probe)
+
+    async def _run(self, args: list[str]) -> Optional[tuple[int, str]]:
+        """Run a process and return its exit code and output (stdout, else stderr).
+
+        The process is killed, along with anything it started (version
+        flags of wrapper scripts often spawn the real binary), if it
+        outlives the probe timeout or the probe is cancelled.
+
+        Returns:
+            None if the process couldn't be started
+
+        Raises:
+            asyncio.TimeoutError: If the probe timeout passed
+        """
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *args,
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                start_new_session=os.name == "posix",
+            )
+        except OSError:
+            return None
+
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), self.probe_timeout)
+        except BaseException:
+            if proc.returncode is None:
+                _kill(proc)
+                await proc.wait()
+            raise
+        output = stdout or stderr
+        return proc.returncode, output.decode("utf-8", errors="replace")
+
+    async def _probe_command(self, command: str) -> str:
+        """Run a command's version flag and return the first line of output."""
+        try:
+            result = await self._run([command, PROBED_COMMANDS[command]])
+        except asyncio.TimeoutError:
+            return "installed"
+        if result is None or not result[1].strip():
+            return "installed"
+        # Return first line of output as version
+        return result[1].strip().split("\n")[0]
+
+    async def _probe_hardware(self, probe: str = "hardware") -> dict:
+        """Read CPU core count and total memory."""
+        values = {"cpu_cores": os.cpu_count() or 0, "memory_gb": 0.0}
+
+        # Memory (cross-platform approach)
+        try:
+            os_name = platform.system()
+            if os_name == "Linux":
+                with open("/proc/meminfo") as f:
+                    for line in f:
+                        if line.startswith("MemTotal"):
+                            # Value is in kB
+                            kb = int(line.split()[1])
+                            values["memory_gb"] = kb / (1024 * 1024)
+                            break
+            elif os_name == "Darwin":  # macOS
+                result = await self._run(["sysctl", "-n", "hw.memsize"])
+                if result and result[0] == 0:
+                    bytes_mem = int(result[1].strip())
+                    values["memory_gb"] = bytes_mem / (1024**3)
+            elif os_name == "Windows":
+                # Use wmic on Windows
+                result = await self._run(
+                    ["wmic", "computersystem", "get", "totalphysicalmemory"]
+                )
+                if result and result[0] == 0:
+                    lines = result[1].strip().split("\n")
+                    if len(lines) > 1:
+                        bytes_mem = int(lines[1].strip())
+                        values["memory_gb"] = bytes_mem / (1024**3)
+        except (OSError, ValueError, asyncio.TimeoutError):
+            pass
+        return values
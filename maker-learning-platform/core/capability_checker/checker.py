@@ -7,12 +7,14 @@ Supports Principle 5 (Accessibility First) by working on any system
 and Principle 3 (Flexible Paths) by enabling hardware-aware recommendations.
 """
 
+import asyncio
+import json
 import os
 import platform
 import shutil
-import subprocess
 import sys
-from dataclasses import dataclass, field
+import time
+from dataclasses import asdict, dataclass, field, fields
 from pathlib import Path
 from typing import Optional
 
@@ -114,14 +116,202 @@ class SystemCapabilities:
         return sorted(projects)
 
 
+# Commands probed by the checks below, with the flag that prints their version
+PROBED_COMMANDS = {
+    "git": "--version",
+    "docker": "--version",
+    "node": "--version",
+    "npm": "--version",
+    "psql": "--version",
+    "bash": "--version",
+    "pwsh": "--version",
+    "powershell": "--version",
+    "curl": "--version",
+    "ssh": "-V",
+    "code": "--version",
+}
+
+# Probes that aren't commands: platform and Python details, and hardware
+SYSTEM_PROBES = ("system", "hardware")
+
+# Seconds a probe result stays valid; commands use the "commands" entry
+DEFAULT_TTLS = {
+    "commands": 24 * 3600,
+    "system": 24 * 3600,
+    "hardware": 7 * 24 * 3600,
+}
+
+# Tool names used in summaries that are probed under another name
+PROBE_ALIASES = {
+    "postgres": ("psql",),
+    "powershell": ("pwsh", "powershell"),
+    "vscode": ("code",),
+    "python": ("system",),
+    "sqlite": ("system",),
+}
+
+CACHE_VERSION = 2
+
+
+def _file_fingerprint(path: Optional[str]) -> Optional[list]:
+    """Identify a file by path, mtime and size (None if it doesn't exist)."""
+    if not path:
+        return None
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [path, st.st_mtime_ns, st.st_size]
+
+
+def _read_cache_file(cache_file: Path) -> Optional[dict]:
+    """Read a capability cache file, or None if it is missing or from another version."""
+    try:
+        data = json.loads(cache_file.read_text())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+        return None
+    return data
+
+
+def _write_cache_file(cache_file: Path, data: dict) -> None:
+    """Replace a capability cache file atomically, ignoring write errors."""
+    tmp_path = cache_file.with_name(f".{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(json.dumps(data, indent=2))
+        os.replace(tmp_path, cache_file)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+
+
+def _capabilities_from(values: dict) -> SystemCapabilities:
+    """Build SystemCapabilities from stored values, ignoring unknown fields."""
+    known = {f.name for f in fields(SystemCapabilities)}
+    return SystemCapabilities(**{k: v for k, v in values.items() if k in known})
+
+
 class CapabilityChecker:
     """Detects system capabilities for personalized recommendations."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        cache_file: Optional[str] = None,
+        deadline: float = 8.0,
+        max_workers: int = 8,
+        ttls: Optional[dict[str, float]] = None,
+        probe_timeout: float = 5.0,
+    ):
+        """Create a checker.
+
+        Args:
+            cache_file: Where to cache results between runs (None disables caching)
+            deadline: Overall time limit in seconds for all probes
+            max_workers: Number of probes to run at the same time
+            ttls: Seconds each probe's cached result stays valid, overriding
+                DEFAULT_TTLS; keys are probe names or "commands"
+            probe_timeout: Time limit in seconds for any single probe
+        """
         self.capabilities = SystemCapabilities()
+        self.cache_file = Path(cache_file) if cache_file else None
+        self.deadline = deadline
+        self.max_workers = max_workers
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.probe_timeout = probe_timeout
+        self._results: dict[str, object] = {}
+
+    @classmethod
+    def load_cached(cls, cache_file: str) -> Optional[SystemCapabilities]:
+        """Read capabilities from the cache without probing anything.
+
+        This is the fast path for callers that just need the answer: no
+        process is started. The result is returned only if no probe has
+        expired, every cached binary is still the same file, every tool
+        that was missing is still missing from PATH and the interpreter is
+        the one that was probed.
+
+        Returns:
+            Cached capabilities, or None if a full check is needed
+        """
+        data = _read_cache_file(Path(cache_file))
+        if data is None or time.time() >= data.get("expires_at", 0):
+            return None
+        for probe, entry in data.get("probes", {}).items():
+            fingerprint = entry.get("fingerprint")
+            if probe == "system":
+                # Another interpreter (e.g. a virtualenv) has its own details
+                if fingerprint != _file_fingerprint(sys.executable):
+                    return None
+            elif fingerprint and _file_fingerprint(fingerprint[0]) != fingerprint:
+                return None
+            elif not fingerprint and probe in PROBED_COMMANDS and shutil.which(probe):
+                # Installed since it was found missing
+                return None
+        return _capabilities_from(data.get("capabilities", {}))
+
+    def check_all(self, refresh: bool = False) -> SystemCapabilities:
+        """Run all capability checks and return results.
+
+        With a cache file configured, each probe's cached result is reused
+        while its TTL hasn't passed and the binary it ran (resolved on
+        PATH) has the same path, mtime and size. Only the remaining probes
+        run, concurrently.
+
+        This blocks until the checks finish; it runs AsyncCapabilityChecker
+        on a private event loop, so it can't be called from a coroutine.
+
+        Args:
+            refresh: Ignore cached results and run every probe
+        """
+        from .async_checker import AsyncCapabilityChecker
+
+        checker = AsyncCapabilityChecker(
+            self.cache_file,
+            deadline=self.deadline,
+            max_workers=self.max_workers,
+            ttls=self.ttls,
+            probe_timeout=self.probe_timeout,
+        )
+        self.capabilities = asyncio.run(checker.check_all(refresh))
+        return self.capabilities
 
-    def check_all(self) -> SystemCapabilities:
-        """Run all capability checks and return results."""
+    def _plan(self, refresh: bool) -> tuple[dict[str, Optional[list]], dict[str, dict], list[str]]:
+        """Load still-valid cached probe results into the checker.
+
+        Returns:
+            The current fingerprint of every probe, the cache entries that
+            were reused, and the probes that have to run
+        """
+        cached = {}
+        if self.cache_file and not refresh:
+            data = _read_cache_file(self.cache_file)
+            if data:
+                cached = data.get("probes", {})
+
+        fingerprints = self._fingerprints()
+        now = time.time()
+        entries = {}
+        stale = []
+        for probe, fingerprint in fingerprints.items():
+            entry = cached.get(probe)
+            if (
+                entry is not None
+                and now - entry.get("checked_at", 0) < self._ttl(probe)
+                and entry.get("fingerprint") == fingerprint
+            ):
+                self._results[probe] = entry["result"]
+                entries[probe] = entry
+            else:
+                stale.append(probe)
+        return fingerprints, entries, stale
+
+    def _assemble(self) -> SystemCapabilities:
+        """Build capabilities from the probe results gathered so far.
+
+        Probes without a result yet leave their fields at the defaults.
+        """
+        self.capabilities = SystemCapabilities()
         self._check_system_info()
         self._check_core_tools()
         self._check_dev_tools()
@@ -130,35 +320,105 @@ class CapabilityChecker:
         self._check_network_tools()
         self._check_editors()
         self._check_hardware()
-
         return self.capabilities
 
+    def invalidate(self, *probes: str) -> list[str]:
+        """Drop cached results so the next check_all runs those probes again.
+
+        Args:
+            probes: Probe names (a command from PROBED_COMMANDS, "system" or
+                "hardware") or tool names as shown in summaries, e.g.
+                "postgres". With no names, the whole cache is dropped.
+
+        Returns:
+            Names of the probes whose cached results were dropped
+
+        Raises:
+            ValueError: If a name isn't a known probe or tool
+        """
+        names = []
+        for probe in probes:
+            if probe in PROBE_ALIASES:
+                names.extend(PROBE_ALIASES[probe])
+            elif probe in PROBED_COMMANDS or probe in SYSTEM_PROBES:
+                names.append(probe)
+            else:
+                raise ValueError(f"Unknown capability probe: {probe}")
+
+        data = _read_cache_file(self.cache_file) if self.cache_file else None
+        if data is None:
+            return []
+        cached = data.get("probes", {})
+        dropped = [p for p in (names or list(cached)) if cached.pop(p, None) is not None]
+        if dropped:
+            # The materialized capabilities no longer reflect every probe
+            data["expires_at"] = 0
+            _write_cache_file(self.cache_file, data)
+        return dropped
+
+    def _ttl(self, probe: str) -> float:
+        """Seconds a probe's cached result stays valid."""
+        return self.ttls.get(probe, self.ttls["commands"])
+
+    def _fingerprints(self) -> dict[str, Optional[list]]:
+        """Fingerprint what each probe depends on.
+
+        Commands are fingerprinted by the binary found on PATH, the system
+        probe by the running interpreter, and hardware not at all (it is
+        re-probed when its TTL passes).
+        """
+        fingerprints = {
+            command: _file_fingerprint(shutil.which(command))
+            for command in PROBED_COMMANDS
+        }
+        fingerprints["system"] = _file_fingerprint(sys.executable)
+        fingerprints["hardware"] = None
+        return fingerprints
+
+    def _write_cache(self, entries: dict[str, dict]) -> None:
+        """Store each probe's result and the capabilities assembled from them."""
+        expires_at = min(
+            (entry["checked_at"] + self._ttl(probe) for probe, entry in entries.items()),
+            default=0,
+        )
+        if len(entries) < len(PROBED_COMMANDS) + len(SYSTEM_PROBES):
+            # Probes cut off by the deadline are retried on the next run
+            expires_at = 0
+        _write_cache_file(self.cache_file, {
+            "version": CACHE_VERSION,
+            "expires_at": expires_at,
+            "capabilities": asdict(self.capabilities),
+            "probes": entries,
+        })
+
+    def _probe_system(self) -> dict:
+        """Read platform and Python details."""
+        values = {
+            "os_name": platform.system(),
+            "os_version": platform.release(),
+            "python_version": platform.python_version(),
+            "architecture": platform.machine(),
+            "sqlite_version": None,
+        }
+        try:
+            import sqlite3
+            values["sqlite_version"] = sqlite3.sqlite_version
+        except ImportError:
+            pass
+        return values
+
     def _check_system_info(self) -> None:
         """Detect basic system information."""
-        self.capabilities.os_name = platform.system()
-        self.capabilities.os_version = platform.release()
-        self.capabilities.python_version = platform.python_version()
-        self.capabilities.architecture = platform.machine()
+        system = self._results.get("system") or self._probe_system()
+        self.capabilities.os_name = system["os_name"]
+        self.capabilities.os_version = system["os_version"]
+        self.capabilities.python_version = system["python_version"]
+        self.capabilities.architecture = system["architecture"]
         self.capabilities.has_python = True  # We're running Python!
 
-    def _check_command(self, command: str, version_flag: str = "--version") -> Optional[str]:
-        """Check if a command exists and get its version."""
-        if shutil.which(command):
-            try:
-                result = subprocess.run(
-                    [command, version_flag],
-                    capture_output=True,
-                    text=True,
-                    timeout=5,
-                )
-                # Return first line of output as version
-                output = result.stdout or result.stderr
-                if output:
-                    return output.strip().split("\n")[0]
-                return "installed"
-            except (subprocess.TimeoutExpired, subprocess.SubprocessError):
-                return "installed"
-        return None
+    def _check_command(self, command: str) -> Optional[str]:
+        """Return a command's probed version, or None if it isn't available (yet)."""
+        return self._results.get(command)
 
     def _check_core_tools(self) -> None:
         """Check for core development tools."""
@@ -191,12 +451,10 @@ class CapabilityChecker:
     def _check_databases(self) -> None:
         """Check for database availability."""
         # SQLite (usually bundled with Python)
-        try:
-            import sqlite3
+        system = self._results.get("system") or self._probe_system()
+        if system["sqlite_version"]:
             self.capabilities.has_sqlite = True
-            self.capabilities.tool_versions["sqlite"] = sqlite3.sqlite_version
-        except ImportError:
-            pass
+            self.capabilities.tool_versions["sqlite"] = system["sqlite_version"]
 
         # PostgreSQL client
         psql_version = self._check_command("psql")
@@ -230,7 +488,7 @@ class CapabilityChecker:
             self.capabilities.tool_versions["curl"] = curl_version
 
         # SSH
-        ssh_version = self._check_command("ssh", "-V")
+        ssh_version = self._check_command("ssh")
         if ssh_version:
             self.capabilities.has_ssh = True
             self.capabilities.tool_versions["ssh"] = ssh_version
@@ -245,44 +503,7 @@ class CapabilityChecker:
 
     def _check_hardware(self) -> None:
         """Check basic hardware capabilities."""
-        # CPU cores
-        try:
-            self.capabilities.cpu_cores = os.cpu_count() or 0
-        except Exception:
-            pass
-
-        # Memory (cross-platform approach)
-        try:
-            if self.capabilities.os_name == "Linux":
-                with open("/proc/meminfo") as f:
-                    for line in f:
-                        if line.startswith("MemTotal"):
-                            # Value is in kB
-                            kb = int(line.split()[1])
-                            self.capabilities.memory_gb = kb / (1024 * 1024)
-                            break
-            elif self.capabilities.os_name == "Darwin":  # macOS
-                result = subprocess.run(
-                    ["sysctl", "-n", "hw.memsize"],
-                    capture_output=True,
-                    text=True,
-                    timeout=5,
-                )
-                if result.returncode == 0:
-                    bytes_mem = int(result.stdout.strip())
-                    self.capabilities.memory_gb = bytes_mem / (1024**3)
-            elif self.capabilities.os_name == "Windows":
-                # Use wmic on Windows
-                result = subprocess.run(
-                    ["wmic", "computersystem", "get", "totalphysicalmemory"],
-                    capture_output=True,
-                    text=True,
-                    timeout=5,
-                )
-                if result.returncode == 0:
-                    lines = result.stdout.strip().split("\n")
-                    if len(lines) > 1:
-                        bytes_mem = int(lines[1].strip())
-                        self.capabilities.memory_gb = bytes_mem / (1024**3)
-        except Exception:
-            pass
+        hardware = self._results.get("hardware")
+        if hardware:
+            self.capabilities.cpu_cores = hardware["cpu_cores"]
+            self.capabilities.memory_gb = hardware["memory_gb"]
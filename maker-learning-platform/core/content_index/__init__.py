@@ -0,0 +1,5 @@
+"""Compiled index of the learning content under content/topics."""
+
+from .index import ContentIndex, build_index
+
+__all__ = ["ContentIndex", "build_index"]
@@ -0,0 +1,266 @@
+"""Content compiler for the Maker Learning Platform.
+
+Turns one topic directory (``levels.md``, ``concepts.md``,
+``projects/*.yaml`` and ``assessment/*.yaml``) into a plain dictionary
+describing the subject, its levels and concept ranges, its projects and
+its placement question bank.
+"""
+
+import re
+from pathlib import Path
+from typing import Optional
+
+_OVERVIEW_ITEM = re.compile(r"^-\s+\*\*(.+?)\*\*:\s*(.+)$")
+_LEVEL_HEADING = re.compile(r"^##\s+Level\s+(\d+):\s*([^(]+?)\s*(?:\((.+)\))?\s*$")
+_MODULE_HEADING = re.compile(r"^##\s+Module\s+(\d+):\s*([^(]+?)\s*(?:\((.+)\))?\s*$")
+_BOLD_FIELD = re.compile(r"^\*\*(.+?)\*\*:\s*(.+)$")
+_RANGE = re.compile(r"(\d+)\s*-\s*(\d+)")
+_NUMBERED_ITEM = re.compile(r"^(\d+)\.\s+\S")
+_PROJECT_PREFIX = re.compile(r"^level-\d+-")
+
+# Order of the fields in a compiled question record
+QUESTION_FIELDS = ("id", "concept", "text", "options", "correct_index", "explanation")
+
+
+def topic_sources(topic_dir: Path) -> list[Path]:
+    """List the files a topic is compiled from."""
+    sources = [topic_dir / "levels.md", topic_dir / "concepts.md"]
+    sources.extend(sorted((topic_dir / "projects").glob("*.yaml")))
+    sources.extend(sorted((topic_dir / "assessment").glob("*.yaml")))
+    return [p for p in sources if p.exists()]
+
+
+def _sections(lines: list[str], heading: re.Pattern) -> list[tuple[re.Match, list[str]]]:
+    """Split lines into (heading match, body lines) for headings matching a pattern."""
+    sections = []
+    current = None
+    for line in lines:
+        if line.startswith("## "):
+            match = heading.match(line)
+            current = (match, []) if match else None
+            if current:
+                sections.append(current)
+        elif current:
+            current[1].append(line)
+    return sections
+
+
+def _span(text: str) -> Optional[list[int]]:
+    """Return [first, last] for every a-b range in text combined."""
+    bounds = [int(n) for pair in _RANGE.findall(text) for n in pair]
+    return [min(bounds), max(bounds)] if bounds else None
+
+
+def _parse_level(match: re.Match, body: list[str]) -> dict:
+    """Parse one '## Level N: Name (Subtitle)' section of levels.md."""
+    level = {
+        "level": int(match.group(1)),
+        "name": match.group(2).strip(),
+        "subtitle": match.group(3),
+        "band": None,
+        "concepts": None,
+        "hours": None,
+    }
+
+    covered = []
+    pending = None
+    for line in body:
+        stripped = line.strip()
+        if stripped.startswith("### "):
+            pending = stripped[4:].lower()
+            continue
+
+        field = _BOLD_FIELD.match(stripped)
+        if field:
+            key, value = field.group(1).lower(), field.group(2)
+            if key == "concepts":
+                level["concepts"] = _span(value)
+            elif key == "band":
+                level["band"] = value.strip()
+            elif key == "time estimate":
+                level["hours"] = value.replace("hours", "").strip()
+            continue
+
+        if not stripped:
+            continue
+        if pending == "comparison band" and level["band"] is None:
+            level["band"] = stripped.split(" - ")[0].strip()
+            pending = None
+        elif pending == "time estimate" and level["hours"] is None:
+            level["hours"] = stripped.replace("hours", "").strip()
+            pending = None
+        elif pending == "concepts covered" and stripped.startswith("-"):
+            covered.append(stripped)
+
+    if level["concepts"] is None and covered:
+        level["concepts"] = _span(" ".join(covered))
+    return level
+
+
+def compile_levels(path: Path) -> dict:
+    """Compile a topic's levels.md into subject metadata and level records."""
+    lines = path.read_text(encoding="utf-8").split("\n")
+
+    name = lines[0].lstrip("#").split(" - ")[0].strip() if lines else path.parent.name
+    overview = {}
+    for line in lines:
+        match = _OVERVIEW_ITEM.match(line.strip())
+        if match:
+            overview.setdefault(match.group(1).lower(), match.group(2).strip())
+
+    levels = [_parse_level(m, body) for m, body in _sections(lines, _LEVEL_HEADING)]
+
+    total_concepts = overview.get("total concepts", "")
+    return {
+        "name": name,
+        "summary": overview.get("summary", ""),
+        "hours": overview.get("estimated total time", "").replace("hours", "").strip(),
+        "total_concepts": int(total_concepts) if total_concepts.isdigit() else None,
+        "levels": levels,
+    }
+
+
+def compile_concepts(path: Path) -> list[dict]:
+    """Compile a topic's concepts.md into module records with concept ranges."""
+    lines = path.read_text(encoding="utf-8").split("\n")
+    modules = []
+    for match, body in _sections(lines, _MODULE_HEADING):
+        numbers = [
+            int(m.group(1)) for m in (_NUMBERED_ITEM.match(line.strip()) for line in body) if m
+        ]
+        concepts = [min(numbers), max(numbers)] if numbers else _span(match.group(3) or "")
+        modules.append({
+            "module": int(match.group(1)),
+            "title": match.group(2).strip(),
+            "concepts": concepts,
+        })
+    return modules
+
+
+def compile_project(path: Path, subject_id: str) -> dict:
+    """Compile a project YAML into a normalized project record.
+
+    Handles both the nested layout (``project:``/``structure:``/``validation:``)
+    and the flat layout (``id``/``deliverables``/``requirements``).
+    """
+    import yaml
+
+    data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    slug = _PROJECT_PREFIX.sub("", path.stem)
+    record = {
+        "slug": slug,
+        "file": f"{subject_id}/projects/{path.name}",
+        "subject": subject_id,
+    }
+
+    if "project" in data:
+        project = data["project"]
+        description = project.get("description") or {}
+        primary = (data.get("requirements") or {}).get("primary") or {}
+        record.update({
+            "id": project.get("id", slug),
+            "name": project.get("name", slug),
+            "level": project.get("level", 0),
+            "description": description.get("short", "") if isinstance(description, dict) else description,
+            "estimated_time": (data.get("estimates") or {}).get("time"),
+            "min_level": primary.get("min_level", project.get("level", 0)),
+            "deliverables": [f["path"] for f in (data.get("structure") or {}).get("files") or []],
+            "requirements": [],
+            "checks": list((data.get("validation") or {}).get("automated") or []),
+        })
+    else:
+        record.update({
+            "id": data.get("id", slug),
+            "name": data.get("name", slug),
+            "level": data.get("level", 0),
+            "description": " ".join((data.get("description") or "").split()),
+            "estimated_time": data.get("estimated_time"),
+            "min_level": data.get("level", 0),
+            "deliverables": [d["name"] for d in data.get("deliverables") or []],
+            "requirements": [
+                {
+                    "id": r.get("id"),
+                    "description": r.get("description", ""),
+                    "validation": r.get("validation"),
+                }
+                for r in data.get("requirements") or []
+            ],
+            "checks": [],
+        })
+    return record
+
+
+def compile_questions(path: Path) -> tuple[int, list[list]]:
+    """Compile one level of an assessment question bank.
+
+    Each question becomes a positional record ordered as QUESTION_FIELDS,
+    which keeps the index small and lets readers skip dict construction.
+
+    Returns:
+        The level the file covers and its question records
+    """
+    import yaml
+
+    data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    level = int(data["level"])
+    records = []
+    for question in data.get("questions") or []:
+        options = [str(o) for o in question["options"]]
+        correct = int(question["correct_index"])
+        if not 0 <= correct < len(options):
+            raise ValueError(f"{question['id']}: correct_index {correct} out of range")
+        records.append([
+            str(question["id"]),
+            question.get("concept", ""),
+            question["text"],
+            options,
+            correct,
+            question.get("explanation", ""),
+        ])
+    return level, records
+
+
+def compile_topic(topic_dir: Path) -> dict:
+    """Compile a whole topic directory.
+
+    Files that fail to parse are skipped and reported under ``errors``
+    rather than aborting the build.
+    """
+    subject_id = topic_dir.name
+    topic = {
+        "id": subject_id,
+        "name": subject_id.replace("-", " ").title(),
+        "summary": "",
+        "hours": "",
+        "total_concepts": None,
+        "levels": [],
+        "modules": [],
+        "projects": [],
+        "questions": {},
+        "errors": [],
+    }
+
+    levels_file = topic_dir / "levels.md"
+    if levels_file.exists():
+        topic.update(compile_levels(levels_file))
+
+    concepts_file = topic_dir / "concepts.md"
+    if concepts_file.exists():
+        topic["modules"] = compile_concepts(concepts_file)
+
+    for path in sorted((topic_dir / "projects").glob("*.yaml")):
+        try:
+            topic["projects"].append(compile_project(path, subject_id))
+        except Exception as e:
+            topic["errors"].append(f"projects/{path.name}: {e}")
+
+    topic["projects"].sort(key=lambda p: (p["level"], p["slug"]))
+
+    for path in sorted((topic_dir / "assessment").glob("*.yaml")):
+        try:
+            level, records = compile_questions(path)
+        except Exception as e:
+            topic["errors"].append(f"assessment/{path.name}: {e}")
+            continue
+        topic["questions"].setdefault(str(level), []).extend(records)
+    return topic
@@ -0,0 +1,272 @@
+"""Memory-mapped content index for the Maker Learning Platform.
+
+The index file is laid out as::
+
+    MKIDX | version (u8) | header length (u32) | header JSON | topic blobs...
+
+The header holds each topic's summary, the byte range of its compiled
+JSON blob, the mtimes of the source files it was built from, and the
+files that failed to compile. Each
+topic blob is followed by one blob per assessment level holding that
+level's question records, so a placement test decodes only the levels it
+draws from. Readers memory-map the file and decode only the header plus
+the topics they actually touch. Rebuilding recompiles just the topics
+whose sources changed and copies the other blobs over unchanged.
+"""
+
+import json
+import mmap
+import os
+import struct
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+from .compiler import compile_topic, topic_sources
+
+MAGIC = b"MKIDX"
+VERSION = 3
+PREAMBLE = struct.Struct("<5sBI")
+
+DEFAULT_CONTENT_DIR = Path(__file__).resolve().parents[2] / "content" / "topics"
+DEFAULT_INDEX_PATH = Path(".maker-data") / "content.idx"
+
+
+def _source_mtimes(topic_dir: Path) -> dict[str, int]:
+    """Map each source file of a topic to its mtime."""
+    return {
+        p.relative_to(topic_dir).as_posix(): p.stat().st_mtime_ns
+        for p in topic_sources(topic_dir)
+    }
+
+
+def _topic_dirs(content_dir: Path) -> list[Path]:
+    """List topic directories that have a levels.md."""
+    return sorted(p for p in content_dir.iterdir() if (p / "levels.md").exists())
+
+
+def _read_header(buf) -> Optional[dict]:
+    """Decode the header from an index buffer, or None if it isn't valid."""
+    if len(buf) < PREAMBLE.size:
+        return None
+    magic, version, length = PREAMBLE.unpack_from(buf, 0)
+    if magic != MAGIC or version != VERSION:
+        return None
+    try:
+        return json.loads(bytes(buf[PREAMBLE.size:PREAMBLE.size + length]))
+    except ValueError:
+        return None
+
+
+def _summary(topic: dict) -> dict:
+    """The per-subject fields kept in the header for listing commands."""
+    return {
+        "id": topic["id"],
+        "name": topic["name"],
+        "summary": topic["summary"],
+        "hours": topic["hours"],
+        "levels": len(topic["levels"]),
+        "projects": len(topic["projects"]),
+        "questions": sum(len(q) for q in topic["questions"].values()),
+    }
+
+
+def _encode_topic(topic: dict) -> tuple[bytes, dict]:
+    """Encode a compiled topic into its blob and question layout.
+
+    Returns:
+        The topic blob followed by its per-level question blobs, and a map
+        of level to [offset within the blob, length, question count]
+    """
+    questions = topic.pop("questions")
+    blob = bytearray(json.dumps(topic, separators=(",", ":")).encode("utf-8"))
+    topic_length = len(blob)
+    layout = {}
+    for level in sorted(questions, key=int):
+        records = json.dumps(questions[level], separators=(",", ":")).encode("utf-8")
+        layout[level] = [len(blob), len(records), len(questions[level])]
+        blob += records
+    return bytes(blob), {"topic_length": topic_length, "questions": layout}
+
+
+def is_stale(
+    content_dir: Path = DEFAULT_CONTENT_DIR,
+    index_path: Path = DEFAULT_INDEX_PATH,
+) -> bool:
+    """Check whether any topic was added, removed or modified since the last build."""
+    try:
+        with open(index_path, "rb") as f:
+            preamble = f.read(PREAMBLE.size)
+            if len(preamble) < PREAMBLE.size:
+                return True
+            header = _read_header(preamble + f.read(PREAMBLE.unpack(preamble)[2]))
+    except OSError:
+        return True
+    if header is None:
+        return True
+
+    topics = header["topics"]
+    dirs = _topic_dirs(Path(content_dir))
+    if sorted(topics) != [d.name for d in dirs]:
+        return True
+    return any(topics[d.name]["sources"] != _source_mtimes(d) for d in dirs)
+
+
+def build_index(
+    content_dir: Path = DEFAULT_CONTENT_DIR,
+    index_path: Path = DEFAULT_INDEX_PATH,
+) -> list[str]:
+    """Build or refresh the content index.
+
+    Only topics whose source files changed are recompiled; the rest are
+    copied from the existing index.
+
+    Returns:
+        IDs of the topics that were recompiled
+    """
+    content_dir = Path(content_dir)
+    index_path = Path(index_path)
+
+    old_data = b""
+    if index_path.exists():
+        old_data = index_path.read_bytes()
+    old_header = _read_header(old_data) or {"topics": {}}
+    old_base = PREAMBLE.size + (PREAMBLE.unpack_from(old_data, 0)[2] if old_header["topics"] else 0)
+
+    blobs = []
+    topics = {}
+    rebuilt = []
+    for topic_dir in _topic_dirs(content_dir):
+        sources = _source_mtimes(topic_dir)
+        old = old_header["topics"].get(topic_dir.name)
+        if old and old["sources"] == sources:
+            start = old_base + old["offset"]
+            blob = old_data[start:start + old["length"]]
+            summary = old["summary"]
+            errors = old["errors"]
+            layout = {"topic_length": old["topic_length"], "questions": old["questions"]}
+        else:
+            topic = compile_topic(topic_dir)
+            summary = _summary(topic)
+            errors = [f"{topic_dir.name}/{error}" for error in topic["errors"]]
+            blob, layout = _encode_topic(topic)
+            rebuilt.append(topic_dir.name)
+
+        offset = sum(len(b) for b in blobs)
+        topics[topic_dir.name] = {
+            "offset": offset,
+            "length": len(blob),
+            "sources": sources,
+            "summary": summary,
+            "errors": errors,
+            **layout,
+        }
+        blobs.append(blob)
+
+    if not rebuilt and sorted(topics) == sorted(old_header["topics"]):
+        return rebuilt
+
+    header = json.dumps({"topics": topics}, separators=(",", ":")).encode("utf-8")
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    # A unique temporary name, so concurrent builds don't write into one file
+    f = tempfile.NamedTemporaryFile(
+        dir=index_path.parent, prefix=f".{index_path.name}.", suffix=".tmp", delete=False
+    )
+    try:
+        with f:
+            f.write(PREAMBLE.pack(MAGIC, VERSION, len(header)))
+            f.write(header)
+            for blob in blobs:
+                f.write(blob)
+        os.replace(f.name, index_path)
+    except BaseException:
+        Path(f.name).unlink(missing_ok=True)
+        raise
+    return rebuilt
+
+
+class ContentIndex:
+    """Read-only, memory-mapped view of the compiled content index."""
+
+    def __init__(self, index_path: Path = DEFAULT_INDEX_PATH):
+        self.index_path = Path(index_path)
+        with open(self.index_path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        header = _read_header(self._map)
+        if header is None:
+            self._map.close()
+            raise ValueError(f"Not a valid content index: {self.index_path}")
+        self._topics_meta = header["topics"]
+        self._base = PREAMBLE.size + PREAMBLE.unpack_from(self._map, 0)[2]
+        self._topics: dict[str, dict] = {}
+        self._questions: dict[tuple[str, int], list[list]] = {}
+
+    @classmethod
+    def load(
+        cls,
+        content_dir: Path = DEFAULT_CONTENT_DIR,
+        index_path: Path = DEFAULT_INDEX_PATH,
+    ) -> "ContentIndex":
+        """Open the index, rebuilding stale topics first."""
+        if is_stale(content_dir, index_path):
+            build_index(content_dir, index_path)
+        return cls(index_path)
+
+    def errors(self) -> list[str]:
+        """Source files that failed to compile and were left out, with the reason."""
+        return [error for meta in self._topics_meta.values() for error in meta["errors"]]
+
+    def subjects(self) -> list[dict]:
+        """Summaries of every subject, without decoding any topic blob."""
+        return [meta["summary"] for meta in self._topics_meta.values()]
+
+    def topic(self, subject_id: str) -> Optional[dict]:
+        """Full compiled record for a subject, decoded on first access."""
+        if subject_id not in self._topics:
+            meta = self._topics_meta.get(subject_id)
+            if meta is None:
+                return None
+            start = self._base + meta["offset"]
+            self._topics[subject_id] = json.loads(self._map[start:start + meta["topic_length"]])
+        return self._topics[subject_id]
+
+    def question_counts(self, subject_id: str) -> dict[int, int]:
+        """Map assessment levels to their number of questions, from the header alone."""
+        meta = self._topics_meta.get(subject_id) or {"questions": {}}
+        return {int(level): entry[2] for level, entry in meta["questions"].items()}
+
+    def questions(self, subject_id: str, level: int) -> list[list]:
+        """Question records for one assessment level, decoded on first access.
+
+        Records are positional lists ordered as compiler.QUESTION_FIELDS.
+        """
+        key = (subject_id, level)
+        if key not in self._questions:
+            meta = self._topics_meta.get(subject_id)
+            entry = meta["questions"].get(str(level)) if meta else None
+            if entry is None:
+                return []
+            start = self._base + meta["offset"] + entry[0]
+            self._questions[key] = json.loads(self._map[start:start + entry[1]])
+        return self._questions[key]
+
+    def level_names(self, subject_id: str) -> dict[int, str]:
+        """Map level numbers to names for a subject."""
+        topic = self.topic(subject_id) or {"levels": []}
+        return {level["level"]: level["name"] for level in topic["levels"]}
+
+    def projects(self, subject_id: str) -> list[dict]:
+        """Projects of a subject, ordered by level."""
+        topic = self.topic(subject_id)
+        return topic["projects"] if topic else []
+
+    def find_project(self, subject_id: str, slug: str) -> Optional[dict]:
+        """Find a project by its subject and slug."""
+        for project in self.projects(subject_id):
+            if project["slug"] == slug:
+                return project
+        return None
+
+    def close(self):
+        """Release the memory map."""
+        self._map.close()
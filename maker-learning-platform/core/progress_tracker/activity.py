@@ -0,0 +1,154 @@
+"""Time-bucketed activity index for progress statistics.
+
+Timestamps in the progress history are ISO strings with no index, so
+questions like "projects per week" would otherwise mean scanning every
+completion. The ``ActivityIndex`` keeps per-day and per-ISO-week totals
+that the tracker updates as each event is applied, plus the longest
+streak of consecutive active days. Reading a range of buckets costs one
+dictionary lookup per bucket, however long the history is.
+"""
+
+from datetime import date, timedelta
+from typing import Optional
+
+# Order of the totals kept in each bucket
+BUCKET_FIELDS = ("projects", "concepts", "minutes")
+
+
+def day_of(timestamp: str) -> Optional[date]:
+    """The calendar day of an ISO timestamp, or None if it isn't one."""
+    try:
+        return date.fromisoformat(timestamp[:10])
+    except (TypeError, ValueError):
+        return None
+
+
+def week_start(day: date) -> date:
+    """The Monday of the ISO week containing a day."""
+    return day - timedelta(days=day.weekday())
+
+
+class ActivityIndex:
+    """Daily and weekly activity totals, maintained on write.
+
+    A day is active if any event happened on it, even one that added no
+    projects, concepts or time (starting a subject, taking an assessment).
+    Each bucket holds totals ordered as BUCKET_FIELDS.
+    """
+
+    def __init__(self, days: Optional[dict] = None):
+        """Create an index.
+
+        Args:
+            days: Stored daily totals keyed by date or ISO date string, as
+                from to_dict()
+        """
+        self.days: dict[date, list[int]] = {}
+        self.weeks: dict[date, list[int]] = {}
+        self.longest_streak = 0
+        self._last_day: Optional[date] = None
+        self._run = 0
+        for key in sorted(days or {}):
+            day = key if isinstance(key, date) else date.fromisoformat(key)
+            self.days[day] = list(days[key])
+            self._add_to_week(day, days[key])
+            self._extend_streak(day)
+
+    def _add_to_week(self, day: date, counts: list[int]):
+        week = self.weeks.setdefault(week_start(day), [0] * len(BUCKET_FIELDS))
+        for i, n in enumerate(counts):
+            week[i] += n
+
+    def _extend_streak(self, day: date):
+        """Update the streak bookkeeping for a newly active day."""
+        if self._last_day is not None and day < self._last_day:
+            # An import filled in the past; recount from the daily buckets
+            self._recount_streaks()
+            return
+        if self._last_day is not None and day - self._last_day == timedelta(days=1):
+            self._run += 1
+        else:
+            self._run = 1
+        self._last_day = day
+        self.longest_streak = max(self.longest_streak, self._run)
+
+    def _recount_streaks(self):
+        self.longest_streak = self._run = 0
+        self._last_day = None
+        for day in sorted(self.days):
+            self._extend_streak(day)
+
+    def record(self, timestamp: str, projects: int = 0, concepts: int = 0, minutes: int = 0):
+        """Add an event's contribution to its day and week.
+
+        Timestamps that aren't ISO dates (e.g. from hand-edited imports)
+        are ignored.
+        """
+        day = day_of(timestamp)
+        if day is None:
+            return
+        counts = [projects, concepts, minutes]
+        bucket = self.days.get(day)
+        if bucket is None:
+            self.days[day] = list(counts)
+            self._extend_streak(day)
+        else:
+            for i, n in enumerate(counts):
+                bucket[i] += n
+        self._add_to_week(day, counts)
+
+    def current_streak(self, today: date) -> int:
+        """Consecutive active days ending today, or yesterday if today is still open."""
+        day = today if today in self.days else today - timedelta(days=1)
+        streak = 0
+        while day in self.days:
+            streak += 1
+            day -= timedelta(days=1)
+        return streak
+
+    def daily(self, end: date, count: int) -> list[tuple[date, list[int]]]:
+        """Totals for the ``count`` days ending on ``end``, oldest first."""
+        empty = [0] * len(BUCKET_FIELDS)
+        days = [end - timedelta(days=n) for n in range(count - 1, -1, -1)]
+        return [(day, self.days.get(day, empty)) for day in days]
+
+    def weekly(self, end: date, count: int) -> list[tuple[date, list[int]]]:
+        """Totals for the ``count`` ISO weeks ending with the week of ``end``, oldest first.
+
+        Weeks are identified by their Monday.
+        """
+        empty = [0] * len(BUCKET_FIELDS)
+        last = week_start(end)
+        weeks = [last - timedelta(weeks=n) for n in range(count - 1, -1, -1)]
+        return [(week, self.weeks.get(week, empty)) for week in weeks]
+
+    def to_dict(self) -> dict[str, list[int]]:
+        """Daily totals keyed by ISO date; weekly totals are rebuilt from them."""
+        return {day.isoformat(): counts for day, counts in sorted(self.days.items())}
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, ActivityIndex):
+            return self.days == other.days
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"ActivityIndex({len(self.days)} active days)"
+
+
+def index_activity(progress) -> ActivityIndex:
+    """Rebuild an activity index from progress stored before the index existed.
+
+    Only project completions carry their own timestamps; for each subject
+    the start and last activity days are marked active as well.
+    """
+    activity = ActivityIndex()
+    for subject in progress.subjects.values():
+        activity.record(subject.started_at)
+        activity.record(subject.last_activity)
+    for completion in progress.completed_projects:
+        activity.record(
+            completion.completed_at,
+            projects=1,
+            minutes=completion.time_spent_minutes or 0,
+        )
+    return activity
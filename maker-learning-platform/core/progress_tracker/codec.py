@@ -0,0 +1,332 @@
+"""Compact binary encoding of UserProgress.
+
+Used by the ``binary`` storage backend for ``progress.bin`` snapshots.
+The file is a versioned header followed by length-prefixed sections::
+
+    MKPRG | version (u8) | strings | user | subjects | completions | activity
+
+- ``strings``: every ID, level name and note, stored once. All other
+  sections refer to strings by index.
+- ``user``: user ID, timestamps, total time and the journal sequence
+  number the snapshot includes.
+- ``subjects``: one length-prefixed record per subject; completed
+  concepts are stored as the raw bitset.
+- ``completions``: the project history as fixed-width columns, unpacked
+  with a single ``array`` call per column. Records are built from the
+  columns only when read.
+- ``activity``: the daily activity buckets as columns of day ordinals and
+  project, concept and minute totals.
+
+Timestamps produced by ``datetime.isoformat()`` are stored as int64
+microseconds since 0001-01-01. Any other timestamp text is stored as a
+negative string reference, so decoding is lossless. Integers are
+little-endian.
+"""
+
+import struct
+import sys
+from array import array
+from datetime import date, datetime, timedelta
+from itertools import accumulate
+from typing import Optional
+
+from .activity import ActivityIndex
+from .models import (
+    CompletionLog,
+    ConceptSet,
+    ProjectCompletion,
+    SubjectProgress,
+    UserProgress,
+)
+
+MAGIC = b"MKPRG"
+VERSION = 3
+
+_HEADER = struct.Struct("<5sB")
+_LENGTH = struct.Struct("<I")
+_USER = struct.Struct("<IqqqQ")
+_SUBJECT = struct.Struct("<IqIqqBqII")
+
+_EPOCH = datetime.min
+_NONE = -(2 ** 63)
+
+
+class CodecError(ValueError):
+    """Data is not a valid binary progress snapshot."""
+
+
+def _pack_array(typecode: str, values) -> bytes:
+    """Pack integers as a little-endian array."""
+    packed = array(typecode, values)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def _unpack_array(typecode: str, data) -> array:
+    """Unpack a little-endian array."""
+    unpacked = array(typecode)
+    unpacked.frombytes(data)
+    if sys.byteorder == "big":
+        unpacked.byteswap()
+    return unpacked
+
+
+class _Strings:
+    """Interns strings and timestamps while encoding."""
+
+    def __init__(self):
+        self.index: dict[str, int] = {}
+
+    def ref(self, value: str) -> int:
+        return self.index.setdefault(value, len(self.index))
+
+    def optional_ref(self, value: Optional[str]) -> int:
+        return -1 if value is None else self.ref(value)
+
+    def timestamp(self, value: str) -> int:
+        """Encode an ISO timestamp as microseconds when that round-trips exactly."""
+        try:
+            parsed = datetime.fromisoformat(value)
+        except (TypeError, ValueError):
+            parsed = None
+        if parsed is None or parsed.tzinfo is not None or parsed.isoformat() != value:
+            return -1 - self.ref(value)
+        delta = parsed - _EPOCH
+        return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+    def encode(self) -> bytes:
+        encoded = [s.encode("utf-8") for s in self.index]
+        return (
+            _LENGTH.pack(len(encoded))
+            + _pack_array("I", [len(e) for e in encoded])
+            + b"".join(encoded)
+        )
+
+
+def _section(data: bytes) -> bytes:
+    """Prefix a section with its length."""
+    return _LENGTH.pack(len(data)) + data
+
+
+def encode_progress(progress: UserProgress, seq: int = 0) -> bytes:
+    """Encode progress (and the journal sequence number it includes) to bytes."""
+    strings = _Strings()
+
+    user = _USER.pack(
+        strings.ref(progress.user_id),
+        strings.timestamp(progress.created_at),
+        strings.timestamp(progress.last_updated),
+        progress.total_time_minutes,
+        seq,
+    )
+
+    subjects = [_LENGTH.pack(len(progress.subjects))]
+    for s in progress.subjects.values():
+        concepts = s.concepts_completed.to_bytes()
+        projects = _pack_array("I", [strings.ref(p) for p in s.completed_projects])
+        record = _SUBJECT.pack(
+            strings.ref(s.subject_id),
+            s.current_level,
+            strings.ref(s.level_name),
+            strings.timestamp(s.started_at),
+            strings.timestamp(s.last_activity),
+            int(bool(s.assessment_taken)),
+            _NONE if s.assessment_level is None else s.assessment_level,
+            len(s.completed_projects),
+            len(concepts),
+        )
+        subjects.append(_section(record + projects + concepts))
+
+    history = progress.completed_projects
+    completions = (
+        _LENGTH.pack(len(history))
+        + _pack_array("I", [strings.ref(pc.project_id) for pc in history])
+        + _pack_array("q", [strings.timestamp(pc.completed_at) for pc in history])
+        + _pack_array("q", [
+            _NONE if pc.time_spent_minutes is None else pc.time_spent_minutes
+            for pc in history
+        ])
+        + _pack_array("i", [strings.optional_ref(pc.notes) for pc in history])
+        + _pack_array("i", [strings.optional_ref(pc.subject_id) for pc in history])
+    )
+
+    days = sorted(progress.activity.days.items())
+    activity = (
+        _LENGTH.pack(len(days))
+        + _pack_array("i", [day.toordinal() for day, _ in days])
+        + b"".join(
+            _pack_array(code, [counts[i] for _, counts in days])
+            for i, code in enumerate("IIq")
+        )
+    )
+
+    return b"".join([
+        _HEADER.pack(MAGIC, VERSION),
+        _section(strings.encode()),
+        _section(user),
+        _section(b"".join(subjects)),
+        _section(completions),
+        _section(activity),
+    ])
+
+
+class _Decoder:
+    """Turns string references and timestamps back into text."""
+
+    def __init__(self, strings: list[str]):
+        self.strings = strings
+        self._seconds: dict[int, str] = {}
+
+    def str(self, index: int) -> str:
+        try:
+            return self.strings[index]
+        except IndexError:
+            raise CodecError(f"String index {index} out of range") from None
+
+    def timestamp(self, value: int) -> str:
+        if value < 0:
+            return self.str(-1 - value)
+        # History timestamps cluster, so format each whole second once
+        seconds, micros = divmod(value, 1_000_000)
+        prefix = self._seconds.get(seconds)
+        if prefix is None:
+            prefix = self._seconds[seconds] = (_EPOCH + timedelta(seconds=seconds)).isoformat()
+        return f"{prefix}.{micros:06d}" if micros else prefix
+
+
+def _sections(data: bytes, count: int) -> list[memoryview]:
+    """Split the body into its length-prefixed sections."""
+    view = memoryview(data)
+    pos = _HEADER.size
+    sections = []
+    for _ in range(count):
+        if pos + _LENGTH.size > len(view):
+            raise CodecError("Truncated progress snapshot")
+        (length,) = _LENGTH.unpack_from(view, pos)
+        pos += _LENGTH.size
+        if pos + length > len(view):
+            raise CodecError("Truncated progress snapshot")
+        sections.append(view[pos:pos + length])
+        pos += length
+    return sections
+
+
+def _decode_strings(section: memoryview) -> list[str]:
+    """Decode the string table."""
+    (count,) = _LENGTH.unpack_from(section, 0)
+    lengths_end = _LENGTH.size + 4 * count
+    lengths = _unpack_array("I", section[_LENGTH.size:lengths_end])
+    blob = bytes(section[lengths_end:])
+    ends = list(accumulate(lengths))
+    try:
+        return [blob[end - n:end].decode("utf-8") for n, end in zip(lengths, ends)]
+    except UnicodeDecodeError as e:
+        raise CodecError(f"Corrupt string table: {e}") from e
+
+
+def _decode_activity(section: memoryview) -> ActivityIndex:
+    """Decode the activity section."""
+    (n,) = _LENGTH.unpack_from(section, 0)
+    offsets = list(accumulate([_LENGTH.size] + [array(code).itemsize * n for code in "iIIq"]))
+    if offsets[-1] > len(section):
+        raise CodecError("Truncated progress snapshot")
+    days, projects, concepts, minutes = (
+        _unpack_array(code, section[start:end])
+        for code, start, end in zip("iIIq", offsets, offsets[1:])
+    )
+    try:
+        return ActivityIndex({
+            date.fromordinal(day): [p, c, m]
+            for day, p, c, m in zip(days, projects, concepts, minutes)
+        })
+    except ValueError as e:
+        raise CodecError(f"Corrupt activity section: {e}") from e
+
+
+def decode_progress(data: bytes) -> tuple[UserProgress, int]:
+    """Decode bytes produced by encode_progress.
+
+    Returns:
+        The progress and the journal sequence number it includes
+
+    Raises:
+        CodecError: If the data is not a valid snapshot of the current version
+    """
+    if len(data) < _HEADER.size:
+        raise CodecError("Not a binary progress snapshot")
+    magic, version = _HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise CodecError("Not a binary progress snapshot")
+    if version != VERSION:
+        raise CodecError(f"Unsupported progress snapshot version: {version}")
+
+    try:
+        strings, user, subject_data, completion_data, activity_data = _sections(data, 5)
+        d = _Decoder(_decode_strings(strings))
+
+        user_ref, created, updated, total_time, seq = _USER.unpack_from(user, 0)
+
+        subjects = {}
+        (count,) = _LENGTH.unpack_from(subject_data, 0)
+        pos = _LENGTH.size
+        for _ in range(count):
+            (length,) = _LENGTH.unpack_from(subject_data, pos)
+            record = subject_data[pos + _LENGTH.size:pos + _LENGTH.size + length]
+            pos += _LENGTH.size + length
+
+            (sid, level, level_name, started, last, assessed,
+             assessment_level, n_projects, n_concepts) = _SUBJECT.unpack_from(record, 0)
+            projects_end = _SUBJECT.size + 4 * n_projects
+            projects = _unpack_array("I", record[_SUBJECT.size:projects_end])
+            subject = SubjectProgress(
+                subject_id=d.str(sid),
+                current_level=level,
+                level_name=d.str(level_name),
+                started_at=d.timestamp(started),
+                last_activity=d.timestamp(last),
+                completed_projects=[d.str(p) for p in projects],
+                concepts_completed=ConceptSet.from_bytes(
+                    record[projects_end:projects_end + n_concepts]
+                ),
+                assessment_taken=bool(assessed),
+                assessment_level=None if assessment_level == _NONE else assessment_level,
+            )
+            subjects[subject.subject_id] = subject
+
+        (n,) = _LENGTH.unpack_from(completion_data, 0)
+        codes = "Iqqii"
+        sizes = [array(code).itemsize * n for code in codes]
+        offsets = list(accumulate([_LENGTH.size] + sizes))
+        if offsets[-1] > len(completion_data):
+            raise CodecError("Truncated progress snapshot")
+        columns = [
+            _unpack_array(code, completion_data[start:end])
+            for code, start, end in zip(codes, offsets, offsets[1:])
+        ]
+        projects, completed, spent, notes, owners = columns
+
+        def decode(i: int) -> ProjectCompletion:
+            return ProjectCompletion(
+                project_id=d.str(projects[i]),
+                completed_at=d.timestamp(completed[i]),
+                time_spent_minutes=None if spent[i] == _NONE else spent[i],
+                notes=None if notes[i] < 0 else d.str(notes[i]),
+                subject_id=None if owners[i] < 0 else d.str(owners[i]),
+            )
+
+        completions = CompletionLog(stored=n, decode=decode)
+        activity = _decode_activity(activity_data)
+    except struct.error as e:
+        raise CodecError(f"Truncated progress snapshot: {e}") from e
+
+    progress = UserProgress(
+        user_id=d.str(user_ref),
+        created_at=d.timestamp(created),
+        last_updated=d.timestamp(updated),
+        subjects=subjects,
+        completed_projects=completions,
+        total_time_minutes=total_time,
+        activity=activity,
+    )
+    return progress, seq
@@ -0,0 +1,107 @@
+"""Read-only views of a learner's project completion history.
+
+A ``ProjectHistory`` is a filtered, newest-first view over completion
+records. It never copies the history: counting and paging walk the
+underlying records (or, for SQLite, run a query) and only build the
+ProjectCompletion objects that are actually returned.
+"""
+
+import copy
+from datetime import date, datetime
+from itertools import islice
+from typing import Iterator, Optional, Sequence, Union
+
+from .models import ProjectCompletion
+
+# A date bound may be an ISO string or a date/datetime
+DateBound = Union[str, date, datetime, None]
+
+
+def _iso(value: DateBound) -> Optional[str]:
+    """Normalize a date bound to an ISO string, which sorts chronologically."""
+    if value is None or isinstance(value, str):
+        return value
+    return value.isoformat()
+
+
+class ProjectHistory:
+    """Newest-first view of project completions, optionally filtered.
+
+    Filters are a subject ID and a ``since <= completed_at < until``
+    range. Date bounds compare as ISO strings, so ``since="2024-05-01"``
+    includes the whole of May 1st.
+    """
+
+    def __init__(
+        self,
+        records: Sequence[ProjectCompletion],
+        subject_id: Optional[str] = None,
+        since: DateBound = None,
+        until: DateBound = None,
+    ):
+        """Create a view.
+
+        Args:
+            records: Completions in chronological order (e.g. a CompletionLog)
+            subject_id: Only include completions in this subject
+            since: Only include completions at or after this time
+            until: Only include completions before this time
+        """
+        self.records = records
+        self.subject_id = subject_id
+        self.since = _iso(since)
+        self.until = _iso(until)
+
+    @property
+    def filtered(self) -> bool:
+        """Whether the view excludes any records."""
+        return any(v is not None for v in (self.subject_id, self.since, self.until))
+
+    def filter(
+        self,
+        subject_id: Optional[str] = None,
+        since: DateBound = None,
+        until: DateBound = None,
+    ) -> "ProjectHistory":
+        """Narrow the view further; unspecified filters are kept."""
+        view = copy.copy(self)
+        if subject_id is not None:
+            view.subject_id = subject_id
+        if since is not None:
+            view.since = _iso(since)
+        if until is not None:
+            view.until = _iso(until)
+        return view
+
+    def _matches(self, completion: ProjectCompletion) -> bool:
+        """Check a completion against the view's filters."""
+        if self.subject_id is not None and completion.subject_id != self.subject_id:
+            return False
+        if self.since is not None and completion.completed_at < self.since:
+            return False
+        if self.until is not None and completion.completed_at >= self.until:
+            return False
+        return True
+
+    def count(self) -> int:
+        """Number of matching completions."""
+        if not self.filtered:
+            return len(self.records)
+        return sum(1 for _ in self)
+
+    def __len__(self) -> int:
+        return self.count()
+
+    def __iter__(self) -> Iterator[ProjectCompletion]:
+        for completion in reversed(self.records):
+            if self._matches(completion):
+                yield completion
+
+    def page(self, number: int, size: int = 20) -> list[ProjectCompletion]:
+        """Return one page of matching completions, newest first.
+
+        Args:
+            number: Zero-based page number
+            size: Completions per page
+        """
+        return list(islice(iter(self), number * size, (number + 1) * size))
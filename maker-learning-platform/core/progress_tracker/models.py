@@ -0,0 +1,393 @@
+"""Progress data model for the Maker Learning Platform.
+
+These dataclasses are shared by the progress tracker and its storage
+backends, along with helpers for converting them to and from the JSON
+document shape used in ``progress.json``.
+"""
+
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Callable, Iterable, Iterator, Optional
+
+from .activity import ActivityIndex, index_activity
+
+
+@dataclass
+class ProjectCompletion:
+    """Record of a completed project."""
+    project_id: str
+    completed_at: str
+    time_spent_minutes: Optional[int] = None
+    notes: Optional[str] = None
+    subject_id: Optional[str] = None
+
+
+class CompletionLog:
+    """Project completion history that decodes stored records on access.
+
+    Records loaded from storage stay in their stored form (parsed JSON
+    dicts, binary columns) and are turned into ProjectCompletion objects
+    only when read, without being cached. New completions are appended
+    as objects.
+    """
+
+    __slots__ = ("_stored", "_decode", "_added")
+
+    def __init__(
+        self,
+        completions: Iterable[ProjectCompletion] = (),
+        stored: int = 0,
+        decode: Optional[Callable[[int], ProjectCompletion]] = None,
+    ):
+        """Create a log.
+
+        Args:
+            completions: Completions to start with, in chronological order
+            stored: Number of records available through decode
+            decode: Builds the stored record at an index (0 is oldest)
+        """
+        self._stored = stored
+        self._decode = decode
+        self._added: list[ProjectCompletion] = list(completions)
+
+    def append(self, completion: ProjectCompletion):
+        """Add a new completion at the end of the history."""
+        self._added.append(completion)
+
+    def __len__(self) -> int:
+        return self._stored + len(self._added)
+
+    def __getitem__(self, index: int) -> ProjectCompletion:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("completion index out of range")
+        if index < self._stored:
+            return self._decode(index)
+        return self._added[index - self._stored]
+
+    def __iter__(self) -> Iterator[ProjectCompletion]:
+        for index in range(self._stored):
+            yield self._decode(index)
+        yield from self._added
+
+    def __reversed__(self) -> Iterator[ProjectCompletion]:
+        yield from reversed(self._added)
+        for index in range(self._stored - 1, -1, -1):
+            yield self._decode(index)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (CompletionLog, list)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"CompletionLog({len(self)} completions)"
+
+
+class ConceptSet:
+    """Set of completed concept IDs stored as a bitset.
+
+    Concept IDs are small non-negative integers, so bit ``n`` of a single
+    Python int records whether concept ``n`` is complete. Membership and
+    adding are O(1), unions are one big-int OR, and the count is kept
+    alongside the bits. Iteration yields IDs in ascending order.
+    """
+
+    __slots__ = ("_bits", "_count")
+
+    def __init__(self, concept_ids: Iterable[int] = ()):
+        self._bits = 0
+        self._count = 0
+        self.update(concept_ids)
+
+    def add(self, concept_id: int) -> bool:
+        """Mark a concept complete.
+
+        Returns:
+            True if the concept was not already in the set
+        """
+        if concept_id < 0:
+            raise ValueError(f"Concept IDs must be non-negative, got {concept_id}")
+        mask = 1 << concept_id
+        if self._bits & mask:
+            return False
+        self._bits |= mask
+        self._count += 1
+        return True
+
+    def update(self, concept_ids: Iterable[int]):
+        """Add many concepts at once."""
+        if isinstance(concept_ids, ConceptSet):
+            self._bits |= concept_ids._bits
+            self._count = bin(self._bits).count("1")
+            return
+        for concept_id in concept_ids:
+            self.add(concept_id)
+
+    def to_bytes(self) -> bytes:
+        """The bitset as little-endian bytes."""
+        return self._bits.to_bytes((self._bits.bit_length() + 7) // 8, "little")
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "ConceptSet":
+        """Rebuild a set from the output of to_bytes()."""
+        concepts = cls()
+        concepts._bits = int.from_bytes(data, "little")
+        concepts._count = bin(concepts._bits).count("1")
+        return concepts
+
+    def __or__(self, other: "ConceptSet") -> "ConceptSet":
+        union = ConceptSet()
+        union._bits = self._bits | other._bits
+        union._count = bin(union._bits).count("1")
+        return union
+
+    def __contains__(self, concept_id) -> bool:
+        return isinstance(concept_id, int) and concept_id >= 0 and bool(self._bits >> concept_id & 1)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[int]:
+        bits = self._bits
+        while bits:
+            low = bits & -bits
+            yield low.bit_length() - 1
+            bits ^= low
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, ConceptSet):
+            return self._bits == other._bits
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"ConceptSet({list(self)})"
+
+
+class ProjectSet:
+    """Insertion-ordered set of completed project IDs."""
+
+    __slots__ = ("_ids",)
+
+    def __init__(self, project_ids: Iterable[str] = ()):
+        self._ids: dict[str, None] = dict.fromkeys(project_ids)
+
+    def add(self, project_id: str) -> bool:
+        """Mark a project complete.
+
+        Returns:
+            True if the project was not already in the set
+        """
+        if project_id in self._ids:
+            return False
+        self._ids[project_id] = None
+        return True
+
+    def update(self, project_ids: Iterable[str]):
+        """Add many projects at once, keeping first-seen order."""
+        self._ids.update(dict.fromkeys(p for p in project_ids if p not in self._ids))
+
+    def __contains__(self, project_id) -> bool:
+        return project_id in self._ids
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._ids)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, ProjectSet):
+            return list(self._ids) == list(other._ids)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"ProjectSet({list(self._ids)})"
+
+
+@dataclass
+class SubjectProgress:
+    """Progress within a single subject.
+
+    ``completed_projects`` and ``concepts_completed`` accept any iterable
+    and are stored as a ProjectSet and ConceptSet; they serialize back to
+    plain lists.
+    """
+    subject_id: str
+    current_level: int
+    level_name: str
+    started_at: str
+    last_activity: str
+    completed_projects: ProjectSet
+    concepts_completed: ConceptSet
+    assessment_taken: bool = False
+    assessment_level: Optional[int] = None
+
+    def __post_init__(self):
+        if not isinstance(self.completed_projects, ProjectSet):
+            self.completed_projects = ProjectSet(self.completed_projects)
+        if not isinstance(self.concepts_completed, ConceptSet):
+            self.concepts_completed = ConceptSet(self.concepts_completed)
+
+
+# Skill bands subjects are grouped into by current level
+BANDS = ("Novice", "Competent", "Proficient", "Expert")
+
+
+def band_for_level(level: int) -> str:
+    """Return the skill band a level falls into."""
+    if level <= 1:
+        return "Novice"
+    if level <= 3:
+        return "Competent"
+    if level <= 5:
+        return "Proficient"
+    return "Expert"
+
+
+@dataclass
+class SummaryCounters:
+    """Aggregate progress counters, kept up to date on every mutation."""
+    subjects_started: int = 0
+    projects_completed: int = 0
+    concepts_learned: int = 0
+    time_minutes: int = 0
+    bands: dict[str, int] = field(default_factory=lambda: dict.fromkeys(BANDS, 0))
+    last_activity: str = ""
+
+    def move_band(self, old_level: int, new_level: int):
+        """Move one subject between bands after a level change."""
+        self.bands[band_for_level(old_level)] -= 1
+        self.bands[band_for_level(new_level)] += 1
+
+    def to_summary(self) -> dict:
+        """Render the counters in the shape returned by ProgressTracker.get_summary."""
+        return {
+            "subjects_started": self.subjects_started,
+            "total_projects_completed": self.projects_completed,
+            "total_concepts_learned": self.concepts_learned,
+            "total_time_hours": round(self.time_minutes / 60, 1),
+            "bands": dict(self.bands),
+            "last_activity": self.last_activity,
+        }
+
+
+@dataclass
+class UserProgress:
+    """Complete progress for a user.
+
+    ``counters`` is derived from the rest of the progress; it is computed
+    on construction and then maintained incrementally by the tracker.
+    ``activity`` is maintained the same way but is stored alongside the
+    progress, since concept completions keep no timestamps of their own.
+    """
+    user_id: str
+    created_at: str
+    last_updated: str
+    subjects: dict[str, SubjectProgress]
+    completed_projects: CompletionLog
+    total_time_minutes: int = 0
+    counters: Optional[SummaryCounters] = field(default=None, compare=False, repr=False)
+    activity: Optional[ActivityIndex] = field(default=None, compare=False, repr=False)
+
+    def __post_init__(self):
+        if not isinstance(self.completed_projects, CompletionLog):
+            self.completed_projects = CompletionLog(self.completed_projects)
+        if self.counters is None:
+            self.counters = count_progress(self)
+        if self.activity is None:
+            self.activity = index_activity(self)
+
+
+def count_progress(progress: UserProgress) -> SummaryCounters:
+    """Recompute summary counters from the full progress history."""
+    counters = SummaryCounters(
+        subjects_started=len(progress.subjects),
+        projects_completed=len(progress.completed_projects),
+        concepts_learned=sum(len(s.concepts_completed) for s in progress.subjects.values()),
+        time_minutes=progress.total_time_minutes,
+        last_activity=progress.last_updated,
+    )
+    for subject in progress.subjects.values():
+        counters.bands[band_for_level(subject.current_level)] += 1
+    return counters
+
+
+def new_progress(user_id: str = "default") -> UserProgress:
+    """Create empty progress for a new user."""
+    now = datetime.now().isoformat()
+    return UserProgress(
+        user_id=user_id,
+        created_at=now,
+        last_updated=now,
+        subjects={},
+        completed_projects=[],
+    )
+
+
+def progress_from_dict(data: dict) -> UserProgress:
+    """Convert dictionary to UserProgress object."""
+    subjects = {}
+    for sid, sdata in data.get("subjects", {}).items():
+        subjects[sid] = SubjectProgress(**sdata)
+
+    # Completions written before they recorded their subject get it from
+    # the per-subject project lists
+    owner = {}
+    for subject in subjects.values():
+        for project_id in subject.completed_projects:
+            owner.setdefault(project_id, subject.subject_id)
+
+    raw = data.get("completed_projects", [])
+
+    def decode(index: int) -> ProjectCompletion:
+        completion = ProjectCompletion(**raw[index])
+        if completion.subject_id is None:
+            completion.subject_id = owner.get(completion.project_id)
+        return completion
+
+    projects = CompletionLog(stored=len(raw), decode=decode)
+    activity = data.get("activity")
+
+    return UserProgress(
+        user_id=data.get("user_id", "default"),
+        created_at=data.get("created_at", datetime.now().isoformat()),
+        last_updated=data.get("last_updated", datetime.now().isoformat()),
+        subjects=subjects,
+        completed_projects=projects,
+        total_time_minutes=data.get("total_time_minutes", 0),
+        activity=ActivityIndex(activity) if activity is not None else None,
+    )
+
+
+def subject_to_dict(subject: SubjectProgress) -> dict:
+    """Convert SubjectProgress to its JSON shape, with plain ID lists."""
+    return {
+        "subject_id": subject.subject_id,
+        "current_level": subject.current_level,
+        "level_name": subject.level_name,
+        "started_at": subject.started_at,
+        "last_activity": subject.last_activity,
+        "completed_projects": list(subject.completed_projects),
+        "concepts_completed": list(subject.concepts_completed),
+        "assessment_taken": subject.assessment_taken,
+        "assessment_level": subject.assessment_level,
+    }
+
+
+def progress_to_dict(progress: UserProgress) -> dict:
+    """Convert UserProgress object to a JSON-serializable dictionary."""
+    return {
+        "user_id": progress.user_id,
+        "created_at": progress.created_at,
+        "last_updated": progress.last_updated,
+        "subjects": {
+            sid: subject_to_dict(sp) for sid, sp in progress.subjects.items()
+        },
+        "completed_projects": [
+            asdict(pc) for pc in progress.completed_projects
+        ],
+        "total_time_minutes": progress.total_time_minutes,
+        "activity": progress.activity.to_dict(),
+    }
@@ -0,0 +1,191 @@
+"""Multi-user progress storage for the Maker Learning Platform.
+
+Shared machines keep one progress store per learner under
+``<data_dir>/users``, fanned out into 256 buckets by a hash of the user
+ID so no single directory grows huge::
+
+    users/registry.json
+    users/3f/alice/progress.json
+    users/a0/bob/progress.db
+
+The registry lists every user and the shard holding their data.
+Aggregates across users are computed one store at a time, so memory use
+does not grow with the number of learners.
+"""
+
+import hashlib
+import json
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, Optional
+from urllib.parse import quote
+
+from .models import BANDS
+from .storage import ProgressStoreError, atomic_write
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locking
+    fcntl = None
+
+
+def shard_path(users_dir: Path, user_id: str) -> Path:
+    """Return the directory holding a user's progress.
+
+    Args:
+        users_dir: Root of the per-user storage
+        user_id: User whose directory to locate
+
+    Raises:
+        ValueError: If the user ID can't be used as a directory name
+    """
+    name = quote(user_id, safe="-_@")
+    if not user_id or name in (".", ".."):
+        raise ValueError(f"Invalid user ID: {user_id!r}")
+    bucket = hashlib.sha1(user_id.encode("utf-8")).hexdigest()[:2]
+    return users_dir / bucket / name
+
+
+class UserRegistry:
+    """Registry of the learners sharing a data directory."""
+
+    def __init__(self, data_dir: str = ".maker-data"):
+        self.data_dir = Path(data_dir)
+        self.users_dir = self.data_dir / "users"
+        self.registry_file = self.users_dir / "registry.json"
+        self.lock_file = self.users_dir / "registry.lock"
+
+    @contextmanager
+    def _locked(self, exclusive: bool = False):
+        """Hold an advisory lock on the registry."""
+        if fcntl is None:
+            yield
+            return
+        self.users_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.lock_file, "a") as f:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    def _read(self) -> dict:
+        """Read the registry entries, keyed by user ID."""
+        if not self.registry_file.exists():
+            return {}
+        try:
+            data = json.loads(self.registry_file.read_text(encoding="utf-8"))
+        except ValueError as e:
+            raise ProgressStoreError(f"{self.registry_file} is corrupt: {e}") from e
+        return data.get("users", {})
+
+    def users(self) -> list[str]:
+        """IDs of every registered user, in registration order."""
+        with self._locked():
+            return list(self._read())
+
+    def __contains__(self, user_id: str) -> bool:
+        with self._locked():
+            return user_id in self._read()
+
+    def __len__(self) -> int:
+        return len(self.users())
+
+    def path_for(self, user_id: str) -> Path:
+        """Directory holding a user's progress (whether or not they are registered)."""
+        return shard_path(self.users_dir, user_id)
+
+    def register(self, user_id: str) -> Path:
+        """Add a user to the registry if needed.
+
+        Returns:
+            The user's data directory, created if missing
+        """
+        path = self.path_for(user_id)
+        path.mkdir(parents=True, exist_ok=True)
+        with self._locked(exclusive=True):
+            users = self._read()
+            if user_id not in users:
+                users[user_id] = {
+                    "shard": path.relative_to(self.users_dir).as_posix(),
+                    "registered_at": datetime.now().isoformat(),
+                }
+                atomic_write(
+                    self.registry_file,
+                    json.dumps({"users": users}, indent=2),
+                )
+        return path
+
+    def tracker(self, user_id: str, backend: Optional[str] = None):
+        """Open a ProgressTracker for a user, registering them first."""
+        from .tracker import ProgressTracker
+
+        return ProgressTracker(self.register(user_id), user_id, backend)
+
+    def _trackers(self, user_ids: list[str]) -> Iterator:
+        """Yield (user_id, tracker) for users with stored progress, one store at a time.
+
+        Users who registered but never saved progress are skipped, so
+        reading doesn't create progress for them.
+        """
+        from .tracker import ProgressTracker
+
+        for user_id in user_ids:
+            path = self.path_for(user_id)
+            if not path.is_dir():
+                continue
+            tracker = ProgressTracker(path, user_id)
+            try:
+                if tracker.store.has_progress():
+                    yield user_id, tracker
+            finally:
+                tracker.store.close()
+
+    def summaries(self) -> Iterator[tuple[str, dict]]:
+        """Yield (user_id, summary) for each user with stored progress, one store at a time."""
+        for user_id, tracker in self._trackers(self.users()):
+            yield user_id, tracker.get_summary()
+
+    def aggregate_summary(self) -> dict:
+        """Summarize progress across all users.
+
+        Each user's counters are folded into running totals and dropped
+        before the next store is opened. Time is summed in minutes and
+        rounded once, and users without stored progress count as
+        registered but inactive.
+
+        Returns:
+            Totals in the same shape as ProgressTracker.get_summary, plus
+            the number of users and how many have started a subject
+        """
+        user_ids = self.users()
+        totals = {
+            "users": len(user_ids),
+            "active_users": 0,
+            "subjects_started": 0,
+            "total_projects_completed": 0,
+            "total_concepts_learned": 0,
+            "total_time_hours": 0.0,
+            "bands": dict.fromkeys(BANDS, 0),
+            "last_activity": None,
+        }
+        minutes = 0
+        for _, tracker in self._trackers(user_ids):
+            counters = tracker.get_counters()
+            if counters.subjects_started:
+                totals["active_users"] += 1
+            totals["subjects_started"] += counters.subjects_started
+            totals["total_projects_completed"] += counters.projects_completed
+            totals["total_concepts_learned"] += counters.concepts_learned
+            minutes += counters.time_minutes
+            for band, count in counters.bands.items():
+                totals["bands"][band] = totals["bands"].get(band, 0) + count
+            if counters.last_activity and (
+                totals["last_activity"] is None
+                or counters.last_activity > totals["last_activity"]
+            ):
+                totals["last_activity"] = counters.last_activity
+
+        totals["total_time_hours"] = round(minutes / 60, 1)
+        return totals
@@ -0,0 +1,1070 @@
+"""Storage backends for progress tracking.
+
+The tracker applies every mutation to its in-memory ``UserProgress`` and
+hands the resulting event to a ``ProgressStore`` for persistence. Three
+backends are provided:
+
+- ``JsonProgressStore``: a ``progress.json`` snapshot plus an append-only
+  ``progress.log`` journal (the default, human-readable format).
+- ``BinaryProgressStore``: the same journal with a compact binary
+  ``progress.bin`` snapshot (see ``codec``), for large histories.
+- ``SQLiteProgressStore``: a ``progress.db`` database with indexed tables,
+  which can answer summary queries without loading the full history.
+
+Several processes (CLI invocations, a background watcher) may share one
+data directory. The JSON store coordinates them with ``fcntl`` advisory
+locks on ``progress.lock``: readers share the lock, writers hold it
+exclusively, and snapshots are replaced atomically so a crash never
+leaves a truncated ``progress.json`` behind.
+"""
+
+import json
+import os
+import sqlite3
+import time
+from contextlib import contextmanager, nullcontext
+from dataclasses import asdict
+from pathlib import Path
+from typing import Optional, Union
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locking
+    fcntl = None
+
+from .activity import ActivityIndex, day_of
+from .history import ProjectHistory
+from .models import (
+    CompletionLog,
+    ProjectCompletion,
+    SubjectProgress,
+    SummaryCounters,
+    UserProgress,
+    progress_from_dict,
+    progress_to_dict,
+)
+
+
+class ProgressStoreError(Exception):
+    """Stored progress exists but cannot be read."""
+
+
+def atomic_write(path: Path, data: Union[str, bytes], fsync: bool = True):
+    """Replace a file's contents atomically.
+
+    The data is written to a temporary file in the same directory and
+    renamed over the target, so readers see either the old or the new
+    file, never a partial one.
+
+    Args:
+        path: File to replace
+        data: New contents
+        fsync: Flush the file and the directory entry to disk before returning
+    """
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+            f.flush()
+            if fsync:
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    if fsync and hasattr(os, "O_DIRECTORY"):
+        dir_fd = os.open(path.parent, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+class ProgressStore:
+    """Interface for progress persistence backends."""
+
+    def __init__(self, data_dir: Path, user_id: str = "default"):
+        self.data_dir = Path(data_dir)
+        self.user_id = user_id
+
+    def load(self) -> Optional[UserProgress]:
+        """Load stored progress, or None if nothing has been saved yet."""
+        raise NotImplementedError
+
+    def has_progress(self) -> bool:
+        """Whether any progress has been saved, without loading it."""
+        raise NotImplementedError
+
+    def replay(self):
+        """Yield events recorded since the progress returned by load()."""
+        return iter(())
+
+    def save(self, progress: UserProgress):
+        """Write the complete progress, replacing what is stored."""
+        raise NotImplementedError
+
+    def append(self, event: dict, progress: UserProgress):
+        """Persist a single event that has already been applied to progress."""
+        raise NotImplementedError
+
+    def append_batch(self, events: list[dict], progress: UserProgress):
+        """Persist several events as one write.
+
+        Backends should override this to make the batch atomic; the default
+        appends events one at a time.
+        """
+        for event in events:
+            self.append(event, progress)
+
+    def write_summary(self, progress: UserProgress):
+        """Persist the progress's summary counters."""
+
+    def lock(self, exclusive: bool = False):
+        """Context manager holding a shared (read) or exclusive (write) lock."""
+        return nullcontext()
+
+    def is_stale(self) -> bool:
+        """Whether another process has written since this store last read or wrote."""
+        return False
+
+    def history(self) -> Optional[ProjectHistory]:
+        """Return a view of the project history if the backend can query it directly.
+
+        Returning None makes the tracker build the view over loaded progress.
+        """
+        return None
+
+    def get_counters(self) -> Optional[SummaryCounters]:
+        """Return the stored summary counters if the backend can read them directly.
+
+        Returning None makes the tracker use the counters of loaded progress.
+        """
+        return None
+
+    def get_summary(self) -> Optional[dict]:
+        """Return the progress summary if the backend can compute it directly.
+
+        Returning None makes the tracker compute it from loaded progress.
+        """
+        counters = self.get_counters()
+        return counters.to_summary() if counters is not None else None
+
+    def get_subject_list(self) -> Optional[list[dict]]:
+        """Return per-subject summaries if the backend can compute them directly."""
+        return None
+
+    def get_activity(self) -> Optional[ActivityIndex]:
+        """Return the activity index if the backend can read it without loading progress.
+
+        Returning None makes the tracker use the index of loaded progress.
+        """
+        return None
+
+    def close(self):
+        """Release any resources held by the store."""
+
+
+class JsonProgressStore(ProgressStore):
+    """JSON snapshot plus append-only event journal."""
+
+    # Journal entries allowed before the log is folded into the snapshot
+    COMPACT_THRESHOLD = 500
+    SNAPSHOT_NAME = "progress.json"
+
+    def __init__(
+        self,
+        data_dir: Path,
+        user_id: str = "default",
+        fsync: bool = True,
+        group_commit: float = 0.0,
+    ):
+        """Create a JSON store.
+
+        Args:
+            data_dir: Directory holding the progress files
+            user_id: User whose progress is stored
+            fsync: Flush writes to disk before reporting them done
+            group_commit: When fsync is on, sync journal appends at most once
+                per this many seconds; later appends are synced by the next
+                write past the window or by close()
+        """
+        super().__init__(data_dir, user_id)
+        self.progress_file = self.data_dir / self.SNAPSHOT_NAME
+        self.journal_file = self.data_dir / "progress.log"
+        self.lock_file = self.data_dir / "progress.lock"
+        self.summary_file = self.data_dir / "summary.json"
+        self.activity_file = self.data_dir / "activity.json"
+        self.fsync = fsync
+        self.group_commit = group_commit
+        self.seq = 0
+        self._journal_entries = 0
+        self._last_sync = 0.0
+        self._unsynced = False
+        # Days with events in the journal, i.e. not yet in activity.json
+        self._journal_days: set = set()
+        self._seen: tuple = ()
+        self._lock_fd: Optional[int] = None
+        self._lock_depth = 0
+        self._lock_exclusive = False
+
+    @contextmanager
+    def lock(self, exclusive: bool = False):
+        """Hold an advisory lock on the data directory.
+
+        Shared locks allow concurrent readers; an exclusive lock waits for
+        them and blocks everyone else. Re-entering while a lock is held
+        reuses it, upgrading a shared lock to exclusive if needed.
+        """
+        if fcntl is None:
+            yield
+            return
+
+        if self._lock_fd is None:
+            self._lock_fd = os.open(self.lock_file, os.O_RDWR | os.O_CREAT, 0o644)
+
+        outer = self._lock_depth == 0
+        upgrade = exclusive and not self._lock_exclusive
+        if outer or upgrade:
+            fcntl.flock(self._lock_fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            previous, self._lock_exclusive = self._lock_exclusive, exclusive or self._lock_exclusive
+        self._lock_depth += 1
+        try:
+            yield
+        finally:
+            self._lock_depth -= 1
+            if self._lock_depth == 0:
+                fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+                self._lock_exclusive = False
+            elif upgrade:
+                fcntl.flock(self._lock_fd, fcntl.LOCK_SH)
+                self._lock_exclusive = previous
+
+    def _stat_files(self) -> tuple:
+        """Identify the current versions of the snapshot and journal."""
+        stats = []
+        for path in (self.progress_file, self.journal_file):
+            try:
+                st = path.stat()
+                stats.append((st.st_ino, st.st_size, st.st_mtime_ns))
+            except OSError:
+                stats.append(None)
+        return tuple(stats)
+
+    def is_stale(self) -> bool:
+        """Whether the snapshot or journal changed since this store last touched them."""
+        return self._stat_files() != self._seen
+
+    def has_progress(self) -> bool:
+        """Whether the snapshot exists."""
+        return self.progress_file.exists()
+
+    def load(self) -> Optional[UserProgress]:
+        """Load progress from the snapshot (journal replay is done by the caller).
+
+        Raises:
+            ProgressStoreError: If the snapshot exists but is unreadable
+        """
+        self._seen = self._stat_files()
+        self.seq = 0
+        self._journal_entries = 0
+        self._journal_days = set()
+        if not self.progress_file.exists():
+            return None
+
+        try:
+            progress, self.seq = self._read_snapshot()
+        except (ValueError, TypeError, KeyError) as e:
+            raise ProgressStoreError(f"{self.progress_file} is corrupt: {e}") from e
+        return progress
+
+    def _read_snapshot(self) -> tuple[UserProgress, int]:
+        """Decode the snapshot file into progress and its sequence number."""
+        data = json.loads(self.progress_file.read_text(encoding="utf-8"))
+        return progress_from_dict(data), data.get("seq", 0)
+
+    def _encode_snapshot(self, progress: UserProgress) -> Union[str, bytes]:
+        """Encode progress and the current sequence number for the snapshot file."""
+        data = progress_to_dict(progress)
+        data["seq"] = self.seq
+        return json.dumps(data, indent=2)
+
+    def replay(self):
+        """Yield journal events newer than the loaded snapshot."""
+        if not self.journal_file.exists():
+            return
+
+        with self.journal_file.open(encoding="utf-8") as f:
+            for line in f:
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    # A torn final line from an interrupted append
+                    continue
+                self._journal_entries += 1
+                if event.get("seq", 0) <= self.seq:
+                    continue
+                self.seq = event["seq"]
+                self._note_days([event])
+                yield event
+
+    def _note_days(self, events: list[dict]):
+        """Remember the days of events that are only in the journal."""
+        for event in events:
+            day = day_of(event.get("at"))
+            if day is not None:
+                self._journal_days.add(day)
+
+    def save(self, progress: UserProgress):
+        """Atomically replace the snapshot with the full progress.
+
+        The full activity index is written alongside it to activity.json,
+        so later appends only need to record the days they touch.
+        """
+        with self.lock(exclusive=True):
+            atomic_write(self.progress_file, self._encode_snapshot(progress), self.fsync)
+            self._seen = self._stat_files()
+            activity = {
+                "snapshot": list(self._seen[0]),
+                "days": progress.activity.to_dict(),
+            }
+            atomic_write(self.activity_file, json.dumps(activity), self.fsync)
+            self._journal_days = set()
+            self.write_summary(progress)
+
+    def write_summary(self, progress: UserProgress):
+        """Write the summary counters to summary.json.
+
+        The file records which versions of the snapshot and journal the
+        counters describe, so a crash between a data write and the summary
+        write is detected rather than trusted. For the activity index it
+        holds only the days with journaled events; the rest is in
+        activity.json.
+
+        Being checked against the data files, the summary is only synced
+        when the journal write it follows was, so it doesn't add fsyncs
+        inside the group commit window.
+        """
+        days = progress.activity.days
+        data = {
+            "files": [list(st) if st else None for st in self._seen],
+            "counters": asdict(progress.counters),
+            "journal_days": {
+                day.isoformat(): days[day] for day in sorted(self._journal_days) if day in days
+            },
+        }
+        with self.lock(exclusive=True):
+            atomic_write(
+                self.summary_file, json.dumps(data), self.fsync and not self._unsynced
+            )
+
+    def _read_summary(self) -> Optional[dict]:
+        """Read summary.json if it matches the current data files."""
+        try:
+            data = json.loads(self.summary_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        current = [list(st) if st else None for st in self._stat_files()]
+        if not isinstance(data, dict) or data.get("files") != current:
+            return None
+        return data
+
+    def get_counters(self) -> Optional[SummaryCounters]:
+        """Read the counters from summary.json if it matches the current data files."""
+        data = self._read_summary()
+        try:
+            return SummaryCounters(**data["counters"])
+        except (TypeError, KeyError):
+            return None
+
+    def get_activity(self) -> Optional[ActivityIndex]:
+        """Rebuild the activity index from activity.json and summary.json.
+
+        Returns None unless both match the current data files.
+        """
+        summary = self._read_summary()
+        try:
+            data = json.loads(self.activity_file.read_text(encoding="utf-8"))
+            if data["snapshot"] != summary["files"][0]:
+                return None
+            days = dict(data["days"])
+            days.update(summary["journal_days"])
+            return ActivityIndex(days)
+        except (OSError, TypeError, KeyError, ValueError):
+            return None
+
+    def compact(self, progress: UserProgress):
+        """Fold the journal into the snapshot and truncate the log.
+
+        The snapshot records the sequence number of the last event it
+        contains, so a crash between the two steps never double-applies
+        an event on the next load.
+        """
+        with self.lock(exclusive=True):
+            self.save(progress)
+            atomic_write(self.journal_file, "", self.fsync)
+            self._journal_entries = 0
+            self._unsynced = False
+            self._seen = self._stat_files()
+            self.write_summary(progress)
+
+    @staticmethod
+    def _trim_torn_tail(f):
+        """Cut a torn final line (from an interrupted append) off an open journal.
+
+        Without this the next append would be glued onto the fragment and
+        lost along with it on replay.
+        """
+        end = f.seek(0, os.SEEK_END)
+        if end == 0:
+            return
+        f.seek(end - 1)
+        if f.read(1) == b"\n":
+            return
+        pos = end
+        while pos > 0:
+            start = max(0, pos - 4096)
+            f.seek(start)
+            newline = f.read(pos - start).rfind(b"\n")
+            if newline != -1:
+                f.truncate(start + newline + 1)
+                return
+            pos = start
+        f.truncate(0)
+
+    def _write_journal(self, data: str, force_sync: bool = False):
+        """Append to the journal, syncing according to the group commit window.
+
+        Callers hold the exclusive lock.
+        """
+        with self.journal_file.open("a+b") as f:
+            self._trim_torn_tail(f)
+            f.write(data.encode("utf-8"))
+            f.flush()
+            if self.fsync:
+                now = time.monotonic()
+                if force_sync or now - self._last_sync >= self.group_commit:
+                    os.fsync(f.fileno())
+                    self._last_sync = now
+                    self._unsynced = False
+                else:
+                    self._unsynced = True
+        self._seen = self._stat_files()
+
+    def append(self, event: dict, progress: UserProgress):
+        """Append an event to the journal, compacting when it grows too long."""
+        with self.lock(exclusive=True):
+            self.seq += 1
+            record = {"seq": self.seq}
+            record.update(event)
+            self._write_journal(json.dumps(record, separators=(",", ":")) + "\n")
+            self._journal_entries += 1
+            self._note_days([event])
+
+            if self._journal_entries >= self.COMPACT_THRESHOLD:
+                self.compact(progress)
+            else:
+                self.write_summary(progress)
+
+    def append_batch(self, events: list[dict], progress: UserProgress):
+        """Append a batch of events with a single write.
+
+        A batch that would push the journal past the compaction threshold
+        is written straight into the snapshot instead.
+        """
+        if not events:
+            return
+        with self.lock(exclusive=True):
+            if self._journal_entries + len(events) >= self.COMPACT_THRESHOLD:
+                self.seq += len(events)
+                self.compact(progress)
+                return
+
+            lines = []
+            for event in events:
+                self.seq += 1
+                record = {"seq": self.seq}
+                record.update(event)
+                lines.append(json.dumps(record, separators=(",", ":")) + "\n")
+
+            self._write_journal("".join(lines), force_sync=True)
+            self._journal_entries += len(events)
+            self._note_days(events)
+            self.write_summary(progress)
+
+    def close(self):
+        """Sync any journal appends still inside the group commit window."""
+        if self._unsynced and self.journal_file.exists():
+            with self.journal_file.open("a", encoding="utf-8") as f:
+                os.fsync(f.fileno())
+            self._unsynced = False
+        if self._lock_fd is not None:
+            os.close(self._lock_fd)
+            self._lock_fd = None
+
+
+class BinaryProgressStore(JsonProgressStore):
+    """Event journal with a compact binary snapshot instead of JSON."""
+
+    SNAPSHOT_NAME = "progress.bin"
+
+    def _read_snapshot(self) -> tuple[UserProgress, int]:
+        """Decode the binary snapshot."""
+        from .codec import decode_progress
+
+        return decode_progress(self.progress_file.read_bytes())
+
+    def _encode_snapshot(self, progress: UserProgress) -> bytes:
+        """Encode progress with the binary codec."""
+        from .codec import encode_progress
+
+        return encode_progress(progress, self.seq)
+
+
+class SQLiteProgressStore(ProgressStore):
+    """SQLite database with one row per subject and per completion."""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS users (
+            user_id TEXT PRIMARY KEY,
+            created_at TEXT NOT NULL,
+            last_updated TEXT NOT NULL,
+            total_time_minutes INTEGER NOT NULL DEFAULT 0
+        );
+        CREATE TABLE IF NOT EXISTS subjects (
+            user_id TEXT NOT NULL,
+            subject_id TEXT NOT NULL,
+            current_level INTEGER NOT NULL,
+            level_name TEXT NOT NULL,
+            started_at TEXT NOT NULL,
+            last_activity TEXT NOT NULL,
+            assessment_taken INTEGER NOT NULL DEFAULT 0,
+            assessment_level INTEGER,
+            PRIMARY KEY (user_id, subject_id)
+        );
+        CREATE TABLE IF NOT EXISTS concept_completions (
+            user_id TEXT NOT NULL,
+            subject_id TEXT NOT NULL,
+            concept_id INTEGER NOT NULL,
+            completed_at TEXT NOT NULL,
+            PRIMARY KEY (user_id, subject_id, concept_id)
+        );
+        CREATE TABLE IF NOT EXISTS project_completions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id TEXT NOT NULL,
+            subject_id TEXT,
+            project_id TEXT NOT NULL,
+            completed_at TEXT NOT NULL,
+            time_spent_minutes INTEGER,
+            notes TEXT
+        );
+        CREATE TABLE IF NOT EXISTS user_summary (
+            user_id TEXT PRIMARY KEY,
+            counters TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS activity_days (
+            user_id TEXT NOT NULL,
+            day TEXT NOT NULL,
+            projects INTEGER NOT NULL,
+            concepts INTEGER NOT NULL,
+            minutes INTEGER NOT NULL,
+            PRIMARY KEY (user_id, day)
+        );
+        CREATE INDEX IF NOT EXISTS idx_subjects_activity
+            ON subjects (user_id, last_activity);
+        CREATE INDEX IF NOT EXISTS idx_concepts_time
+            ON concept_completions (user_id, completed_at);
+        CREATE INDEX IF NOT EXISTS idx_projects_subject
+            ON project_completions (user_id, subject_id, project_id);
+        CREATE INDEX IF NOT EXISTS idx_projects_time
+            ON project_completions (user_id, completed_at);
+    """
+
+    def __init__(self, data_dir: Path, user_id: str = "default"):
+        super().__init__(data_dir, user_id)
+        self.db_file = self.data_dir / "progress.db"
+        self.conn = sqlite3.connect(str(self.db_file))
+        self.conn.executescript(self.SCHEMA)
+        self._data_version = None
+        self._activity_stored = True
+        self._write_depth = 0
+
+    @contextmanager
+    def lock(self, exclusive: bool = False):
+        """Hold the database's write lock while an exclusive lock is held.
+
+        An exclusive lock runs ``BEGIN IMMEDIATE``, so checking is_stale()
+        and the writes that follow form one transaction no other connection
+        can commit into. It commits when the outermost exclusive lock is
+        released and rolls back on error. Shared locks need nothing, since
+        every read sees a committed state.
+        """
+        if not exclusive:
+            yield
+            return
+
+        outer = self._write_depth == 0
+        if outer:
+            self.conn.execute("BEGIN IMMEDIATE")
+        self._write_depth += 1
+        try:
+            yield
+        except BaseException:
+            if outer:
+                self.conn.rollback()
+            raise
+        else:
+            if outer:
+                self.conn.commit()
+        finally:
+            self._write_depth -= 1
+
+    @contextmanager
+    def _transaction(self):
+        """Run statements in a transaction, or in the one an exclusive lock holds."""
+        if self._write_depth:
+            yield
+        else:
+            with self.conn:
+                yield
+
+    def _current_data_version(self) -> int:
+        """SQLite's counter of commits made by other connections."""
+        return self.conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def is_stale(self) -> bool:
+        """Whether another connection committed since progress was loaded."""
+        return (
+            self._data_version is not None
+            and self._current_data_version() != self._data_version
+        )
+
+    def has_progress(self) -> bool:
+        """Whether the database has a row for the user."""
+        return self.conn.execute(
+            "SELECT 1 FROM users WHERE user_id = ?", (self.user_id,)
+        ).fetchone() is not None
+
+    def load(self) -> Optional[UserProgress]:
+        """Load progress for the user from the database."""
+        self._data_version = self._current_data_version()
+        row = self.conn.execute(
+            "SELECT created_at, last_updated, total_time_minutes "
+            "FROM users WHERE user_id = ?",
+            (self.user_id,),
+        ).fetchone()
+        if row is None:
+            return None
+
+        subjects = {}
+        for srow in self.conn.execute(
+            "SELECT subject_id, current_level, level_name, started_at, "
+            "last_activity, assessment_taken, assessment_level "
+            "FROM subjects WHERE user_id = ? ORDER BY rowid",
+            (self.user_id,),
+        ):
+            sid = srow[0]
+            projects = [
+                r[0] for r in self.conn.execute(
+                    "SELECT project_id FROM project_completions "
+                    "WHERE user_id = ? AND subject_id = ? "
+                    "GROUP BY project_id ORDER BY MIN(id)",
+                    (self.user_id, sid),
+                )
+            ]
+            concepts = [
+                r[0] for r in self.conn.execute(
+                    "SELECT concept_id FROM concept_completions "
+                    "WHERE user_id = ? AND subject_id = ? ORDER BY rowid",
+                    (self.user_id, sid),
+                )
+            ]
+            subjects[sid] = SubjectProgress(
+                subject_id=sid,
+                current_level=srow[1],
+                level_name=srow[2],
+                started_at=srow[3],
+                last_activity=srow[4],
+                completed_projects=projects,
+                concepts_completed=concepts,
+                assessment_taken=bool(srow[5]),
+                assessment_level=srow[6],
+            )
+
+        rows = self.conn.execute(
+            "SELECT project_id, completed_at, time_spent_minutes, notes, subject_id "
+            "FROM project_completions WHERE user_id = ? ORDER BY id",
+            (self.user_id,),
+        ).fetchall()
+        completions = CompletionLog(
+            stored=len(rows), decode=lambda i: ProjectCompletion(*rows[i])
+        )
+
+        # Databases written before the activity index get it rebuilt from
+        # the history, and stored in full on the next write
+        activity = self.get_activity()
+        self._activity_stored = activity is not None
+
+        return UserProgress(
+            user_id=self.user_id,
+            created_at=row[0],
+            last_updated=row[1],
+            subjects=subjects,
+            completed_projects=completions,
+            total_time_minutes=row[2],
+            activity=activity,
+        )
+
+    def save(self, progress: UserProgress):
+        """Replace all stored rows for the user with the given progress."""
+        uid = self.user_id
+        with self._transaction():
+            # Progress only lists completed concepts; keep their stored times
+            completed_at = {
+                (sid, cid): at for sid, cid, at in self.conn.execute(
+                    "SELECT subject_id, concept_id, completed_at "
+                    "FROM concept_completions WHERE user_id = ?",
+                    (uid,),
+                )
+            }
+            for table in ("users", "subjects", "concept_completions",
+                          "project_completions", "activity_days"):
+                self.conn.execute(f"DELETE FROM {table} WHERE user_id = ?", (uid,))
+
+            self.conn.execute(
+                "INSERT INTO users VALUES (?, ?, ?, ?)",
+                (uid, progress.created_at, progress.last_updated,
+                 progress.total_time_minutes),
+            )
+            for s in progress.subjects.values():
+                self.conn.execute(
+                    "INSERT INTO subjects VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (uid, s.subject_id, s.current_level, s.level_name,
+                     s.started_at, s.last_activity, int(s.assessment_taken),
+                     s.assessment_level),
+                )
+                self.conn.executemany(
+                    "INSERT OR IGNORE INTO concept_completions VALUES (?, ?, ?, ?)",
+                    [(uid, s.subject_id, cid,
+                      completed_at.get((s.subject_id, cid), s.last_activity))
+                     for cid in s.concepts_completed],
+                )
+
+            # Older completion records don't carry their subject, so recover
+            # it from the per-subject project lists where possible.
+            owner = {}
+            for s in progress.subjects.values():
+                for pid in s.completed_projects:
+                    owner.setdefault(pid, s.subject_id)
+            self.conn.executemany(
+                "INSERT INTO project_completions "
+                "(user_id, subject_id, project_id, completed_at, "
+                "time_spent_minutes, notes) VALUES (?, ?, ?, ?, ?, ?)",
+                [(uid, pc.subject_id or owner.get(pc.project_id), pc.project_id,
+                  pc.completed_at, pc.time_spent_minutes, pc.notes)
+                 for pc in progress.completed_projects],
+            )
+            self._write_summary_row(progress)
+            self._write_activity_rows(progress)
+
+    def append(self, event: dict, progress: UserProgress):
+        """Translate an event into row inserts and updates."""
+        with self._transaction():
+            self._apply_event(event)
+            self._write_summary_row(progress)
+            self._write_activity_rows(progress, [event])
+
+    def append_batch(self, events: list[dict], progress: UserProgress):
+        """Apply a batch of events in a single transaction."""
+        with self._transaction():
+            for event in events:
+                self._apply_event(event)
+            self._write_summary_row(progress)
+            self._write_activity_rows(progress, events)
+
+    def _write_activity_rows(self, progress: UserProgress, events: Optional[list[dict]] = None):
+        """Upsert the activity buckets touched by events (or all of them).
+
+        The totals come from the progress's in-memory index, which already
+        includes the events, so rewriting a day's row is idempotent.
+        """
+        if events is None or not self._activity_stored:
+            days = list(progress.activity.days)
+            self._activity_stored = True
+        else:
+            days = {d for d in (day_of(e["at"]) for e in events) if d in progress.activity.days}
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO activity_days VALUES (?, ?, ?, ?, ?)",
+            [(self.user_id, day.isoformat(), *progress.activity.days[day]) for day in days],
+        )
+
+    def _write_summary_row(self, progress: UserProgress):
+        """Upsert the user's summary counters inside the caller's transaction."""
+        self.conn.execute(
+            "INSERT OR REPLACE INTO user_summary VALUES (?, ?)",
+            (self.user_id, json.dumps(asdict(progress.counters))),
+        )
+
+    def write_summary(self, progress: UserProgress):
+        """Persist the user's summary counters."""
+        with self._transaction():
+            self._write_summary_row(progress)
+
+    def _apply_event(self, event: dict):
+        """Run the statements for one event inside the caller's transaction."""
+        uid = self.user_id
+        sid = event["subject_id"]
+        op = event["op"]
+        now = event["at"]
+
+        if op == "start_subject":
+            self.conn.execute(
+                "INSERT OR IGNORE INTO subjects "
+                "(user_id, subject_id, current_level, level_name, "
+                "started_at, last_activity) VALUES (?, ?, 0, ?, ?, ?)",
+                (uid, sid, event["level_name"], now, now),
+            )
+        elif op == "complete_concept":
+            self.conn.execute(
+                "INSERT OR IGNORE INTO concept_completions VALUES (?, ?, ?, ?)",
+                (uid, sid, event["concept_id"], now),
+            )
+            self._touch_subject(sid, now)
+        elif op == "complete_project":
+            self.conn.execute(
+                "INSERT INTO project_completions "
+                "(user_id, subject_id, project_id, completed_at, "
+                "time_spent_minutes, notes) VALUES (?, ?, ?, ?, ?, ?)",
+                (uid, sid, event["project_id"], now,
+                 event.get("time_spent"), event.get("notes")),
+            )
+            if event.get("time_spent"):
+                self.conn.execute(
+                    "UPDATE users SET total_time_minutes = total_time_minutes + ? "
+                    "WHERE user_id = ?",
+                    (event["time_spent"], uid),
+                )
+            if event.get("level") is not None:
+                self._raise_level(sid, event["level"], event["level_name"])
+            self._touch_subject(sid, now)
+        elif op == "record_assessment":
+            self.conn.execute(
+                "UPDATE subjects SET assessment_taken = 1, assessment_level = ? "
+                "WHERE user_id = ? AND subject_id = ?",
+                (event["level"], uid, sid),
+            )
+            self._raise_level(sid, event["level"], event["level_name"])
+
+        self.conn.execute(
+            "UPDATE users SET last_updated = MAX(last_updated, ?) WHERE user_id = ?",
+            (now, uid),
+        )
+
+    def _touch_subject(self, subject_id: str, now: str):
+        """Update a subject's last activity timestamp; imported events never move it back."""
+        self.conn.execute(
+            "UPDATE subjects SET last_activity = MAX(last_activity, ?) "
+            "WHERE user_id = ? AND subject_id = ?",
+            (now, self.user_id, subject_id),
+        )
+
+    def _raise_level(self, subject_id: str, level: int, level_name: str):
+        """Set a subject's level if it is higher than the current one."""
+        self.conn.execute(
+            "UPDATE subjects SET current_level = ?, level_name = ? "
+            "WHERE user_id = ? AND subject_id = ? AND current_level < ?",
+            (level, level_name, self.user_id, subject_id, level),
+        )
+
+    def get_counters(self) -> Optional[SummaryCounters]:
+        """Read the stored summary counters; None for databases that predate them."""
+        row = self.conn.execute(
+            "SELECT counters FROM user_summary WHERE user_id = ?", (self.user_id,)
+        ).fetchone()
+        return SummaryCounters(**json.loads(row[0])) if row is not None else None
+
+    def get_summary(self) -> Optional[dict]:
+        """Read the stored summary counters, or compute them for older databases."""
+        counters = self.get_counters()
+        if counters is not None:
+            return counters.to_summary()
+        return self.count_summary()
+
+    def get_activity(self) -> Optional[ActivityIndex]:
+        """Read the activity index from its table, one row per active day."""
+        rows = self.conn.execute(
+            "SELECT day, projects, concepts, minutes FROM activity_days WHERE user_id = ?",
+            (self.user_id,),
+        ).fetchall()
+        if not rows:
+            return None
+        return ActivityIndex({r[0]: list(r[1:]) for r in rows})
+
+    def count_summary(self) -> Optional[dict]:
+        """Compute the progress summary with aggregate queries."""
+        uid = self.user_id
+        user = self.conn.execute(
+            "SELECT last_updated, total_time_minutes FROM users WHERE user_id = ?",
+            (uid,),
+        ).fetchone()
+        if user is None:
+            return None
+
+        started, novice, competent, proficient, expert = self.conn.execute(
+            "SELECT COUNT(*), "
+            "COALESCE(SUM(current_level <= 1), 0), "
+            "COALESCE(SUM(current_level BETWEEN 2 AND 3), 0), "
+            "COALESCE(SUM(current_level BETWEEN 4 AND 5), 0), "
+            "COALESCE(SUM(current_level > 5), 0) "
+            "FROM subjects WHERE user_id = ?",
+            (uid,),
+        ).fetchone()
+        (projects,) = self.conn.execute(
+            "SELECT COUNT(*) FROM project_completions WHERE user_id = ?", (uid,)
+        ).fetchone()
+        (concepts,) = self.conn.execute(
+            "SELECT COUNT(*) FROM concept_completions WHERE user_id = ?", (uid,)
+        ).fetchone()
+
+        return {
+            "subjects_started": started,
+            "total_projects_completed": projects,
+            "total_concepts_learned": concepts,
+            "total_time_hours": round(user[1] / 60, 1),
+            "bands": {
+                "Novice": novice,
+                "Competent": competent,
+                "Proficient": proficient,
+                "Expert": expert,
+            },
+            "last_activity": user[0],
+        }
+
+    def get_subject_list(self) -> Optional[list[dict]]:
+        """Compute per-subject summaries with aggregate queries."""
+        uid = self.user_id
+        if self.conn.execute(
+            "SELECT 1 FROM users WHERE user_id = ?", (uid,)
+        ).fetchone() is None:
+            return None
+
+        rows = self.conn.execute(
+            "SELECT s.subject_id, s.current_level, s.level_name, "
+            "(SELECT COUNT(DISTINCT p.project_id) FROM project_completions p "
+            " WHERE p.user_id = s.user_id AND p.subject_id = s.subject_id), "
+            "(SELECT COUNT(*) FROM concept_completions c "
+            " WHERE c.user_id = s.user_id AND c.subject_id = s.subject_id), "
+            "s.last_activity "
+            "FROM subjects s WHERE s.user_id = ? ORDER BY s.rowid",
+            (uid,),
+        )
+        return [
+            {
+                "subject_id": r[0],
+                "current_level": r[1],
+                "level_name": r[2],
+                "projects_completed": r[3],
+                "concepts_completed": r[4],
+                "last_activity": r[5],
+            }
+            for r in rows
+        ]
+
+    def history(self) -> ProjectHistory:
+        """Query the project history with SQL, one page at a time."""
+        return SQLiteProjectHistory(self.conn, self.user_id)
+
+    def close(self):
+        """Close the database connection."""
+        self.conn.close()
+
+
+class SQLiteProjectHistory(ProjectHistory):
+    """Project history view answered by queries against project_completions."""
+
+    def __init__(self, conn: sqlite3.Connection, user_id: str, **criteria):
+        super().__init__((), **criteria)
+        self.conn = conn
+        self.user_id = user_id
+
+    def _where(self) -> tuple[str, list]:
+        """Build the WHERE clause for the view's filters."""
+        clauses = ["user_id = ?"]
+        params = [self.user_id]
+        if self.subject_id is not None:
+            clauses.append("subject_id = ?")
+            params.append(self.subject_id)
+        if self.since is not None:
+            clauses.append("completed_at >= ?")
+            params.append(self.since)
+        if self.until is not None:
+            clauses.append("completed_at < ?")
+            params.append(self.until)
+        return " AND ".join(clauses), params
+
+    def count(self) -> int:
+        """Count matching completions with COUNT(*)."""
+        where, params = self._where()
+        (count,) = self.conn.execute(
+            f"SELECT COUNT(*) FROM project_completions WHERE {where}", params
+        ).fetchone()
+        return count
+
+    def page(self, number: int, size: int = 20) -> list[ProjectCompletion]:
+        """Fetch one page of matching completions, newest first."""
+        where, params = self._where()
+        rows = self.conn.execute(
+            "SELECT project_id, completed_at, time_spent_minutes, notes, subject_id "
+            f"FROM project_completions WHERE {where} ORDER BY id DESC LIMIT ? OFFSET ?",
+            params + [size, number * size],
+        )
+        return [ProjectCompletion(*row) for row in rows]
+
+    def __iter__(self):
+        where, params = self._where()
+        cursor = self.conn.execute(
+            "SELECT project_id, completed_at, time_spent_minutes, notes, subject_id "
+            f"FROM project_completions WHERE {where} ORDER BY id DESC",
+            params,
+        )
+        for row in cursor:
+            yield ProjectCompletion(*row)
+
+
+BACKENDS = {
+    "json": JsonProgressStore,
+    "binary": BinaryProgressStore,
+    "sqlite": SQLiteProgressStore,
+}
+
+
+def open_store(
+    data_dir: Path,
+    user_id: str = "default",
+    backend: Optional[str] = None,
+) -> ProgressStore:
+    """Open the storage backend for a data directory.
+
+    Args:
+        data_dir: Directory holding the progress data
+        user_id: User whose progress is stored
+        backend: Backend name ("json", "binary" or "sqlite"). When omitted,
+            the backend whose files the directory already contains is used,
+            defaulting to JSON for a new directory.
+
+    Returns:
+        An open ProgressStore
+    """
+    if backend is None:
+        backend = "json"
+        for name, path in (("sqlite", "progress.db"), ("binary", "progress.bin")):
+            if (Path(data_dir) / path).exists():
+                backend = name
+                break
+
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown storage backend: {backend}")
+
+    return BACKENDS[backend](data_dir, user_id)
@@ -1,118 +1,225 @@
 """Progress tracking for the Maker Learning Platform.
 
 This module manages user progress through subjects and projects,
-storing data locally as JSON.
+storing data locally through a pluggable backend (see ``storage``).
+
+Every mutation is expressed as a small event that is applied to the
+in-memory progress and handed to the store, which persists it without
+rewriting the learner's whole history. Inside ``tracker.batch()`` events
+are held back and persisted together when the block exits.
 """
 
-import json
-from dataclasses import dataclass, asdict
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
-
-
-@dataclass
-class ProjectCompletion:
-    """Record of a completed project."""
-    project_id: str
-    completed_at: str
-    time_spent_minutes: Optional[int] = None
-    notes: Optional[str] = None
-
-
-@dataclass
-class SubjectProgress:
-    """Progress within a single subject."""
-    subject_id: str
-    current_level: int
-    level_name: str
-    started_at: str
-    last_activity: str
-    completed_projects: list[str]
-    concepts_completed: list[int]
-    assessment_taken: bool = False
-    assessment_level: Optional[int] = None
-
-
-@dataclass
-class UserProgress:
-    """Complete progress for a user."""
-    user_id: str
-    created_at: str
-    last_updated: str
-    subjects: dict[str, SubjectProgress]
-    completed_projects: list[ProjectCompletion]
-    total_time_minutes: int = 0
+from typing import Iterable, Iterator, Optional, Union
+
+from .activity import ActivityIndex
+from .history import DateBound, ProjectHistory
+from .models import (
+    ProjectCompletion,
+    SubjectProgress,
+    SummaryCounters,
+    UserProgress,
+    band_for_level,
+    count_progress,
+    new_progress,
+)
+from .storage import ProgressStore, open_store
 
 
 class ProgressTracker:
     """Tracks user progress through the Maker Learning Platform."""
 
-    def __init__(self, data_dir: str = ".maker-data"):
+    def __init__(
+        self,
+        data_dir: str = ".maker-data",
+        user_id: str = "default",
+        backend: Union[str, ProgressStore, None] = None,
+    ):
+        """Create a tracker.
+
+        Args:
+            data_dir: Directory holding progress data
+            user_id: User whose progress is tracked
+            backend: Storage backend name ("json", "binary" or "sqlite") or a store
+                instance. Defaults to whatever the data directory already uses.
+        """
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(exist_ok=True)
-        self.progress_file = self.data_dir / "progress.json"
-        self.progress: Optional[UserProgress] = None
-        self._load_progress()
+        self.user_id = user_id
+        if isinstance(backend, ProgressStore):
+            self.store = backend
+        else:
+            self.store = open_store(self.data_dir, user_id, backend)
+        self._progress: Optional[UserProgress] = None
+        self._pending: Optional[list[dict]] = None
+
+    @classmethod
+    def for_user(
+        cls,
+        user_id: str,
+        data_dir: str = ".maker-data",
+        backend: Optional[str] = None,
+    ) -> "ProgressTracker":
+        """Create a tracker for one learner on a shared data directory.
+
+        The user is registered and their progress kept in their own shard
+        under ``<data_dir>/users`` (see ``registry.UserRegistry``).
+        """
+        from .registry import UserRegistry
+
+        return UserRegistry(data_dir).tracker(user_id, backend)
+
+    @property
+    def progress(self) -> UserProgress:
+        """The user's progress, loaded from the store on first access."""
+        if self._progress is None:
+            self._load_progress()
+        return self._progress
 
     def _load_progress(self):
-        """Load progress from file or create new."""
-        if self.progress_file.exists():
-            try:
-                data = json.loads(self.progress_file.read_text())
-                self.progress = self._dict_to_progress(data)
-            except Exception as e:
-                print(f"Error loading progress: {e}")
-                self.progress = None
-
-        if not self.progress:
-            self.progress = UserProgress(
-                user_id="default",
-                created_at=datetime.now().isoformat(),
-                last_updated=datetime.now().isoformat(),
-                subjects={},
-                completed_projects=[],
-            )
-            self._save_progress()
-
-    def _dict_to_progress(self, data: dict) -> UserProgress:
-        """Convert dictionary to UserProgress object."""
-        subjects = {}
-        for sid, sdata in data.get("subjects", {}).items():
-            subjects[sid] = SubjectProgress(**sdata)
-
-        projects = []
-        for pdata in data.get("completed_projects", []):
-            projects.append(ProjectCompletion(**pdata))
-
-        return UserProgress(
-            user_id=data.get("user_id", "default"),
-            created_at=data.get("created_at", datetime.now().isoformat()),
-            last_updated=data.get("last_updated", datetime.now().isoformat()),
-            subjects=subjects,
-            completed_projects=projects,
-            total_time_minutes=data.get("total_time_minutes", 0),
-        )
-
-    def _save_progress(self):
-        """Save progress to file."""
-        if not self.progress:
+        """Load progress from the store and replay pending events, or create new.
+
+        Unreadable stored progress raises ProgressStoreError instead of
+        being replaced with an empty history.
+        """
+        with self.store.lock():
+            self._progress = self.store.load()
+            if self._progress is None:
+                with self.store.lock(exclusive=True):
+                    self._progress = self.store.load()
+                    if self._progress is None:
+                        self._progress = new_progress(self.user_id)
+                        self.store.save(self._progress)
+
+            for event in self.store.replay():
+                self._apply_event(event)
+
+    def _persist(self, events: list[dict]):
+        """Write events that were already applied in memory.
+
+        If another process wrote since progress was loaded, progress is
+        reloaded and the events re-applied on top before writing, so
+        neither process's changes are lost.
+        """
+        with self.store.lock(exclusive=True):
+            if self.store.is_stale():
+                self._load_progress()
+                for event in events:
+                    self._apply_event(event)
+            if len(events) == 1:
+                self.store.append(events[0], self.progress)
+            else:
+                self.store.append_batch(events, self.progress)
+
+    def _record(self, op: str, at: Optional[str] = None, **fields):
+        """Apply a mutation and persist it as an event (or queue it in a batch)."""
+        event = {"op": op, "at": at or datetime.now().isoformat()}
+        event.update(fields)
+        self._apply_event(event)
+        if self._pending is not None:
+            self._pending.append(event)
+        else:
+            self._persist([event])
+
+    @contextmanager
+    def batch(self) -> Iterator["ProgressTracker"]:
+        """Group mutations into a single durable write.
+
+        Mutations inside the block update progress immediately but are only
+        persisted when the block exits. If the block raises, nothing is
+        written and in-memory progress is reloaded from the store. Nested
+        batches join the outermost one.
+
+        Example:
+            with tracker.batch():
+                for concept_id in imported:
+                    tracker.complete_concept("python", concept_id)
+        """
+        if self._pending is not None:
+            yield self
             return
 
-        data = {
-            "user_id": self.progress.user_id,
-            "created_at": self.progress.created_at,
-            "last_updated": datetime.now().isoformat(),
-            "subjects": {
-                sid: asdict(sp) for sid, sp in self.progress.subjects.items()
-            },
-            "completed_projects": [
-                asdict(pc) for pc in self.progress.completed_projects
-            ],
-            "total_time_minutes": self.progress.total_time_minutes,
-        }
-
-        self.progress_file.write_text(json.dumps(data, indent=2))
+        # Load before queueing so replay can't interleave
+        if self._progress is None:
+            self._load_progress()
+        self._pending = []
+        try:
+            yield self
+            events, self._pending = self._pending, None
+            if events:
+                self._persist(events)
+        except BaseException:
+            self._pending = None
+            self._progress = None
+            raise
+
+    def _apply_event(self, event: dict):
+        """Apply an event to the in-memory progress, its counters and activity index."""
+        op = event["op"]
+        now = event["at"]
+        subject = self.progress.subjects.get(event["subject_id"])
+        counters = self.progress.counters
+        activity = self.progress.activity
+
+        if op == "start_subject":
+            if subject is None:
+                counters.subjects_started += 1
+                counters.bands[band_for_level(0)] += 1
+                self.progress.subjects[event["subject_id"]] = SubjectProgress(
+                    subject_id=event["subject_id"],
+                    current_level=0,
+                    level_name=event["level_name"],
+                    started_at=now,
+                    last_activity=now,
+                    completed_projects=[],
+                    concepts_completed=[],
+                )
+        elif subject is None:
+            return
+        elif op == "complete_concept":
+            if subject.concepts_completed.add(event["concept_id"]):
+                counters.concepts_learned += 1
+                activity.record(now, concepts=1)
+            subject.last_activity = max(subject.last_activity, now)
+        elif op == "complete_project":
+            subject.completed_projects.add(event["project_id"])
+            counters.projects_completed += 1
+
+            self.progress.completed_projects.append(ProjectCompletion(
+                project_id=event["project_id"],
+                completed_at=now,
+                time_spent_minutes=event.get("time_spent"),
+                notes=event.get("notes"),
+                subject_id=event["subject_id"],
+            ))
+
+            if event.get("time_spent"):
+                self.progress.total_time_minutes += event["time_spent"]
+                counters.time_minutes += event["time_spent"]
+            activity.record(now, projects=1, minutes=event.get("time_spent") or 0)
+
+            if event.get("level") is not None and event["level"] > subject.current_level:
+                counters.move_band(subject.current_level, event["level"])
+                subject.current_level = event["level"]
+                subject.level_name = event["level_name"]
+
+            subject.last_activity = max(subject.last_activity, now)
+        elif op == "record_assessment":
+            subject.assessment_taken = True
+            subject.assessment_level = event["level"]
+
+            # Set current level to assessed level if higher
+            if event["level"] > subject.current_level:
+                counters.move_band(subject.current_level, event["level"])
+                subject.current_level = event["level"]
+                subject.level_name = event["level_name"]
+
+        # Imported history carries its own (older) timestamps; never move back
+        self.progress.last_updated = max(self.progress.last_updated, now)
+        counters.last_activity = max(counters.last_activity or "", now)
+        activity.record(now)
 
     def start_subject(self, subject_id: str, level_names: dict[int, str]) -> SubjectProgress:
         """Start tracking a new subject.
@@ -125,17 +232,11 @@ class ProgressTracker:
             SubjectProgress for the subject
         """
         if subject_id not in self.progress.subjects:
-            now = datetime.now().isoformat()
-            self.progress.subjects[subject_id] = SubjectProgress(
+            self._record(
+                "start_subject",
                 subject_id=subject_id,
-                current_level=0,
                 level_name=level_names.get(0, "Curious"),
-                started_at=now,
-                last_activity=now,
-                completed_projects=[],
-                concepts_completed=[],
             )
-            self._save_progress()
 
         return self.progress.subjects[subject_id]
 
@@ -153,9 +254,86 @@ class ProgressTracker:
         if subject_id in self.progress.subjects:
             subject = self.progress.subjects[subject_id]
             if concept_id not in subject.concepts_completed:
-                subject.concepts_completed.append(concept_id)
-                subject.last_activity = datetime.now().isoformat()
-                self._save_progress()
+                self._record(
+                    "complete_concept",
+                    subject_id=subject_id,
+                    concept_id=concept_id,
+                )
+
+    def complete_concepts(self, subject_id: str, concept_ids: Iterable[int]) -> int:
+        """Mark many concepts as completed with a single write.
+
+        Args:
+            subject_id: ID of the subject
+            concept_ids: IDs of the concepts
+
+        Returns:
+            Number of concepts that were newly completed
+        """
+        subject = self.progress.subjects.get(subject_id)
+        if subject is None:
+            return 0
+
+        before = len(subject.concepts_completed)
+        with self.batch():
+            for concept_id in concept_ids:
+                self.complete_concept(subject_id, concept_id)
+        return len(subject.concepts_completed) - before
+
+    def import_completions(
+        self,
+        records: Iterable[dict],
+        level_names: Optional[dict[int, str]] = None,
+    ) -> int:
+        """Import concept and project completions with a single write.
+
+        Each record has a ``subject_id`` and either a ``concept_id`` or a
+        ``project_id``. Project records may also carry ``time_spent``,
+        ``notes`` and ``level``. An optional ``completed_at`` timestamp is
+        kept as the completion time. Subjects not yet started are started.
+
+        Args:
+            records: Completion records to import
+            level_names: Mapping of level numbers to names
+
+        Returns:
+            Number of records that changed progress
+        """
+        level_names = level_names or {}
+        imported = 0
+        with self.batch():
+            for record in records:
+                subject_id = record["subject_id"]
+                at = record.get("completed_at")
+                if subject_id not in self.progress.subjects:
+                    self._record(
+                        "start_subject",
+                        at=at,
+                        subject_id=subject_id,
+                        level_name=level_names.get(0, "Curious"),
+                    )
+                subject = self.progress.subjects[subject_id]
+
+                if "concept_id" in record:
+                    if record["concept_id"] in subject.concepts_completed:
+                        continue
+                    self._record(
+                        "complete_concept",
+                        at=at,
+                        subject_id=subject_id,
+                        concept_id=record["concept_id"],
+                    )
+                else:
+                    self._record("complete_project", at=at, **self._project_fields(
+                        subject_id,
+                        record["project_id"],
+                        level_names,
+                        record.get("level"),
+                        record.get("time_spent"),
+                        record.get("notes"),
+                    ))
+                imported += 1
+        return imported
 
     def complete_project(
         self,
@@ -179,31 +357,29 @@ class ProgressTracker:
         if subject_id not in self.progress.subjects:
             return
 
-        subject = self.progress.subjects[subject_id]
-        now = datetime.now().isoformat()
-
-        # Record the completion
-        if project_id not in subject.completed_projects:
-            subject.completed_projects.append(project_id)
-
-        completion = ProjectCompletion(
-            project_id=project_id,
-            completed_at=now,
-            time_spent_minutes=time_spent,
-            notes=notes,
-        )
-        self.progress.completed_projects.append(completion)
-
-        if time_spent:
-            self.progress.total_time_minutes += time_spent
-
-        # Level up if specified
-        if new_level is not None and new_level > subject.current_level:
-            subject.current_level = new_level
-            subject.level_name = level_names.get(new_level, f"Level {new_level}")
+        self._record("complete_project", **self._project_fields(
+            subject_id, project_id, level_names, new_level, time_spent, notes
+        ))
 
-        subject.last_activity = now
-        self._save_progress()
+    @staticmethod
+    def _project_fields(
+        subject_id: str,
+        project_id: str,
+        level_names: dict[int, str],
+        new_level: Optional[int],
+        time_spent: Optional[int],
+        notes: Optional[str],
+    ) -> dict:
+        """Build the fields of a complete_project event."""
+        fields = {"subject_id": subject_id, "project_id": project_id}
+        if time_spent is not None:
+            fields["time_spent"] = time_spent
+        if notes is not None:
+            fields["notes"] = notes
+        if new_level is not None:
+            fields["level"] = new_level
+            fields["level_name"] = level_names.get(new_level, f"Level {new_level}")
+        return fields
 
     def record_assessment(
         self,
@@ -219,53 +395,57 @@ class ProgressTracker:
             level_names: Mapping of level numbers to names
         """
         if subject_id in self.progress.subjects:
-            subject = self.progress.subjects[subject_id]
-            subject.assessment_taken = True
-            subject.assessment_level = assessed_level
-
-            # Set current level to assessed level if higher
-            if assessed_level > subject.current_level:
-                subject.current_level = assessed_level
-                subject.level_name = level_names.get(
-                    assessed_level, f"Level {assessed_level}"
-                )
+            self._record(
+                "record_assessment",
+                subject_id=subject_id,
+                level=assessed_level,
+                level_name=level_names.get(assessed_level, f"Level {assessed_level}"),
+            )
 
-            self._save_progress()
+    def get_counters(self) -> SummaryCounters:
+        """Get the summary counters, read from the store when it keeps them."""
+        counters = self.store.get_counters()
+        if counters is not None:
+            return counters
+        return self.progress.counters
 
     def get_summary(self) -> dict:
         """Get a summary of overall progress.
 
+        Reads the counters the store keeps up to date on every write, so
+        the cost doesn't depend on the size of the history.
+
         Returns:
             Dictionary with progress summary
         """
-        subjects_started = len(self.progress.subjects)
-        total_projects = len(self.progress.completed_projects)
-        total_concepts = sum(
-            len(s.concepts_completed)
-            for s in self.progress.subjects.values()
-        )
-
-        # Count by band
-        bands = {"Novice": 0, "Competent": 0, "Proficient": 0, "Expert": 0}
-        for subject in self.progress.subjects.values():
-            level = subject.current_level
-            if level <= 1:
-                bands["Novice"] += 1
-            elif level <= 3:
-                bands["Competent"] += 1
-            elif level <= 5:
-                bands["Proficient"] += 1
-            else:
-                bands["Expert"] += 1
+        summary = self.store.get_summary()
+        if summary is not None:
+            return summary
+        return self.progress.counters.to_summary()
+
+    def verify_summary(self, repair: bool = True) -> dict[str, tuple]:
+        """Check the stored summary counters against a full recount.
 
-        return {
-            "subjects_started": subjects_started,
-            "total_projects_completed": total_projects,
-            "total_concepts_learned": total_concepts,
-            "total_time_hours": round(self.progress.total_time_minutes / 60, 1),
-            "bands": bands,
-            "last_activity": self.progress.last_updated,
-        }
+        Args:
+            repair: Rewrite the stored counters if they disagree
+
+        Returns:
+            Mapping of each mismatched summary field to (stored, recounted)
+        """
+        with self.store.lock(exclusive=repair):
+            self._load_progress()
+            actual = count_progress(self.progress)
+            stored = self.store.get_summary() or self.progress.counters.to_summary()
+            expected = actual.to_summary()
+            mismatches = {
+                key: (stored.get(key), value)
+                for key, value in expected.items()
+                if stored.get(key) != value
+            }
+            self.progress.counters = actual
+            if mismatches and repair:
+                self.store.write_summary(self.progress)
+        return mismatches
 
     def get_subject_list(self) -> list[dict]:
         """Get list of all subjects with progress.
@@ -273,6 +453,10 @@ class ProgressTracker:
         Returns:
             List of subject progress summaries
         """
+        subjects = self.store.get_subject_list()
+        if subjects is not None:
+            return subjects
+
         return [
             {
                 "subject_id": s.subject_id,
@@ -284,3 +468,41 @@ class ProgressTracker:
             }
             for s in self.progress.subjects.values()
         ]
+
+    def history(
+        self,
+        subject_id: Optional[str] = None,
+        since: DateBound = None,
+        until: DateBound = None,
+    ) -> ProjectHistory:
+        """Get the project completion history, newest first.
+
+        The view counts, filters and pages without decoding the whole
+        history; on SQLite it is answered by queries.
+
+        Args:
+            subject_id: Only include completions in this subject
+            since: Only include completions at or after this time
+            until: Only include completions before this time
+
+        Returns:
+            A ProjectHistory view
+        """
+        view = self.store.history() if self._pending is None else None
+        if view is None:
+            view = ProjectHistory(self.progress.completed_projects)
+        return view.filter(subject_id, since, until)
+
+    def activity(self) -> ActivityIndex:
+        """Get the daily and weekly activity index.
+
+        Reads the index the store keeps up to date on every write when it
+        can, so the full history isn't loaded.
+
+        Returns:
+            The user's ActivityIndex
+        """
+        index = self.store.get_activity() if self._pending is None else None
+        if index is None:
+            index = self.progress.activity
+        return index
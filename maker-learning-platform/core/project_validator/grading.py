@@ -0,0 +1,269 @@
+"""Batch grading of many project submissions.
+
+``grade_submissions`` validates a cohort's project directories against
+one set of checks in parallel worker processes. Each worker compiles the
+checks once when it starts and then grades submissions until the batch
+is done; results are yielded in completion order so a caller can report
+progress and write a report as it goes.
+
+A submission that runs past its timeout is stopped and reported as
+timed out, so one pathological file can't stall the batch. Workers
+interrupt themselves with SIGALRM where it exists; as a backstop the
+parent kills a worker that still hasn't answered shortly after the
+timeout and carries on with a fresh one.
+"""
+
+import csv
+import json
+import os
+import signal
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+from .validator import CompiledCheck, compile_checks, validate_project
+
+# Extra time the parent allows past a submission's timeout before it
+# kills the worker; covers worker start-up and the worker's own timeout
+_KILL_GRACE = 2.0
+
+# Checks compiled once per worker process by _init_worker
+_plan: tuple[CompiledCheck, ...] = ()
+
+
+@dataclass
+class CheckOutcome:
+    """The result of one check on one submission."""
+
+    check: str
+    passed: bool
+    message: str
+    details: Optional[str] = None
+
+
+@dataclass
+class SubmissionResult:
+    """The outcome of grading one submission."""
+
+    submission: str
+    checks: list[CheckOutcome] = field(default_factory=list)
+    # Why the submission couldn't be graded (timeout, crash), if it wasn't
+    error: Optional[str] = None
+    seconds: float = 0.0
+
+    @property
+    def passed(self) -> int:
+        """Number of checks passed."""
+        return sum(1 for c in self.checks if c.passed)
+
+    def to_dict(self) -> dict:
+        """Convert to a JSON-serializable dictionary."""
+        data = asdict(self)
+        data["passed"] = self.passed
+        return data
+
+
+class _Timeout(BaseException):
+    """Raised inside a worker when a submission runs out of time.
+
+    A BaseException, so the checks' own error handling can't swallow it.
+    """
+
+
+def _raise_timeout(signum, frame):
+    raise _Timeout()
+
+
+def _init_worker(checks: list[dict]):
+    """Compile the checks once for this worker process."""
+    global _plan
+    _plan = compile_checks(checks)
+    if hasattr(signal, "SIGALRM"):
+        signal.signal(signal.SIGALRM, _raise_timeout)
+
+
+def _grade(submission: str, timeout: float) -> SubmissionResult:
+    """Grade one submission with the worker's compiled checks."""
+    start = time.perf_counter()
+    alarm = hasattr(signal, "SIGALRM") and timeout > 0
+    if alarm:
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        results = validate_project(submission, _plan)
+    except _Timeout:
+        return SubmissionResult(
+            submission,
+            error=f"Timed out after {timeout:g}s",
+            seconds=time.perf_counter() - start,
+        )
+    finally:
+        if alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+    return SubmissionResult(
+        submission,
+        [
+            CheckOutcome(check.source, r.passed, r.message, r.details)
+            for check, r in zip(_plan, results)
+        ],
+        seconds=time.perf_counter() - start,
+    )
+
+
+def _kill_workers(pool: ProcessPoolExecutor):
+    """Stop a pool whose workers may be stuck, without waiting for them."""
+    # The executor has no public way to stop running tasks
+    for process in list((pool._processes or {}).values()):
+        process.kill()
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def grade_submissions(
+    checks: list[dict],
+    submissions: Iterable[str],
+    workers: Optional[int] = None,
+    timeout: float = 30.0,
+) -> Iterator[SubmissionResult]:
+    """Grade project directories in parallel, yielding results as they finish.
+
+    Args:
+        checks: Check configurations (see validate_project); compiled once
+            in each worker
+        submissions: Project directories to grade
+        workers: Number of worker processes (defaults to the CPU count)
+        timeout: Seconds each submission may take; 0 for no limit
+
+    Yields:
+        One SubmissionResult per submission, in completion order
+    """
+    workers = workers or os.cpu_count() or 1
+    queue = list(submissions)
+    queue.reverse()
+    # Only as many submissions as there are workers are in flight, so a
+    # submission starts (nearly) when it is submitted and its deadline
+    # can be tracked from here
+    running: dict[Future, tuple[str, float]] = {}
+    pool = None
+
+    try:
+        while queue or running:
+            if pool is None:
+                pool = ProcessPoolExecutor(
+                    max_workers=min(workers, len(queue) + len(running)),
+                    initializer=_init_worker,
+                    initargs=(checks,),
+                )
+                # Resubmit anything that was in flight on a killed pool
+                requeue = [submission for submission, _ in running.values()]
+                running.clear()
+                queue.extend(reversed(requeue))
+
+            while queue and len(running) < workers:
+                submission = queue.pop()
+                future = pool.submit(_grade, submission, timeout)
+                running[future] = (submission, time.monotonic())
+
+            wait_for = None
+            if timeout > 0:
+                oldest = min(started for _, started in running.values())
+                wait_for = max(0.0, oldest + timeout + _KILL_GRACE - time.monotonic())
+            done, _ = wait(running, timeout=wait_for, return_when=FIRST_COMPLETED)
+
+            broken = False
+            for future in done:
+                submission, started = running.pop(future)
+                try:
+                    yield future.result()
+                except Exception as e:
+                    # A worker that dies (e.g. killed for memory) breaks
+                    # the whole pool; start a new one for the rest
+                    broken = broken or isinstance(e, BrokenProcessPool)
+                    yield SubmissionResult(
+                        submission,
+                        error=f"Grading failed: {e}",
+                        seconds=time.monotonic() - started,
+                    )
+            if broken:
+                pool.shutdown(wait=False)
+                pool = None
+
+            if done or timeout <= 0:
+                continue
+
+            # Nothing finished in time: a worker is stuck where it can't be
+            # interrupted. Kill the pool, fail the overdue submissions and
+            # restart the others on a fresh pool.
+            now = time.monotonic()
+            _kill_workers(pool)
+            pool = None
+            for future, (submission, started) in list(running.items()):
+                if now - started >= timeout:
+                    del running[future]
+                    yield SubmissionResult(
+                        submission,
+                        error=f"Timed out after {timeout:g}s",
+                        seconds=now - started,
+                    )
+    finally:
+        if pool is not None:
+            if running:
+                _kill_workers(pool)
+            else:
+                pool.shutdown()
+
+
+class GradeReport:
+    """Writes grading results to a JSONL or CSV file as they arrive.
+
+    JSONL holds one full SubmissionResult per line. CSV holds one row per
+    submission with its score, any error, and a pass/fail column per
+    check, for importing into a gradebook.
+    """
+
+    def __init__(self, path: str, plan: tuple[CompiledCheck, ...], format: Optional[str] = None):
+        """Open a report.
+
+        Args:
+            path: File to write
+            plan: The compiled checks, which name the CSV columns
+            format: "jsonl" or "csv"; defaults to the file extension
+        """
+        self.format = format or ("csv" if Path(path).suffix.lower() == ".csv" else "jsonl")
+        self._file = open(path, "w", encoding="utf-8", newline="")
+        self._csv = None
+        if self.format == "csv":
+            self._csv = csv.writer(self._file)
+            self._csv.writerow(
+                ["submission", "passed", "total", "error", "seconds"]
+                + [check.source for check in plan]
+            )
+        self._total = len(plan)
+
+    def write(self, result: SubmissionResult):
+        """Append one submission's result."""
+        if self._csv is None:
+            self._file.write(json.dumps(result.to_dict()) + "\n")
+        else:
+            self._csv.writerow(
+                [
+                    result.submission,
+                    result.passed,
+                    self._total,
+                    result.error or "",
+                    f"{result.seconds:.3f}",
+                ]
+                + ["pass" if c.passed else "fail" for c in result.checks]
+            )
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self) -> "GradeReport":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
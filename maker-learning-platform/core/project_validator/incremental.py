@@ -0,0 +1,139 @@
+"""Incremental re-validation for the Maker Learning Platform.
+
+Keeps the result of every check together with a fingerprint of the
+files it read, so re-validating after an edit only re-runs the checks
+whose inputs actually changed.
+"""
+
+import hashlib
+import os
+from pathlib import Path
+from typing import Optional, Union
+
+from .python_index import SKIP_DIRS
+from .validator import (
+    CompiledCheck,
+    ProjectValidator,
+    ValidationResult,
+    compile_checks,
+)
+
+# (size, mtime_ns, content hash) of a file, or None if it doesn't exist
+Fingerprint = Optional[tuple[int, int, str]]
+
+
+def _hash_path(path: Path) -> str:
+    """Hash a file's contents, or the names, sizes and mtimes of a directory's files.
+
+    Directories are hashed recursively (skipping hidden and environment
+    directories), since checks like class_exists read every file inside.
+    """
+    digest = hashlib.sha1()
+    if path.is_dir():
+        for root, dirs, files in os.walk(path):
+            dirs[:] = sorted(d for d in dirs if not d.startswith(".") and d not in SKIP_DIRS)
+            rel = Path(root).relative_to(path).as_posix()
+            for name in sorted(files):
+                st = os.stat(os.path.join(root, name))
+                entry = f"{rel}/{name}\0{st.st_size}\0{st.st_mtime_ns}\0"
+                digest.update(entry.encode("utf-8", "surrogateescape"))
+            for name in dirs:
+                digest.update(f"{rel}/{name}/\0".encode("utf-8", "surrogateescape"))
+    else:
+        with path.open("rb") as f:
+            for chunk in iter(lambda: f.read(1 << 16), b""):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _touches(inputs: tuple[str, ...], changed: set[str]) -> bool:
+    """Whether any changed path is, contains, or lies inside one of the inputs."""
+    for path in inputs:
+        path = path.strip("/")
+        if path in ("", "."):
+            # The whole project
+            if changed:
+                return True
+            continue
+        for other in changed:
+            if other == path or other.startswith(path + "/") or path.startswith(other + "/"):
+                return True
+    return False
+
+
+class IncrementalValidator:
+    """Validates a project, reusing results for checks whose inputs are unchanged.
+
+    Results are keyed on the check and the (size, mtime_ns, content hash)
+    of each input path. Content is only re-hashed when size or mtime
+    moves, so an untouched file costs one stat per run. Directory inputs
+    are re-hashed from the stats of the files inside on every run.
+    """
+
+    def __init__(
+        self,
+        project_path: str,
+        checks: Union[list[dict], tuple[CompiledCheck, ...]],
+    ):
+        self.project_path = Path(project_path)
+        if checks and isinstance(checks[0], dict):
+            checks = compile_checks(checks)
+        self.plan: tuple[CompiledCheck, ...] = tuple(checks)
+        self._results: dict[CompiledCheck, tuple[tuple, ValidationResult]] = {}
+        self._hashes: dict[str, tuple[int, int, str]] = {}
+
+    def _fingerprint(self, relpath: str) -> Fingerprint:
+        """Return the current fingerprint of a project path."""
+        path = self.project_path / relpath
+        try:
+            st = path.stat()
+        except OSError:
+            self._hashes.pop(relpath, None)
+            return None
+
+        # A directory's own mtime doesn't move when a file inside changes
+        known = self._hashes.get(relpath)
+        if known and known[:2] == (st.st_size, st.st_mtime_ns) and not path.is_dir():
+            return known
+
+        try:
+            fingerprint = (st.st_size, st.st_mtime_ns, _hash_path(path))
+        except OSError:
+            return None
+        self._hashes[relpath] = fingerprint
+        return fingerprint
+
+    def validate(self, changed: Optional[set[str]] = None) -> list[ValidationResult]:
+        """Validate the project, re-running only checks with changed inputs.
+
+        Args:
+            changed: Project paths known to have changed (e.g. from a file
+                watcher). When given, checks that read none of them reuse
+                their previous result without touching the filesystem.
+
+        Returns:
+            One ValidationResult per check; reused results have cached=True
+        """
+        validator = ProjectValidator(str(self.project_path))
+        results = []
+
+        for check in self.plan:
+            inputs = check.inputs
+            previous = self._results.get(check)
+            if changed is not None and previous and not _touches(inputs, changed):
+                key = previous[0]
+            else:
+                key = tuple((p, self._fingerprint(p)) for p in inputs)
+
+            if inputs and previous and previous[0] == key:
+                result = previous[1]
+                results.append(ValidationResult(
+                    result.passed, result.message, result.details, cached=True
+                ))
+                continue
+
+            result = check.run(validator)
+            self._results[check] = (key, result)
+            results.append(result)
+
+        return results
@@ -0,0 +1,206 @@
+"""Single-pass Markdown scanner for project validation.
+
+``scan_markdown`` walks a document once, line by line, tracking fenced
+code blocks, and records everything the validator asks about: which
+element types occur, the headings with their levels and titles, and the
+fence boundaries. Checks then answer from the scan instead of searching
+the text again.
+
+Lines inside code fences are code, not Markdown, so a ``# comment`` in a
+shell snippet is not a heading and a ``- item`` in a YAML snippet is not
+a list. Inline elements ignore text inside backtick code spans.
+
+Every pattern here is anchored to one line and free of nested or
+overlapping quantifiers, so scanning time stays linear in the input even
+for very long lines.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Optional
+
+# Element types has_element can ask about
+ELEMENT_TYPES = (
+    "unordered_list",
+    "ordered_list",
+    "task_list",
+    "table",
+    "code_block",
+    "link",
+    "image",
+    "bold",
+    "italic",
+)
+
+_FENCE = re.compile(r"[ \t]*(`{3,}|~{3,})")
+_ATX_HEADING = re.compile(r" {0,3}(#{1,6})(?=[ \t]|$)")
+_SETEXT_UNDERLINE = re.compile(r" {0,3}(=+|-+)[ \t]*$")
+_UNORDERED_ITEM = re.compile(r"[ \t]*[-*+][ \t]+\S")
+_ORDERED_ITEM = re.compile(r"[ \t]*\d{1,9}[.)][ \t]+\S")
+_TASK_ITEM = re.compile(r"[ \t]*[-*+][ \t]+\[[ xX]\]")
+_TABLE_DELIMITER = re.compile(
+    r"[ \t]*\|?[ \t]*:?-+:?[ \t]*(?:\|[ \t]*:?-+:?[ \t]*)*\|?[ \t]*$"
+)
+_LINK = re.compile(r"\[[^\[\]\n]+\]\([^()\n]+\)")
+_IMAGE = re.compile(r"!\[[^\[\]\n]+\]\([^()\n]+\)")
+_BOLD = re.compile(r"\*\*[^*\n]+\*\*")
+_ITALIC = re.compile(r"(?<!\*)\*[^\s*][^*\n]*\*(?!\*)")
+_FRONT_MATTER_END = ("---", "...")
+
+
+@dataclass
+class Heading:
+    """A heading found outside code fences."""
+
+    level: int
+    title: str
+    line: int
+
+
+@dataclass
+class MarkdownScan:
+    """Everything the validator needs to know about a Markdown document."""
+
+    elements: set[str] = field(default_factory=set)
+    headings: list[Heading] = field(default_factory=list)
+    # (start, end) line indexes of fenced code blocks; end is None if unclosed
+    fences: list[tuple[int, Optional[int]]] = field(default_factory=list)
+    # Number of '**' markers outside code
+    bold_markers: int = 0
+
+    @property
+    def heading_levels(self) -> set[int]:
+        """The distinct heading levels used."""
+        return {h.level for h in self.headings}
+
+    @property
+    def unclosed_fence(self) -> bool:
+        """Whether the last code fence is never closed."""
+        return bool(self.fences) and self.fences[-1][1] is None
+
+    def has_section(self, name: str) -> bool:
+        """Whether any heading title contains name (case-insensitive)."""
+        name = name.lower()
+        return any(name in h.title.lower() for h in self.headings)
+
+
+def _strip_code_spans(line: str) -> str:
+    """Remove the contents of `code spans` from a line."""
+    if "`" not in line:
+        return line
+    parts = line.split("`")
+    kept = parts[0::2]
+    if len(parts) % 2 == 0:
+        # An unmatched final backtick starts no span
+        kept.append(parts[-1])
+    return " ".join(kept)
+
+
+def _heading_title(rest: str) -> str:
+    """Title of an ATX heading from the text after its '#' marker."""
+    title = rest.strip()
+    if title.endswith("#"):
+        # An optional closing sequence of '#' preceded by a space
+        trimmed = title.rstrip("#")
+        if not trimmed or trimmed[-1] in " \t":
+            title = trimmed.strip()
+    return title
+
+
+def _front_matter_end(lines: list[str]) -> int:
+    """Index of the first line after a YAML front matter block (0 if none)."""
+    if not lines or lines[0].rstrip() != "---":
+        return 0
+    for i in range(1, len(lines)):
+        if lines[i].rstrip() in _FRONT_MATTER_END:
+            return i + 1
+    return 0
+
+
+def scan_markdown(lines: list[str]) -> MarkdownScan:
+    """Scan a Markdown document's lines in a single pass.
+
+    Args:
+        lines: The document split into lines
+
+    Returns:
+        MarkdownScan describing the document
+    """
+    scan = MarkdownScan()
+    elements = scan.elements
+    fence: Optional[str] = None
+    fence_start = 0
+    # Index of the previous line if it could be a setext heading's text
+    # or a table's header row
+    paragraph: Optional[int] = None
+
+    for i in range(_front_matter_end(lines), len(lines)):
+        line = lines[i]
+
+        if fence is not None:
+            stripped = line.strip()
+            if stripped.startswith(fence) and not stripped.strip(fence[0]):
+                scan.fences.append((fence_start, i))
+                fence = None
+            continue
+
+        match = _FENCE.match(line)
+        if match:
+            fence = match.group(1)
+            fence_start = i
+            elements.add("code_block")
+            paragraph = None
+            continue
+
+        if not line.strip():
+            paragraph = None
+            continue
+
+        match = _ATX_HEADING.match(line)
+        if match:
+            scan.headings.append(
+                Heading(len(match.group(1)), _heading_title(line[match.end():]), i)
+            )
+            paragraph = None
+            continue
+
+        if paragraph is not None:
+            if "|" in line and "|" in lines[paragraph] and _TABLE_DELIMITER.match(line):
+                elements.add("table")
+                paragraph = None
+                continue
+            match = _SETEXT_UNDERLINE.match(line)
+            if match:
+                level = 1 if match.group(1)[0] == "=" else 2
+                scan.headings.append(Heading(level, lines[paragraph].strip(), paragraph))
+                paragraph = None
+                continue
+
+        is_item = False
+        if _UNORDERED_ITEM.match(line):
+            elements.add("unordered_list")
+            if _TASK_ITEM.match(line):
+                elements.add("task_list")
+            is_item = True
+        elif _ORDERED_ITEM.match(line):
+            elements.add("ordered_list")
+            is_item = True
+
+        text = _strip_code_spans(line)
+        if "**" in text:
+            scan.bold_markers += text.count("**")
+            if _BOLD.search(text):
+                elements.add("bold")
+        if "*" in text and _ITALIC.search(text):
+            elements.add("italic")
+        if "](" in text:
+            if _LINK.search(text):
+                elements.add("link")
+            if "![" in text and _IMAGE.search(text):
+                elements.add("image")
+
+        paragraph = None if is_item else i
+
+    if fence is not None:
+        scan.fences.append((fence_start, None))
+    return scan
@@ -0,0 +1,446 @@
+"""Safe evaluation of regex patterns from project definitions.
+
+Checks like ``count_pattern`` run regexes written by project authors
+against files written by learners, and a single catastrophic pattern
+can hang validation. This module guards them in three layers:
+
+- ``compile_pattern`` rejects constructs known to backtrack
+  exponentially when the check plan is compiled, and caches compiled
+  patterns. A repeated group is rejected if its body can match empty
+  text (``(a|a?)*``), if its alternatives can match the same text
+  (``(a|aa)+``), or if an inner repeat can run across the boundary
+  between passes (``(a+)+``). Groups delimited by text the inner repeat
+  can't consume, such as ``(\\d+\\.)+``, are accepted.
+- ``count_matches`` counts with ``finditer`` and stops as soon as the
+  caller's limit is reached, so nothing is materialized. Large files
+  are matched through a memory map rather than read into memory.
+- Matching runs in a separate worker process with a CPU-time budget per
+  check. A pattern that exhausts it is abandoned without stalling the
+  caller.
+"""
+
+import atexit
+import multiprocessing
+import re
+import signal
+import threading
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path
+from typing import Optional, Union
+
+try:
+    from re import _parser as sre_parse  # Python 3.11+
+except ImportError:
+    import sre_parse
+
+from .streaming import STREAM_THRESHOLD, map_file
+
+PATTERN_FLAGS = re.IGNORECASE | re.MULTILINE
+
+# Seconds of CPU time a pattern check may use
+DEFAULT_BUDGET = 2.0
+
+# Wall-clock time the caller allows past the budget before killing the worker
+_KILL_GRACE = 2.0
+
+_MAXREPEAT = sre_parse.MAXREPEAT
+_REPEATS = (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT)
+_ZERO_WIDTH = (sre_parse.AT, sre_parse.ASSERT, sre_parse.ASSERT_NOT)
+
+# Characters that character classes are tested against: Latin-1 plus a
+# few wider Unicode letters, digits and spaces
+_ALPHABET = tuple(map(chr, range(256))) + ("\u0100", "\u0661", "\u2003", "\u4e00")
+
+# Class category -> (test, whether a character passing it is in the class)
+_CATEGORIES = {
+    sre_parse.CATEGORY_DIGIT: (str.isdecimal, True),
+    sre_parse.CATEGORY_NOT_DIGIT: (str.isdecimal, False),
+    sre_parse.CATEGORY_SPACE: (str.isspace, True),
+    sre_parse.CATEGORY_NOT_SPACE: (str.isspace, False),
+    sre_parse.CATEGORY_WORD: (lambda c: c.isalnum() or c == "_", True),
+    sre_parse.CATEGORY_NOT_WORD: (lambda c: c.isalnum() or c == "_", False),
+}
+
+
+class PatternError(ValueError):
+    """A pattern is invalid, unsafe, or couldn't be evaluated in time."""
+
+
+def _in_class(char: str, items: list) -> Optional[bool]:
+    """Whether a character is in a parsed [...] class; None if it can't be told."""
+    negate = False
+    for kind, value in items:
+        if kind is sre_parse.NEGATE:
+            negate = True
+            continue
+        if kind is sre_parse.LITERAL:
+            hit = char == chr(value)
+        elif kind is sre_parse.RANGE:
+            hit = value[0] <= ord(char) <= value[1]
+        elif kind is sre_parse.CATEGORY and value in _CATEGORIES:
+            test, expected = _CATEGORIES[value]
+            hit = test(char) == expected
+        else:
+            return None
+        if hit:
+            return not negate
+    return negate
+
+
+def _char_set(op, av) -> Optional[frozenset]:
+    """Characters (lowercased) a single-character item can match.
+
+    Returns:
+        A set of characters, or None if the item doesn't match exactly
+        one character or its class can't be told
+    """
+    if op is sre_parse.LITERAL:
+        return frozenset(chr(av).lower())
+    if op is sre_parse.NOT_LITERAL:
+        return frozenset(c.lower() for c in _ALPHABET if c.lower() != chr(av).lower())
+    if op is sre_parse.ANY:
+        return frozenset(c.lower() for c in _ALPHABET if c != "\n")
+    if op is sre_parse.IN:
+        chars = set()
+        for c in _ALPHABET:
+            cases = {c, c.lower(), c.upper()}
+            hits = {_in_class(case, av) for case in cases if len(case) == 1}
+            if None in hits:
+                return None
+            if True in hits:
+                chars.add(c.lower())
+        return frozenset(chars)
+    return None
+
+
+def _first_chars(items: list, follow: Optional[frozenset]) -> Optional[frozenset]:
+    """Characters a sequence of parsed items can start with.
+
+    Args:
+        items: Parsed pattern items
+        follow: What can start the text after the sequence, used when
+            the sequence can match empty
+
+    Returns:
+        A set of (lowercased) characters, or None if it can't be told
+    """
+    items = list(items)
+    for index, (op, av) in enumerate(items):
+        rest = items[index + 1:]
+        if op in _ZERO_WIDTH:
+            continue
+        if op is sre_parse.SUBPATTERN:
+            return _first_chars(list(av[-1]) + rest, follow)
+        if op is sre_parse.BRANCH:
+            starts = [_first_chars(list(branch) + rest, follow) for branch in av[1]]
+            return None if None in starts else frozenset().union(*starts)
+        if op in _REPEATS:
+            after = _first_chars(rest, follow)
+            body = _first_chars(list(av[2]), after)
+            if av[0] > 0 or body is None or after is None:
+                return body if av[0] > 0 else None
+            return body | after
+        return _char_set(op, av)
+    return follow
+
+
+def _all_chars(items: list) -> frozenset:
+    """Characters parsed items can match anywhere; empty if it can't be told."""
+    chars = set()
+    for op, av in items:
+        if op is sre_parse.SUBPATTERN:
+            chars |= _all_chars(av[-1])
+        elif op is sre_parse.BRANCH:
+            for branch in av[1]:
+                chars |= _all_chars(branch)
+        elif op in _REPEATS:
+            chars |= _all_chars(av[2])
+        elif op not in _ZERO_WIDTH:
+            chars |= _char_set(op, av) or frozenset()
+    return frozenset(chars)
+
+
+def _matches_empty(items: list) -> bool:
+    """Whether parsed items can match the empty string."""
+    for op, av in items:
+        if op in _ZERO_WIDTH:
+            continue
+        if op is sre_parse.SUBPATTERN:
+            empty = _matches_empty(av[-1])
+        elif op is sre_parse.BRANCH:
+            empty = any(_matches_empty(branch) for branch in av[1])
+        elif op in _REPEATS:
+            empty = av[0] == 0 or _matches_empty(av[2])
+        else:
+            empty = False
+        if not empty:
+            return False
+    return True
+
+
+def _edge(items: list, from_end: bool) -> tuple[frozenset, Optional[frozenset]]:
+    """What sits at the start (or end) of a repeated group's body.
+
+    Returns:
+        The characters that unbounded repeats at the edge can consume,
+        and the characters of the first required item reached from the
+        edge (None if everything is optional)
+    """
+    spill = set()
+    for op, av in reversed(items) if from_end else items:
+        if op in _ZERO_WIDTH:
+            continue
+        if op is sre_parse.SUBPATTERN:
+            more, required = _edge(list(av[-1]), from_end)
+        elif op is sre_parse.BRANCH:
+            edges = [_edge(list(branch), from_end) for branch in av[1]]
+            more = frozenset().union(*(e[0] for e in edges))
+            ends = [e[1] for e in edges]
+            required = None if None in ends else frozenset().union(*ends)
+        elif op in _REPEATS:
+            low, high, body = av
+            chars = _all_chars(body)
+            more = chars if high == _MAXREPEAT else frozenset()
+            required = chars if low > 0 else None
+        else:
+            more, required = frozenset(), _char_set(op, av) or frozenset()
+        spill |= more
+        if required is not None:
+            return frozenset(spill), required
+    return frozenset(spill), None
+
+
+def _undelimited(body: list) -> bool:
+    """Whether an inner repeat can run across a repeated body's boundary.
+
+    ``(\\d+\\.)+`` is safe: each pass ends with a dot the digits can't
+    consume. In ``(\\d+)+`` or ``(\\d+\\d)+`` the digits can be split
+    between passes in exponentially many ways.
+    """
+    tail, last = _edge(body, from_end=True)
+    head, first = _edge(body, from_end=False)
+    return bool(tail & (head | (first or frozenset())) or head & (tail | (last or frozenset())))
+
+
+def _find_hazard(items: list) -> Optional[str]:
+    """Describe the first catastrophic-backtracking construct in parsed items."""
+    for op, av in items:
+        if op in _REPEATS:
+            low, high, body = av
+            body = list(body)
+            if high == _MAXREPEAT and _matches_empty(body):
+                return "a repeated group that can match empty text, e.g. (a|a?)*"
+            if high > 1 and _undelimited(body):
+                return "nested quantifiers, e.g. (a+)+"
+            if high == _MAXREPEAT and _ambiguous_branch(body, _first_chars(body, None)):
+                return "repeated alternatives that match the same text, e.g. (a|aa)+"
+            found = _find_hazard(body)
+        elif op is sre_parse.SUBPATTERN:
+            found = _find_hazard(av[-1])
+        elif op is sre_parse.BRANCH:
+            found = next(filter(None, (_find_hazard(b) for b in av[1])), None)
+        elif op in (sre_parse.ASSERT, sre_parse.ASSERT_NOT):
+            found = _find_hazard(av[1])
+        else:
+            found = None
+        if found:
+            return found
+    return None
+
+
+def _ambiguous_branch(items: list, loop: Optional[frozenset]) -> bool:
+    """Whether a repeated body has alternatives that can start the same way.
+
+    Args:
+        items: The repeated body
+        loop: What can follow the body: the body itself, since the repeat
+            can go round again
+    """
+    for index, (op, av) in enumerate(items):
+        if op is sre_parse.SUBPATTERN:
+            if _ambiguous_branch(list(av[-1]), _first_chars(items[index + 1:], loop)):
+                return True
+        elif op is sre_parse.BRANCH:
+            follow = _first_chars(items[index + 1:], loop)
+            starts = [_first_chars(list(branch), follow) for branch in av[1]]
+            known = [s for s in starts if s is not None]
+            seen = set()
+            for chars in known:
+                if chars & seen:
+                    return True
+                seen |= chars
+    return False
+
+
+@lru_cache(maxsize=256)
+def compile_pattern(pattern: str) -> re.Pattern:
+    """Compile a pattern from a project definition, rejecting unsafe ones.
+
+    Raises:
+        PatternError: If the pattern is invalid or prone to catastrophic
+            backtracking
+    """
+    try:
+        parsed = sre_parse.parse(pattern, PATTERN_FLAGS)
+    except re.error as e:
+        raise PatternError(f"Invalid pattern {pattern!r}: {e}") from None
+    hazard = _find_hazard(list(parsed))
+    if hazard:
+        raise PatternError(f"Unsafe pattern {pattern!r}: {hazard}")
+    return re.compile(pattern, PATTERN_FLAGS)
+
+
+class _BudgetExceeded(BaseException):
+    """Raised inside the worker when a pattern uses up its CPU budget."""
+
+
+def _raise_budget_exceeded(signum, frame):
+    raise _BudgetExceeded()
+
+
+@lru_cache(maxsize=256)
+def _compile_binary(pattern: str) -> re.Pattern:
+    """Compile a (checked) pattern for matching raw UTF-8 bytes."""
+    try:
+        return re.compile(pattern.encode("utf-8"), PATTERN_FLAGS)
+    except re.error as e:
+        raise PatternError(f"Pattern {pattern!r} can't be used on large files: {e}") from None
+
+
+def _count(path: str, pattern: str, limit: Optional[int]) -> int:
+    """Count pattern matches in a file, stopping at limit.
+
+    Files over STREAM_THRESHOLD are memory-mapped and matched as bytes
+    rather than decoded, so case-insensitivity and classes like ``\\w``
+    only cover ASCII there.
+    """
+    path = Path(path)
+    if path.stat().st_size <= STREAM_THRESHOLD:
+        text = path.read_text(encoding="utf-8")
+        return sum(1 for _ in islice(compile_pattern(pattern).finditer(text), limit))
+
+    regex = _compile_binary(pattern)
+    with map_file(path) as data:
+        return sum(1 for _ in islice(regex.finditer(data), limit))
+
+
+def _serve(conn):
+    """Worker loop: answer (path, pattern, limit, budget) requests."""
+    # SIGPROF fires after the given amount of CPU time
+    profiled = hasattr(signal, "SIGPROF")
+    if profiled:
+        signal.signal(signal.SIGPROF, _raise_budget_exceeded)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    while True:
+        try:
+            path, pattern, limit, budget = conn.recv()
+        except (EOFError, OSError):
+            return
+        try:
+            if profiled:
+                signal.setitimer(signal.ITIMER_PROF, budget)
+            try:
+                reply = ("ok", _count(path, pattern, limit))
+            finally:
+                if profiled:
+                    signal.setitimer(signal.ITIMER_PROF, 0)
+        except _BudgetExceeded:
+            reply = ("budget", None)
+        except Exception as e:
+            reply = ("error", str(e))
+        conn.send(reply)
+
+
+class PatternWorker:
+    """A long-lived process that evaluates patterns under a CPU budget.
+
+    The worker is started on first use and reused for later checks. It
+    reads files itself, so file contents never cross the process
+    boundary. If a pattern outlives its budget and the worker can't
+    interrupt itself, the worker is killed and a new one started for the
+    next check.
+    """
+
+    def __init__(self):
+        self._process = None
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def _start(self):
+        context = multiprocessing.get_context()
+        self._conn, child = context.Pipe()
+        self._process = context.Process(target=_serve, args=(child,), daemon=True)
+        self._process.start()
+        child.close()
+
+    def stop(self):
+        """Stop the worker process."""
+        if self._process is not None:
+            self._process.kill()
+            self._process.join()
+            self._conn.close()
+            self._process = self._conn = None
+
+    def count(
+        self,
+        path: Union[str, Path],
+        pattern: str,
+        limit: Optional[int] = None,
+        budget: float = DEFAULT_BUDGET,
+    ) -> int:
+        """Count matches of a pattern in a file.
+
+        Args:
+            path: File to search
+            pattern: Pattern, checked with compile_pattern first
+            limit: Stop counting once this many matches are found
+            budget: Seconds of CPU time the search may use
+
+        Raises:
+            PatternError: If the pattern is unsafe or runs out of budget
+            OSError: If the file can't be read
+        """
+        compile_pattern(pattern)
+        with self._lock:
+            if self._process is None or not self._process.is_alive():
+                self._start()
+            try:
+                self._conn.send((str(path), pattern, limit, budget))
+                if not self._conn.poll(budget + _KILL_GRACE):
+                    self.stop()
+                    status, value = "budget", None
+                else:
+                    status, value = self._conn.recv()
+            except (EOFError, OSError) as e:
+                self.stop()
+                raise PatternError(f"Pattern worker failed: {e}") from None
+            except BaseException:
+                # Interrupted mid-request: the worker's late reply would
+                # be read as the answer to the next one
+                self.stop()
+                raise
+
+        if status == "budget":
+            raise PatternError(f"Pattern {pattern!r} exceeded its {budget:g}s time budget")
+        if status == "error":
+            raise OSError(value)
+        return value
+
+
+_worker = PatternWorker()
+atexit.register(_worker.stop)
+
+
+def count_matches(
+    path: Union[str, Path],
+    pattern: str,
+    limit: Optional[int] = None,
+    budget: float = DEFAULT_BUDGET,
+) -> int:
+    """Count matches of a pattern in a file using the shared worker.
+
+    See PatternWorker.count.
+    """
+    return _worker.count(path, pattern, limit, budget)
@@ -0,0 +1,273 @@
+"""Symbol index of a project's Python source for structural checks.
+
+Checks such as ``class_exists`` and ``parameter_exists`` all ask
+questions about the same few source files. Each file is parsed once with
+``ast.parse``. A single walk of the tree records its classes (with their
+methods and attributes), functions (with their parameters and
+annotations) and imports, so every structural check is a dictionary
+lookup.
+
+Indexes are cached by a hash of the file's contents and shared across
+validators, so re-validating an unchanged file, or grading many
+submissions that share starter files, never parses it again.
+"""
+
+import ast
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+from .streaming import DEFAULT_MAX_FILE_SIZE, check_size
+
+# Directories never searched for project source
+SKIP_DIRS = frozenset({
+    "__pycache__", "build", "dist", "env", "node_modules", "site-packages", "venv",
+})
+
+# Number of parsed files kept in the cache
+_CACHE_SIZE = 512
+
+
+@dataclass
+class FunctionInfo:
+    """A function or method's signature."""
+
+    name: str
+    line: int
+    # Parameter name -> whether it is annotated, in declaration order
+    parameters: dict[str, bool] = field(default_factory=dict)
+    returns_annotated: bool = False
+    # Whether the first parameter is self/cls rather than a real argument
+    bound: bool = False
+
+    @property
+    def arguments(self) -> dict[str, bool]:
+        """The parameters callers pass, i.e. without self/cls."""
+        if not self.bound:
+            return self.parameters
+        return dict(list(self.parameters.items())[1:])
+
+    @property
+    def has_type_hints(self) -> bool:
+        """Whether every argument and the return value are annotated."""
+        return self.returns_annotated and all(self.arguments.values())
+
+
+@dataclass
+class ClassInfo:
+    """A class's methods and attributes."""
+
+    name: str
+    line: int
+    methods: dict[str, FunctionInfo] = field(default_factory=dict)
+    # Class-level names, self.<name> assignments and properties
+    attributes: set[str] = field(default_factory=set)
+
+
+@dataclass
+class SymbolIndex:
+    """Classes, functions and imports found in Python source."""
+
+    classes: dict[str, ClassInfo] = field(default_factory=dict)
+    # Module-level functions
+    functions: dict[str, FunctionInfo] = field(default_factory=dict)
+    # Imported modules, including each parent package
+    imports: set[str] = field(default_factory=set)
+    # Files that couldn't be parsed, with the reason
+    errors: list[str] = field(default_factory=list)
+
+    def find_function(self, name: str) -> Optional[FunctionInfo]:
+        """Look up a function by name.
+
+        ``Class.method`` names a method. A bare name matches a module-level
+        function first, then a method of any class.
+        """
+        if "." in name:
+            class_name, _, method = name.rpartition(".")
+            info = self.classes.get(class_name)
+            return info.methods.get(method) if info else None
+        if name in self.functions:
+            return self.functions[name]
+        for info in self.classes.values():
+            if name in info.methods:
+                return info.methods[name]
+        return None
+
+    def merge(self, other: "SymbolIndex"):
+        """Add another file's symbols; names already present are kept."""
+        for name, info in other.classes.items():
+            self.classes.setdefault(name, info)
+        for name, info in other.functions.items():
+            self.functions.setdefault(name, info)
+        self.imports |= other.imports
+        self.errors.extend(other.errors)
+
+
+def _is_staticmethod(node: ast.AST) -> bool:
+    return any(
+        isinstance(d, ast.Name) and d.id == "staticmethod" for d in node.decorator_list
+    )
+
+
+def _is_property(node: ast.AST) -> bool:
+    return any(
+        (isinstance(d, ast.Name) and d.id in ("property", "cached_property"))
+        or (isinstance(d, ast.Attribute) and d.attr in ("setter", "cached_property"))
+        for d in node.decorator_list
+    )
+
+
+def _function_info(node, bound: bool) -> FunctionInfo:
+    args = node.args
+    params = args.posonlyargs + args.args
+    if args.vararg:
+        params.append(args.vararg)
+    params += args.kwonlyargs
+    if args.kwarg:
+        params.append(args.kwarg)
+    return FunctionInfo(
+        node.name,
+        node.lineno,
+        {p.arg: p.annotation is not None for p in params},
+        node.returns is not None,
+        bound and bool(args.posonlyargs + args.args),
+    )
+
+
+class _Indexer(ast.NodeVisitor):
+    """Builds a SymbolIndex in one walk of a module's tree."""
+
+    def __init__(self):
+        self.index = SymbolIndex()
+        self._class: Optional[ClassInfo] = None
+        self._in_function = False
+        # Name of the current method's self parameter
+        self._self: Optional[str] = None
+
+    def visit_ClassDef(self, node: ast.ClassDef):
+        outer = self._class, self._in_function, self._self
+        if self._in_function:
+            # Classes local to a function aren't part of the module's API
+            self._class = None
+        else:
+            self._class = self.index.classes.setdefault(
+                node.name, ClassInfo(node.name, node.lineno)
+            )
+        self._self = None
+        self.generic_visit(node)
+        self._class, self._in_function, self._self = outer
+
+    def _visit_function(self, node):
+        outer = self._in_function, self._self
+        if not self._in_function:
+            method = self._class is not None
+            info = _function_info(node, bound=method and not _is_staticmethod(node))
+            if method:
+                self._class.methods.setdefault(node.name, info)
+                if _is_property(node):
+                    self._class.attributes.add(node.name)
+                if info.bound:
+                    self._self = next(iter(info.parameters))
+            else:
+                self.index.functions.setdefault(node.name, info)
+        self._in_function = True
+        self.generic_visit(node)
+        self._in_function, self._self = outer
+
+    def visit_FunctionDef(self, node: ast.FunctionDef):
+        self._visit_function(node)
+
+    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef):
+        self._visit_function(node)
+
+    def visit_Name(self, node: ast.Name):
+        # Assignments in a class body define class attributes
+        if self._class is not None and not self._in_function and isinstance(node.ctx, ast.Store):
+            self._class.attributes.add(node.id)
+
+    def visit_Attribute(self, node: ast.Attribute):
+        # self.<name> = ... in a method defines an instance attribute
+        if (
+            self._self is not None
+            and isinstance(node.ctx, ast.Store)
+            and isinstance(node.value, ast.Name)
+            and node.value.id == self._self
+        ):
+            self._class.attributes.add(node.attr)
+        self.generic_visit(node)
+
+    def _add_module(self, name: str):
+        parts = name.split(".")
+        for i in range(1, len(parts) + 1):
+            self.index.imports.add(".".join(parts[:i]))
+
+    def visit_Import(self, node: ast.Import):
+        for alias in node.names:
+            self._add_module(alias.name)
+
+    def visit_ImportFrom(self, node: ast.ImportFrom):
+        if node.module and not node.level:
+            self._add_module(node.module)
+            for alias in node.names:
+                if alias.name != "*":
+                    self.index.imports.add(f"{node.module}.{alias.name}")
+
+
+_cache: "OrderedDict[str, SymbolIndex]" = OrderedDict()
+
+
+def index_source(source: bytes, filename: str = "<source>") -> SymbolIndex:
+    """Index Python source, reusing the index of identical source.
+
+    The returned index is shared; callers must not modify it.
+
+    Raises:
+        SyntaxError: If the source doesn't parse
+    """
+    key = hashlib.sha1(source).hexdigest()
+    index = _cache.get(key)
+    if index is not None:
+        _cache.move_to_end(key)
+        return index
+
+    indexer = _Indexer()
+    indexer.visit(ast.parse(source, filename))
+    index = indexer.index
+    _cache[key] = index
+    if len(_cache) > _CACHE_SIZE:
+        _cache.popitem(last=False)
+    return index
+
+
+def _source_files(root: Path) -> list[Path]:
+    """Python files under a directory, skipping hidden and environment directories."""
+    files = []
+    for path in sorted(root.rglob("*.py")):
+        parts = path.relative_to(root).parts[:-1]
+        if any(part.startswith(".") or part in SKIP_DIRS for part in parts):
+            continue
+        files.append(path)
+    return files
+
+
+def index_path(path: Path, max_size: int = DEFAULT_MAX_FILE_SIZE) -> SymbolIndex:
+    """Index a Python file, or every Python file under a directory.
+
+    Files that can't be read or parsed are listed in the index's errors
+    instead of raising.
+    """
+    files = _source_files(path) if path.is_dir() else [path]
+    base = path if path.is_dir() else path.parent
+    index = SymbolIndex()
+    for file in files:
+        name = file.relative_to(base).as_posix()
+        try:
+            check_size(file, file.stat().st_size, max_size)
+            index.merge(index_source(file.read_bytes(), name))
+        except SyntaxError as e:
+            index.errors.append(f"{name}: {e.msg} (line {e.lineno})")
+        except (OSError, ValueError) as e:
+            index.errors.append(f"{name}: {e}")
+    return index
@@ -0,0 +1,88 @@
+"""Bounded-memory reading of large project files.
+
+Most project files are small documents that validation loads whole. Some
+projects (log analyzers, backup scripts) produce logs and archives of
+hundreds of megabytes that checks are pointed at too. Files above
+``STREAM_THRESHOLD`` are never loaded whole. The checks that make sense
+for them (word counts, text search, pattern counts) read them in chunks
+or through a memory map instead, so memory use stays flat whatever the
+file size. Files above a configurable ceiling are refused outright.
+"""
+
+import mmap
+from pathlib import Path
+from typing import Iterable, Iterator
+
+# Files larger than this are streamed instead of loaded whole
+STREAM_THRESHOLD = 8 * 1024 * 1024
+
+# Characters decoded per chunk when streaming
+CHUNK_SIZE = 1024 * 1024
+
+# Default largest file a check will read at all
+DEFAULT_MAX_FILE_SIZE = 1024 * 1024 * 1024
+
+
+class FileTooLargeError(ValueError):
+    """A file is larger than a check is willing to read."""
+
+
+def _megabytes(size: int) -> str:
+    return f"{size / (1024 * 1024):.0f} MB"
+
+
+def check_size(path: Path, size: int, limit: int):
+    """Raise FileTooLargeError if a file of the given size is over the limit."""
+    if size > limit:
+        raise FileTooLargeError(
+            f"{path.name} is {_megabytes(size)}, over the {_megabytes(limit)} limit"
+        )
+
+
+def iter_chunks(path: Path, size: int = CHUNK_SIZE) -> Iterator[str]:
+    """Yield a UTF-8 file's contents as decoded chunks of up to size characters."""
+    with path.open(encoding="utf-8") as f:
+        yield from iter(lambda: f.read(size), "")
+
+
+def count_words(chunks: Iterable[str]) -> int:
+    """Count whitespace-separated words across chunks.
+
+    A word split across a chunk boundary is counted once.
+    """
+    count = 0
+    in_word = False
+    for chunk in chunks:
+        count += len(chunk.split())
+        if in_word and not chunk[0].isspace():
+            count -= 1
+        in_word = not chunk[-1].isspace()
+    return count
+
+
+def find_all(chunks: Iterable[str], needles: Iterable[str]) -> set[str]:
+    """Find which needles occur (case-insensitively) across chunks.
+
+    Needles are matched in lowercase; a needle split across a chunk
+    boundary is still found.
+    """
+    remaining = {needle.lower() for needle in needles}
+    found = set()
+    overlap = max((len(n) for n in remaining), default=1) - 1
+    tail = ""
+    for chunk in chunks:
+        window = tail + chunk.lower()
+        for needle in list(remaining):
+            if needle in window:
+                found.add(needle)
+                remaining.discard(needle)
+        if not remaining:
+            break
+        tail = window[-overlap:] if overlap else ""
+    return found
+
+
+def map_file(path: Path) -> mmap.mmap:
+    """Memory-map a file read-only; the caller closes the map."""
+    with path.open("rb") as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
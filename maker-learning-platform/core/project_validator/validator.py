@@ -4,30 +4,185 @@ This module provides validation functions to check if projects
 meet their completion criteria.
 """
 
+import ast
+import inspect
 import os
 import re
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterable, Iterator, Optional, Union
+
+from .markdown import ELEMENT_TYPES, MarkdownScan, scan_markdown
+from .patterns import DEFAULT_BUDGET, PatternError, compile_pattern, count_matches
+from .python_index import SymbolIndex, index_path
+from .streaming import (
+    DEFAULT_MAX_FILE_SIZE,
+    STREAM_THRESHOLD,
+    FileTooLargeError,
+    check_size,
+    count_words,
+    find_all,
+    iter_chunks,
+)
+
+_HTTP_ENDPOINT = re.compile(
+    r"^[\s#>*`|-]*(GET|POST|PUT|PATCH|DELETE|HEAD|OPTIONS)\s+`?(/\S*?)`?\s*(?:\||$|\s)",
+    re.IGNORECASE,
+)
+_FUNCTION_HEADING = re.compile(r"^#+\s+`?([A-Za-z_][\w.]*)\s*\(")
 
 
 class ValidationResult:
     """Result of a validation check."""
 
-    def __init__(self, passed: bool, message: str, details: Optional[str] = None):
+    def __init__(
+        self,
+        passed: bool,
+        message: str,
+        details: Optional[str] = None,
+        cached: bool = False,
+    ):
         self.passed = passed
         self.message = message
         self.details = details
+        self.cached = cached
 
     def __repr__(self):
         status = "✓" if self.passed else "✗"
         return f"{status} {self.message}"
 
 
+class Document:
+    """A project file read once and parsed lazily.
+
+    Every check against the same file shares one Document, so the file is
+    read and decoded once and each derived view is built at most once.
+
+    Files larger than STREAM_THRESHOLD are never loaded whole: word counts
+    and text search read them in chunks, and the views that need the
+    whole text raise FileTooLargeError. Files over max_size can't be read at
+    all.
+    """
+
+    def __init__(self, path: Path, max_size: int = DEFAULT_MAX_FILE_SIZE):
+        self.path = path
+        self.max_size = max_size
+
+    @cached_property
+    def size(self) -> int:
+        """File size in bytes."""
+        return self.path.stat().st_size
+
+    @property
+    def streamed(self) -> bool:
+        """Whether the file is too large to load whole."""
+        return self.size > STREAM_THRESHOLD
+
+    def chunks(self) -> Iterator[str]:
+        """Decoded file contents in chunks of bounded size."""
+        check_size(self.path, self.size, self.max_size)
+        if not self.streamed:
+            yield self.text
+            return
+        yield from iter_chunks(self.path)
+
+    def find_all(self, needles: Iterable[str]) -> set[str]:
+        """Which of the (lowercase) needles occur in the file, ignoring case."""
+        if not self.streamed:
+            return {needle for needle in needles if needle in self.lower}
+        return find_all(self.chunks(), needles)
+
+    @cached_property
+    def text(self) -> str:
+        """Decoded file contents."""
+        check_size(self.path, self.size, self.max_size)
+        if self.streamed:
+            raise FileTooLargeError(
+                f"{self.path.name} is too large for this check "
+                f"(over {STREAM_THRESHOLD // (1024 * 1024)} MB)"
+            )
+        return self.path.read_text(encoding="utf-8")
+
+    @cached_property
+    def lower(self) -> str:
+        """Lowercased file contents."""
+        return self.text.lower()
+
+    @cached_property
+    def lines(self) -> list[str]:
+        """File contents split into lines."""
+        return self.text.split("\n")
+
+    @cached_property
+    def word_count(self) -> int:
+        """Number of whitespace-separated words."""
+        if not self.streamed:
+            return len(self.text.split())
+        return count_words(self.chunks())
+
+    @cached_property
+    def markdown(self) -> MarkdownScan:
+        """Elements, headings and code fences, found in one pass."""
+        return scan_markdown(self.lines)
+
+    @cached_property
+    def headings(self) -> list[tuple[int, str]]:
+        """(level, line) for every heading outside code fences."""
+        return [(h.level, self.lines[h.line]) for h in self.markdown.headings]
+
+    @cached_property
+    def code_fences(self) -> list[tuple[int, Optional[int]]]:
+        """(start, end) line indexes of fenced code blocks.
+
+        The end is None for a fence that is never closed.
+        """
+        return self.markdown.fences
+
+
 class ProjectValidator:
     """Validates project completion for Project Foundations subject."""
 
+    # Seconds of CPU time each pattern check may use
+    pattern_budget = DEFAULT_BUDGET
+
+    # Largest file, in bytes, any check will read
+    max_file_size = DEFAULT_MAX_FILE_SIZE
+
     def __init__(self, project_path: str):
         self.project_path = Path(project_path)
+        self._documents: dict[str, Document] = {}
+        self._symbols: dict[str, SymbolIndex] = {}
+
+    def document(self, filename: str) -> Optional[Document]:
+        """Return the shared Document for a file, or None if it doesn't exist."""
+        if filename not in self._documents:
+            file_path = self.project_path / filename
+            if not file_path.exists():
+                return None
+            self._documents[filename] = Document(file_path, self.max_file_size)
+        return self._documents[filename]
+
+    def symbols(self, path: str) -> Optional[SymbolIndex]:
+        """Return the shared symbol index for a Python file or directory.
+
+        A directory's index covers every Python file beneath it. Returns
+        None if the path doesn't exist.
+        """
+        if path not in self._symbols:
+            full_path = self.project_path / path
+            if not full_path.exists():
+                return None
+            self._symbols[path] = index_path(full_path, self.max_file_size)
+        return self._symbols[path]
+
+    @staticmethod
+    def _symbol_failure(index: SymbolIndex, message: str, details: Optional[str] = None):
+        """A failed structural check, noting any files that didn't parse."""
+        if index.errors:
+            unparsed = f"Could not parse {'; '.join(index.errors)}"
+            details = f"{details}; {unparsed}" if details else unparsed
+        return ValidationResult(False, message, details=details)
 
     def file_exists(self, filename: str) -> ValidationResult:
         """Check if a file exists in the project."""
@@ -45,13 +200,12 @@ class ProjectValidator:
 
     def word_count(self, filename: str, min_words: int) -> ValidationResult:
         """Check if a file has at least min_words words."""
-        file_path = self.project_path / filename
-        if not file_path.exists():
+        doc = self.document(filename)
+        if doc is None:
             return ValidationResult(False, f"File not found: {filename}")
 
         try:
-            content = file_path.read_text(encoding="utf-8")
-            words = len(content.split())
+            words = doc.word_count
             if words >= min_words:
                 return ValidationResult(
                     True,
@@ -66,18 +220,12 @@ class ProjectValidator:
 
     def has_heading_levels(self, filename: str, min_levels: int) -> ValidationResult:
         """Check if Markdown file uses at least min_levels heading levels."""
-        file_path = self.project_path / filename
-        if not file_path.exists():
+        doc = self.document(filename)
+        if doc is None:
             return ValidationResult(False, f"File not found: {filename}")
 
         try:
-            content = file_path.read_text(encoding="utf-8")
-            levels_found = set()
-            for line in content.split("\n"):
-                if line.startswith("#"):
-                    level = len(line) - len(line.lstrip("#"))
-                    if 1 <= level <= 6:
-                        levels_found.add(level)
+            levels_found = doc.markdown.heading_levels
 
             if len(levels_found) >= min_levels:
                 return ValidationResult(
@@ -93,33 +241,18 @@ class ProjectValidator:
 
     def has_element(self, filename: str, element: str) -> ValidationResult:
         """Check if Markdown file contains a specific element type."""
-        file_path = self.project_path / filename
-        if not file_path.exists():
+        doc = self.document(filename)
+        if doc is None:
             return ValidationResult(False, f"File not found: {filename}")
 
         try:
-            content = file_path.read_text(encoding="utf-8")
-
-            patterns = {
-                "unordered_list": r"^[\s]*[-*+]\s+\S",
-                "ordered_list": r"^[\s]*\d+\.\s+\S",
-                "table": r"\|.*\|.*\|",
-                "code_block": r"```",
-                "link": r"\[.+\]\(.+\)",
-                "image": r"!\[.+\]\(.+\)",
-                "bold": r"\*\*[^*]+\*\*",
-                "italic": r"(?<!\*)\*[^*]+\*(?!\*)",
-                "task_list": r"^[\s]*-\s+\[[x ]\]",
-            }
-
-            if element not in patterns:
+            if element not in ELEMENT_TYPES:
                 return ValidationResult(
                     False,
                     f"Unknown element type: {element}"
                 )
 
-            pattern = patterns[element]
-            if re.search(pattern, content, re.MULTILINE):
+            if element in doc.markdown.elements:
                 return ValidationResult(
                     True,
                     f"Element found: {element}"
@@ -133,17 +266,12 @@ class ProjectValidator:
 
     def has_section(self, filename: str, section_name: str) -> ValidationResult:
         """Check if Markdown file has a section with given name."""
-        file_path = self.project_path / filename
-        if not file_path.exists():
+        doc = self.document(filename)
+        if doc is None:
             return ValidationResult(False, f"File not found: {filename}")
 
         try:
-            content = file_path.read_text(encoding="utf-8").lower()
-            section_lower = section_name.lower()
-
-            # Look for heading with section name
-            pattern = rf"^#+\s+.*{section_lower}"
-            if re.search(pattern, content, re.MULTILINE):
+            if doc.markdown.has_section(section_name):
                 return ValidationResult(
                     True,
                     f"Section found: {section_name}"
@@ -157,22 +285,20 @@ class ProjectValidator:
 
     def markdown_valid(self, filename: str) -> ValidationResult:
         """Basic check that Markdown syntax is valid."""
-        file_path = self.project_path / filename
-        if not file_path.exists():
+        doc = self.document(filename)
+        if doc is None:
             return ValidationResult(False, f"File not found: {filename}")
 
         try:
-            content = file_path.read_text(encoding="utf-8")
+            scan = doc.markdown
             issues = []
 
             # Check for unclosed code blocks
-            code_blocks = content.count("```")
-            if code_blocks % 2 != 0:
+            if scan.unclosed_fence:
                 issues.append("Unclosed code block")
 
-            # Check for unclosed bold
-            bold_count = len(re.findall(r"\*\*", content))
-            if bold_count % 2 != 0:
+            # Check for unclosed bold (markers inside code don't count)
+            if scan.bold_markers % 2 != 0:
                 issues.append("Unclosed bold formatting")
 
             if issues:
@@ -187,12 +313,11 @@ class ProjectValidator:
 
     def license_valid(self, filename: str = "LICENSE") -> ValidationResult:
         """Check if LICENSE file contains a valid license."""
-        file_path = self.project_path / filename
-        if not file_path.exists():
+        doc = self.document(filename)
+        if doc is None:
             return ValidationResult(False, f"File not found: {filename}")
 
         try:
-            content = file_path.read_text(encoding="utf-8").lower()
             known_licenses = [
                 "mit license",
                 "apache license",
@@ -203,12 +328,11 @@ class ProjectValidator:
                 "creative commons",
             ]
 
-            for license_text in known_licenses:
-                if license_text in content:
-                    return ValidationResult(
-                        True,
-                        "Valid license found"
-                    )
+            if doc.find_all(known_licenses):
+                return ValidationResult(
+                    True,
+                    "Valid license found"
+                )
 
             return ValidationResult(
                 False,
@@ -219,12 +343,12 @@ class ProjectValidator:
 
     def changelog_format(self, filename: str = "CHANGELOG.md") -> ValidationResult:
         """Check if CHANGELOG follows Keep a Changelog format."""
-        file_path = self.project_path / filename
-        if not file_path.exists():
+        doc = self.document(filename)
+        if doc is None:
             return ValidationResult(False, f"File not found: {filename}")
 
         try:
-            content = file_path.read_text(encoding="utf-8")
+            content = doc.text
 
             # Check for required elements
             checks = [
@@ -246,18 +370,18 @@ class ProjectValidator:
 
     def adr_format(self, filename: str) -> ValidationResult:
         """Check if file follows ADR format."""
-        file_path = self.project_path / filename
-        if not file_path.exists():
+        doc = self.document(filename)
+        if doc is None:
             return ValidationResult(False, f"File not found: {filename}")
 
         try:
-            content = file_path.read_text(encoding="utf-8").lower()
             required_sections = ["status", "context", "decision"]
             optional_sections = ["rationale", "consequences"]
 
+            present = doc.find_all(required_sections)
             missing = []
             for section in required_sections:
-                if section not in content:
+                if section not in present:
                     missing.append(section)
 
             if missing:
@@ -272,12 +396,11 @@ class ProjectValidator:
 
     def no_placeholder_text(self, filename: str) -> ValidationResult:
         """Check that file doesn't contain common placeholder text."""
-        file_path = self.project_path / filename
-        if not file_path.exists():
+        doc = self.document(filename)
+        if doc is None:
             return ValidationResult(False, f"File not found: {filename}")
 
         try:
-            content = file_path.read_text(encoding="utf-8").lower()
             placeholders = [
                 "todo",
                 "tbd",
@@ -288,9 +411,10 @@ class ProjectValidator:
                 "fill this in",
             ]
 
+            present = doc.find_all(placeholders)
             found = []
             for placeholder in placeholders:
-                if placeholder in content:
+                if placeholder in present:
                     found.append(placeholder)
 
             if found:
@@ -305,81 +429,418 @@ class ProjectValidator:
 
     def count_pattern(self, filename: str, pattern: str, min_count: int) -> ValidationResult:
         """Count occurrences of a regex pattern in file."""
-        file_path = self.project_path / filename
-        if not file_path.exists():
+        doc = self.document(filename)
+        if doc is None:
             return ValidationResult(False, f"File not found: {filename}")
 
         try:
-            content = file_path.read_text(encoding="utf-8")
-            matches = re.findall(pattern, content, re.IGNORECASE | re.MULTILINE)
-            count = len(matches)
+            check_size(doc.path, doc.size, self.max_file_size)
+            # Counting stops at min_count; nothing more is needed to pass
+            count = count_matches(doc.path, pattern, min_count, self.pattern_budget)
 
             if count >= min_count:
                 return ValidationResult(
                     True,
-                    f"Pattern count OK: {count} (min: {min_count})"
+                    f"Pattern count OK: at least {count} (min: {min_count})"
                 )
             return ValidationResult(
                 False,
                 f"Pattern count too low: {count} (min: {min_count})"
             )
+        except PatternError as e:
+            return ValidationResult(False, str(e))
         except Exception as e:
             return ValidationResult(False, f"Error reading file: {e}")
 
+    def count_endpoints(self, filename: str, min_count: int = 1) -> ValidationResult:
+        """Count documented API endpoints or functions in a Markdown file.
 
-def validate_project(project_path: str, checks: list[dict]) -> list[ValidationResult]:
+        An endpoint is a line naming an HTTP method and path (``GET /users``)
+        or a heading naming a function call (``### create_user(name)``).
+        """
+        doc = self.document(filename)
+        if doc is None:
+            return ValidationResult(False, f"File not found: {filename}")
+
+        try:
+            endpoints = set()
+            for line in doc.lines:
+                match = _HTTP_ENDPOINT.match(line)
+                if match:
+                    endpoints.add(f"{match.group(1).upper()} {match.group(2)}")
+            for _, line in doc.headings:
+                match = _FUNCTION_HEADING.match(line)
+                if match:
+                    endpoints.add(match.group(1))
+            count = len(endpoints)
+
+            if count >= min_count:
+                return ValidationResult(
+                    True,
+                    f"Endpoint count OK: {count} (min: {min_count})"
+                )
+            return ValidationResult(
+                False,
+                f"Endpoint count too low: {count} (min: {min_count})"
+            )
+        except Exception as e:
+            return ValidationResult(False, f"Error reading file: {e}")
+
+    def function_exists(self, path: str, function: str) -> ValidationResult:
+        """Check that a Python file or directory defines a function.
+
+        ``Class.method`` names a method; a bare name may also match a method.
+        """
+        index = self.symbols(path)
+        if index is None:
+            return ValidationResult(False, f"File not found: {path}")
+
+        if index.find_function(function):
+            return ValidationResult(True, f"Function found: {function}")
+        return self._symbol_failure(index, f"Function not found: {function}")
+
+    def class_exists(
+        self,
+        path: str,
+        class_name: str,
+        methods: Union[list, tuple] = (),
+        attributes: Union[list, tuple] = (),
+    ) -> ValidationResult:
+        """Check that a class exists, optionally with the given methods and attributes.
+
+        Attributes may be assigned in the class body, assigned to self in
+        any method, or defined as properties.
+        """
+        index = self.symbols(path)
+        if index is None:
+            return ValidationResult(False, f"File not found: {path}")
+
+        info = index.classes.get(class_name)
+        if info is None:
+            return self._symbol_failure(index, f"Class not found: {class_name}")
+
+        missing = [f"method {m}" for m in methods if m not in info.methods]
+        missing += [f"attribute {a}" for a in attributes if a not in info.attributes]
+        if missing:
+            return ValidationResult(
+                False,
+                f"Class {class_name} is incomplete",
+                details=f"Missing: {', '.join(missing)}"
+            )
+        return ValidationResult(True, f"Class found: {class_name}")
+
+    def method_exists(self, path: str, class_name: str, method: str) -> ValidationResult:
+        """Check that a class defines a method."""
+        index = self.symbols(path)
+        if index is None:
+            return ValidationResult(False, f"File not found: {path}")
+
+        info = index.classes.get(class_name)
+        if info is None:
+            return self._symbol_failure(index, f"Class not found: {class_name}")
+        if method in info.methods:
+            return ValidationResult(True, f"Method found: {class_name}.{method}")
+        return ValidationResult(False, f"Method not found: {class_name}.{method}")
+
+    def function_signature(
+        self,
+        path: str,
+        function: str,
+        has_type_hints: bool = False,
+        parameters: Union[list, tuple] = (),
+    ) -> ValidationResult:
+        """Check a function's signature.
+
+        Args:
+            path: Python file or directory
+            function: Function name (see function_exists)
+            has_type_hints: Require annotations on every parameter (other
+                than self/cls) and the return value
+            parameters: Parameter names the function must accept, in order
+        """
+        index = self.symbols(path)
+        if index is None:
+            return ValidationResult(False, f"File not found: {path}")
+
+        info = index.find_function(function)
+        if info is None:
+            return self._symbol_failure(index, f"Function not found: {function}")
+
+        issues = []
+        if has_type_hints and not info.has_type_hints:
+            unannotated = [name for name, annotated in info.arguments.items() if not annotated]
+            if not info.returns_annotated:
+                unannotated.append("return")
+            issues.append(f"missing type hints: {', '.join(unannotated)}")
+        if parameters:
+            if list(info.arguments)[:len(parameters)] != list(parameters):
+                issues.append(f"expected parameters ({', '.join(parameters)})")
+
+        if issues:
+            return ValidationResult(
+                False,
+                f"Signature of {function} doesn't match",
+                details="; ".join(issues)
+            )
+        return ValidationResult(True, f"Signature OK: {function}")
+
+    def parameter_exists(self, path: str, function: str, parameter: str) -> ValidationResult:
+        """Check that a function accepts a parameter."""
+        index = self.symbols(path)
+        if index is None:
+            return ValidationResult(False, f"File not found: {path}")
+
+        info = index.find_function(function)
+        if info is None:
+            return self._symbol_failure(index, f"Function not found: {function}")
+        if parameter in info.parameters:
+            return ValidationResult(True, f"Parameter found: {function}({parameter})")
+        return ValidationResult(False, f"Parameter not found: {function}({parameter})")
+
+    def module_used(self, path: str, module: str) -> ValidationResult:
+        """Check that Python source imports a module."""
+        index = self.symbols(path)
+        if index is None:
+            return ValidationResult(False, f"File not found: {path}")
+
+        if module in index.imports:
+            return ValidationResult(True, f"Module used: {module}")
+        return self._symbol_failure(index, f"Module not imported: {module}")
+
+
+# Checks that take a regex, mapped to the position of the pattern argument
+_PATTERN_ARGS = {
+    "count_pattern": 1,
+}
+
+# Comparison operators allowed after a check, mapped to the minimum
+# threshold they translate to for checks whose last argument is a minimum
+_THRESHOLD_OPS = {
+    ast.GtE: lambda n: n,
+    ast.Gt: lambda n: n + 1,
+}
+
+
+@dataclass(frozen=True)
+class CompiledCheck:
+    """A validation check parsed and resolved ahead of time."""
+
+    source: str
+    method: Optional[Callable[..., ValidationResult]] = None
+    args: tuple = ()
+    error: Optional[str] = None
+
+    @property
+    def inputs(self) -> tuple[str, ...]:
+        """Project paths the check reads.
+
+        Every check takes the file or directory it inspects as its first
+        argument; checks without one have no tracked inputs.
+        """
+        if self.args and isinstance(self.args[0], str):
+            return (self.args[0],)
+        return ()
+
+    def run(self, validator: ProjectValidator) -> ValidationResult:
+        """Run the check against a validator."""
+        if self.error:
+            return ValidationResult(False, self.error)
+        try:
+            return self.method(validator, *self.args)
+        except Exception as e:
+            return ValidationResult(False, f"Check failed: {e}")
+
+
+def _resolve_check(name: str) -> Optional[Callable[..., ValidationResult]]:
+    """Find the ProjectValidator check method with the given name."""
+    method = getattr(ProjectValidator, name, None)
+    if name.startswith("_") or not inspect.isfunction(method):
+        return None
+    if inspect.signature(method).return_annotation is not ValidationResult:
+        return None
+    return method
+
+
+@lru_cache(maxsize=512)
+def compile_check(source: str, args: tuple = ()) -> CompiledCheck:
+    """Compile a check expression into a reusable CompiledCheck.
+
+    Accepts a bare check name (with ``args`` supplied separately), a call
+    such as ``file_exists('README.md')``, or a call compared against a
+    number such as ``word_count('notes.md') >= 200``. A comparison supplies
+    the check's final minimum argument.
+
+    Args:
+        source: Check expression from the project definition
+        args: Arguments for a bare check name
+
+    Returns:
+        CompiledCheck; problems are reported through its error field
+    """
+    try:
+        node = ast.parse(source.strip(), mode="eval").body
+    except SyntaxError:
+        return CompiledCheck(source, error=f"Invalid check: {source}")
+
+    threshold = None
+    if isinstance(node, ast.Compare):
+        if len(node.ops) != 1 or type(node.ops[0]) not in _THRESHOLD_OPS:
+            return CompiledCheck(source, error=f"Unsupported comparison: {source}")
+        try:
+            bound = ast.literal_eval(node.comparators[0])
+        except ValueError:
+            bound = None
+        if not isinstance(bound, int) or isinstance(bound, bool):
+            return CompiledCheck(source, error=f"Comparison needs an integer: {source}")
+        threshold = _THRESHOLD_OPS[type(node.ops[0])](bound)
+        node = node.left
+
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and not node.keywords:
+        name = node.func.id
+        try:
+            args = tuple(ast.literal_eval(arg) for arg in node.args)
+        except ValueError:
+            return CompiledCheck(source, error=f"Check arguments must be literals: {source}")
+    elif isinstance(node, ast.Name):
+        name = node.id
+    else:
+        return CompiledCheck(source, error=f"Invalid check: {source}")
+
+    method = _resolve_check(name)
+    if method is None:
+        return CompiledCheck(source, error=f"Unknown check: {name}")
+
+    if threshold is not None:
+        args = args + (threshold,)
+    try:
+        inspect.signature(method).bind(None, *args)
+    except TypeError:
+        return CompiledCheck(source, error=f"Invalid arguments for {name}: {source}")
+
+    if name in _PATTERN_ARGS:
+        try:
+            compile_pattern(str(args[_PATTERN_ARGS[name]]))
+        except PatternError as e:
+            return CompiledCheck(source, error=str(e))
+
+    return CompiledCheck(source, method, args)
+
+
+def compile_checks(checks: list[dict]) -> tuple[CompiledCheck, ...]:
+    """Compile a project's check configurations into an immutable plan.
+
+    Args:
+        checks: List of check configurations (see validate_project)
+
+    Returns:
+        Tuple of CompiledCheck objects, one per non-empty check
+    """
+    return tuple(
+        compile_check(config["check"], tuple(config.get("args", [])))
+        for config in checks
+        if config.get("check")
+    )
+
+
+# Requirement validation types in flat project definitions that map to a
+# check, with the keys supplying the check's arguments in order
+_REQUIREMENT_ARGS = {
+    "file_exists": ("file",),
+    "function_exists": ("file", "function"),
+    "class_exists": ("file", "class", "methods", "attributes"),
+    "method_exists": ("file", "class", "method"),
+    "function_signature": ("file", "function", "has_type_hints", "parameters"),
+    "parameter_exists": ("file", "function", "parameter"),
+    "module_used": ("file", "module"),
+}
+
+# Values for requirement keys that are left out; structural checks search
+# the whole project unless a file is given
+_REQUIREMENT_DEFAULTS = {
+    "file": ".",
+    "methods": (),
+    "attributes": (),
+    "has_type_hints": False,
+    "parameters": (),
+}
+
+
+def requirement_checks(requirements: Union[list, dict]) -> list[dict]:
+    """Turn the requirements of a flat project definition into check configurations.
+
+    The nested layout keeps requirements as a dict of sections
+    (``primary:``, ``integrations:``); its lists are searched too.
+    Requirements whose validation is manual or has no matching check, and
+    entries that aren't requirements at all, are skipped.
+    """
+    if isinstance(requirements, dict):
+        requirements = [
+            entry
+            for section in requirements.values()
+            if isinstance(section, list)
+            for entry in section
+        ]
+
+    checks = []
+    for requirement in requirements:
+        if not isinstance(requirement, dict):
+            continue
+        validation = requirement.get("validation") or {}
+        if not isinstance(validation, dict):
+            continue
+        keys = _REQUIREMENT_ARGS.get(validation.get("type"))
+        if keys is None:
+            continue
+        args = []
+        for key in keys:
+            value = validation.get(key, _REQUIREMENT_DEFAULTS.get(key))
+            args.append(tuple(value) if isinstance(value, list) else value)
+        # Leave out trailing arguments that are just defaults
+        while len(args) > 1 and args[-1] == _REQUIREMENT_DEFAULTS.get(keys[len(args) - 1]):
+            args.pop()
+        source = f"{validation['type']}({', '.join(repr(arg) for arg in args)})"
+        checks.append({
+            "check": source,
+            "error_message": requirement.get("description", ""),
+        })
+    return checks
+
+
+def load_checks(path: str) -> list[dict]:
+    """Load check configurations from a project YAML file.
+
+    Accepts a full project definition (checks under ``validation.automated``,
+    or ``requirements`` in the flat layout) or a file containing just the
+    list of checks.
+    """
+    import yaml
+
+    data = yaml.safe_load(Path(path).read_text(encoding="utf-8"))
+    if isinstance(data, dict):
+        checks = list((data.get("validation") or {}).get("automated") or [])
+        return checks + requirement_checks(data.get("requirements") or [])
+    return list(data or [])
+
+
+def validate_project(
+    project_path: str,
+    checks: Union[list[dict], tuple[CompiledCheck, ...]],
+) -> list[ValidationResult]:
     """Run a list of validation checks on a project.
 
     Args:
         project_path: Path to the project directory
-        checks: List of check configurations, each with:
-            - check: Name of validation method
-            - args: Arguments for the method
+        checks: A plan from compile_checks, or a list of check
+            configurations, each with:
+            - check: Check expression, e.g. "file_exists('README.md')"
+            - args: Arguments when check is a bare method name (optional)
             - error_message: Custom error message (optional)
 
     Returns:
         List of ValidationResult objects
     """
+    if checks and isinstance(checks[0], dict):
+        checks = compile_checks(checks)
+
     validator = ProjectValidator(project_path)
-    results = []
-
-    for check_config in checks:
-        check_name = check_config.get("check", "")
-        args = check_config.get("args", [])
-
-        # Parse check string like "file_exists('README.md')"
-        if "(" in check_name:
-            match = re.match(r"(\w+)\((.*)\)", check_name)
-            if match:
-                method_name = match.group(1)
-                args_str = match.group(2)
-                # Parse arguments
-                args = [
-                    arg.strip().strip("'\"")
-                    for arg in args_str.split(",")
-                    if arg.strip()
-                ]
-
-                if hasattr(validator, method_name):
-                    method = getattr(validator, method_name)
-                    # Convert numeric arguments
-                    converted_args = []
-                    for arg in args:
-                        try:
-                            converted_args.append(int(arg))
-                        except ValueError:
-                            converted_args.append(arg)
-
-                    try:
-                        result = method(*converted_args)
-                        results.append(result)
-                    except Exception as e:
-                        results.append(
-                            ValidationResult(False, f"Check failed: {e}")
-                        )
-                else:
-                    results.append(
-                        ValidationResult(False, f"Unknown check: {method_name}")
-                    )
-
-    return results
+    return [check.run(validator) for check in checks]
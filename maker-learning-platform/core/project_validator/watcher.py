@@ -0,0 +1,199 @@
+"""Filesystem watching for continuous project validation.
+
+Uses Linux inotify (through ctypes) when available and falls back to
+polling file modification times everywhere else. Bursts of events are
+debounced into a single batch of changed paths.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Iterator, Optional
+
+# Directories that never hold validated project files
+IGNORED_DIRS = {".git", "__pycache__", ".maker-data", "venv", ".venv", "node_modules"}
+
+
+def _walk_dirs(root: Path) -> Iterator[Path]:
+    """Yield root and every non-ignored directory below it."""
+    for dirpath, dirnames, _ in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in IGNORED_DIRS]
+        yield Path(dirpath)
+
+
+class PollingBackend:
+    """Detects changes by comparing (mtime_ns, size) snapshots of the tree."""
+
+    def __init__(self, root: Path, interval: float = 1.0):
+        self.root = root
+        self.interval = interval
+        self._snapshot = self._scan()
+
+    def _scan(self) -> dict[str, tuple[int, int]]:
+        """Stat every file and directory in the project."""
+        snapshot = {}
+        for directory in _walk_dirs(self.root):
+            try:
+                entries = list(os.scandir(directory))
+            except OSError:
+                continue
+            for entry in entries:
+                try:
+                    st = entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+                rel = os.path.relpath(entry.path, self.root).replace(os.sep, "/")
+                snapshot[rel] = (st.st_mtime_ns, st.st_size)
+        return snapshot
+
+    def poll(self, timeout: float) -> set[str]:
+        """Wait up to timeout seconds and return the paths that changed."""
+        time.sleep(min(timeout, self.interval))
+        current = self._scan()
+        changed = {
+            path for path in current.keys() | self._snapshot.keys()
+            if current.get(path) != self._snapshot.get(path)
+        }
+        self._snapshot = current
+        return changed
+
+    def close(self):
+        """Nothing to release for polling."""
+
+
+class InotifyBackend:
+    """Receives change events from the Linux kernel via inotify."""
+
+    IN_MODIFY = 0x00000002
+    IN_ATTRIB = 0x00000004
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_ISDIR = 0x40000000
+    WATCH_MASK = (
+        IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM
+        | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    )
+    EVENT_HEADER = struct.Struct("iIII")
+
+    def __init__(self, root: Path):
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify is only available on Linux")
+
+        self.root = root
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self.fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._dirs: dict[int, str] = {}
+        for directory in _walk_dirs(root):
+            self._add_watch(directory)
+
+    def _add_watch(self, directory: Path):
+        """Watch a directory for changes to its entries."""
+        wd = self._libc.inotify_add_watch(
+            self.fd, os.fsencode(str(directory)), self.WATCH_MASK
+        )
+        if wd >= 0:
+            rel = os.path.relpath(directory, self.root).replace(os.sep, "/")
+            self._dirs[wd] = "" if rel == "." else rel
+
+    def poll(self, timeout: float) -> set[str]:
+        """Wait up to timeout seconds and return the paths that changed."""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+
+        changed = set()
+        offset = 0
+        while offset + self.EVENT_HEADER.size <= len(data):
+            wd, mask, _, length = self.EVENT_HEADER.unpack_from(data, offset)
+            offset += self.EVENT_HEADER.size
+            name = os.fsdecode(data[offset:offset + length].rstrip(b"\0"))
+            offset += length
+
+            parent = self._dirs.get(wd)
+            if parent is None:
+                continue
+            rel = f"{parent}/{name}" if parent and name else (name or parent)
+            changed.add(rel)
+
+            if mask & self.IN_ISDIR and mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                if name not in IGNORED_DIRS:
+                    for directory in _walk_dirs(self.root / rel):
+                        self._add_watch(directory)
+        return changed
+
+    def close(self):
+        """Close the inotify file descriptor."""
+        os.close(self.fd)
+
+
+class ProjectWatcher:
+    """Yields debounced batches of changed paths within a project directory."""
+
+    def __init__(
+        self,
+        project_path: str,
+        debounce: float = 0.2,
+        poll_interval: float = 1.0,
+        use_inotify: bool = True,
+    ):
+        """Create a watcher.
+
+        Args:
+            project_path: Directory to watch
+            debounce: Quiet period in seconds that ends a burst of events
+            poll_interval: Seconds between scans when polling
+            use_inotify: Try inotify before falling back to polling
+        """
+        self.project_path = Path(project_path)
+        self.debounce = debounce
+        self.backend = None
+        if use_inotify:
+            try:
+                self.backend = InotifyBackend(self.project_path)
+            except (OSError, AttributeError):
+                self.backend = None
+        if self.backend is None:
+            self.backend = PollingBackend(self.project_path, poll_interval)
+
+    def changes(self, timeout: Optional[float] = None) -> Iterator[set[str]]:
+        """Yield sets of changed relative paths, one per burst of activity.
+
+        Args:
+            timeout: Stop after this many seconds without changes (None waits forever)
+        """
+        idle_since = time.monotonic()
+        while True:
+            changed = self.backend.poll(1.0)
+            if not changed:
+                if timeout is not None and time.monotonic() - idle_since >= timeout:
+                    return
+                continue
+
+            # Keep collecting until the burst goes quiet
+            while True:
+                more = self.backend.poll(self.debounce)
+                if not more:
+                    break
+                changed |= more
+
+            yield changed
+            idle_since = time.monotonic()
+
+    def close(self):
+        """Stop watching."""
+        self.backend.close()
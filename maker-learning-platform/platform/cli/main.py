@@ -4,20 +4,28 @@ This CLI demonstrates the core concept of capability-aware learning,
 aligned with Principle 2 (Practical Over Perfect) by shipping a working
 tool quickly, and Principle 5 (Accessibility First) by working with
 just Python installed.
+
+Startup budget: only click is imported at module load. Each command
+imports the rich components and core modules it needs when it runs, so
+``maker --version`` and ``maker --help`` never import rich, the
+capability checker or the assessment question banks. Keep the
+cumulative import time of ``maker --version`` under 60 ms, measured with::
+
+    python -X importtime "$(which maker)" --version 2>&1 | sort -t'|' -k2 -n | tail -1
 """
 
+from functools import lru_cache
+from typing import Optional
+
 import click
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.tree import Tree
-from rich.prompt import Prompt, Confirm
 
-from core.capability_checker import CapabilityChecker
-from core.progress_tracker.tracker import ProgressTracker
-from core.progress_tracker.assessments import PlacementAssessment, CommandLineAssessment
 
-console = Console()
+@lru_cache(maxsize=None)
+def get_console():
+    """Create the shared rich console on first use."""
+    from rich.console import Console
+
+    return Console()
 
 
 @click.group()
@@ -33,16 +41,37 @@ def cli():
 
 @cli.command()
 @click.option("--verbose", "-v", is_flag=True, help="Show detailed version information")
-def check(verbose):
+@click.option("--refresh", is_flag=True, help="Ignore cached results and probe everything again")
+@click.option("--recheck", multiple=True, metavar="TOOL",
+              help="Probe one tool again (e.g. after installing it); repeatable")
+def check(verbose, refresh, recheck):
     """Check your system capabilities.
 
     Detects what tools and hardware you have available, so we can
-    recommend projects that match your setup.
+    recommend projects that match your setup. Results are cached in
+    .maker-data and re-probed when they expire or a tool changes.
     """
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.tree import Tree
+
+    from core.capability_checker import CapabilityChecker
+
+    console = get_console()
     console.print("\n[bold blue]Checking system capabilities...[/bold blue]\n")
 
-    checker = CapabilityChecker()
-    caps = checker.check_all()
+    cache_file = ".maker-data/capabilities.json"
+    checker = CapabilityChecker(cache_file=cache_file)
+    if recheck:
+        try:
+            checker.invalidate(*recheck)
+        except ValueError as e:
+            console.print(f"[red]{e}[/red]")
+            raise SystemExit(1) from None
+
+    caps = None if refresh or recheck else CapabilityChecker.load_cached(cache_file)
+    if caps is None:
+        caps = checker.check_all(refresh=refresh)
     summary = caps.summary()
 
     # System information panel
@@ -99,39 +128,51 @@ def explore():
     Shows the skill trees and project options available to you,
     based on your interests and capabilities.
     """
+    from rich.panel import Panel
+    from rich.tree import Tree
+
+    console = get_console()
     console.print("\n[bold blue]Learning Paths[/bold blue]\n")
 
-    # Show available tracks
-    tracks = Tree("[bold]Available Tracks[/bold]")
+    content = _load_content()
+
+    # One branch per subject, with its levels and their projects
+    tracks = Tree("[bold]Available Subjects[/bold]")
+    for subject in content.subjects():
+        branch = tracks.add(f"[cyan]{subject['name']}[/cyan] - {subject['summary']}")
+        topic = content.topic(subject["id"])
+        for level in topic["levels"]:
+            label = level["subtitle"] or level["band"] or ""
+            level_branch = branch.add(f"[dim]{level['name']}[/dim] - {label}")
+            for project in topic["projects"]:
+                if project["level"] == level["level"]:
+                    level_branch.add(
+                        f"{project['name']} [dim]({_project_path(content, project)})[/dim]"
+                    )
 
-    # Python track
-    python = tracks.add("[cyan]Python[/cyan] - Automation & scripting")
-    python.add("[dim]Tinkerer[/dim] - File organizers, basic automation")
-    python.add("[dim]Builder[/dim] - Web scraping, data processing")
-    python.add("[dim]Maker[/dim] - APIs, integrations, complex automation")
+    console.print(Panel(tracks, border_style="blue"))
+
+    console.print(
+        "\n[dim]Run [bold]maker start <subject>/<level>/<project>[/bold] to begin a project.[/dim]\n"
+    )
 
-    # Bash track
-    bash = tracks.add("[cyan]Bash[/cyan] - System automation")
-    bash.add("[dim]Tinkerer[/dim] - System info, backups")
-    bash.add("[dim]Builder[/dim] - Advanced scripting, cron jobs")
-    bash.add("[dim]Maker[/dim] - Infrastructure automation")
 
-    # HTML/CSS track
-    web = tracks.add("[cyan]HTML/CSS[/cyan] - Visual interfaces")
-    web.add("[dim]Tinkerer[/dim] - Personal dashboards")
-    web.add("[dim]Builder[/dim] - Interactive pages")
-    web.add("[dim]Maker[/dim] - Full web applications")
+def _load_content():
+    """Open the content index, warning about source files left out of it."""
+    from core.content_index import ContentIndex
 
-    # Integration track
-    integration = tracks.add("[yellow]Integration Projects[/yellow] - Combine skills!")
-    integration.add("[dim]Morning Dashboard[/dim] - Python + HTML/CSS + Bash")
-    integration.add("[dim]Home Automation Hub[/dim] - All skills")
+    content = ContentIndex.load()
+    for error in content.errors():
+        get_console().print(f"[yellow]Skipped invalid content file[/yellow] {error}")
+    return content
 
-    console.print(Panel(tracks, border_style="blue"))
 
-    console.print(
-        "\n[dim]Run [bold]maker start <track>/<level>/<project>[/bold] to begin a project.[/dim]\n"
+def _project_path(content, project: dict) -> str:
+    """Build the <subject>/<level>/<project> path used by 'maker start'."""
+    level_name = content.level_names(project["subject"]).get(
+        project["level"], str(project["level"])
     )
+    return f"{project['subject']}/{level_name.lower()}/{project['slug']}"
 
 
 @cli.command()
@@ -139,20 +180,24 @@ def explore():
 def start(project_path):
     """Start a learning project.
 
-    PROJECT_PATH: The project to start (e.g., python/tinkerer/file-organizer)
+    PROJECT_PATH: The project to start (e.g., python/curious/text-statistics)
     """
+    console = get_console()
+    content = _load_content()
+
     if not project_path:
         console.print("\n[yellow]Available starter projects:[/yellow]\n")
         starters = [
-            ("python/tinkerer/file-organizer", "Organize files by type/date"),
-            ("python/tinkerer/todo-cli", "Simple command-line todo list"),
-            ("bash/tinkerer/system-info", "Script to display system information"),
-            ("web/tinkerer/dashboard", "Personal local dashboard"),
+            project
+            for subject in content.subjects()
+            for project in content.projects(subject["id"])
+            if project["level"] == 0
         ]
-        for path, desc in starters:
-            console.print(f"  [cyan]{path}[/cyan]")
-            console.print(f"    {desc}\n")
-        console.print("[dim]Usage: maker start python/tinkerer/file-organizer[/dim]\n")
+        for project in starters:
+            console.print(f"  [cyan]{_project_path(content, project)}[/cyan]")
+            console.print(f"    {project['description']}\n")
+        if starters:
+            console.print(f"[dim]Usage: maker start {_project_path(content, starters[0])}[/dim]\n")
         return
 
     # Parse project path
@@ -160,15 +205,23 @@ def start(project_path):
     if len(parts) != 3:
         console.print(
             "[red]Invalid project path.[/red] "
-            "Use format: [cyan]<language>/<level>/<project>[/cyan]"
+            "Use format: [cyan]<subject>/<level>/<project>[/cyan]"
         )
         return
 
-    language, level, project = parts
+    subject_id, level, slug = parts
+    project = content.find_project(subject_id, slug)
+    if project is None or _project_path(content, project) != project_path.lower():
+        console.print(
+            f"[red]Unknown project '{project_path}'.[/red] "
+            "Run [cyan]maker start[/cyan] to see available projects."
+        )
+        return
 
-    console.print(f"\n[bold green]Starting project:[/bold green] {project}\n")
-    console.print(f"  Track: [cyan]{language}[/cyan]")
-    console.print(f"  Level: [cyan]{level}[/cyan]")
+    topic = content.topic(subject_id)
+    console.print(f"\n[bold green]Starting project:[/bold green] {project['name']}\n")
+    console.print(f"  Subject: [cyan]{topic['name']}[/cyan]")
+    console.print(f"  Level: [cyan]{project['level']} ({level.title()})[/cyan]")
     console.print()
 
     # Placeholder for actual project initialization
@@ -179,18 +232,203 @@ def start(project_path):
     )
 
 
+def _validation_table(plan, results):
+    """Build the pass/fail table for a validation run."""
+    from rich.table import Table
+
+    passed = sum(1 for r in results if r.passed)
+    table = Table(
+        show_header=True,
+        header_style="bold",
+        title=f"[bold]{passed}/{len(results)} checks passed[/bold]",
+    )
+    table.add_column("Check", style="cyan")
+    table.add_column("Status")
+    table.add_column("Result")
+
+    for check, result in zip(plan, results):
+        status_str = "[green]✓ Pass[/green]" if result.passed else "[red]✗ Fail[/red]"
+        message = result.message
+        if result.details:
+            message += f" [dim]({result.details})[/dim]"
+        if result.cached:
+            message += " [dim]cached[/dim]"
+        table.add_row(check.source, status_str, message)
+
+    return table
+
+
+@cli.command()
+@click.argument("checks_file", type=click.Path(exists=True, dir_okay=False))
+@click.argument("project_dir", default=".", type=click.Path(exists=True, file_okay=False))
+@click.option("--watch", "-w", is_flag=True, help="Re-validate whenever project files change")
+@click.option("--poll", is_flag=True, help="Poll for changes instead of using inotify")
+def validate(checks_file, project_dir, watch, poll):
+    """Check a project against its completion criteria.
+
+    CHECKS_FILE: Project definition YAML (e.g. level-1-personal-readme.yaml)
+
+    PROJECT_DIR: Your project directory (defaults to the current directory)
+    """
+    from core.project_validator.incremental import IncrementalValidator
+    from core.project_validator.validator import load_checks
+
+    console = get_console()
+    validator = IncrementalValidator(project_dir, load_checks(checks_file))
+    results = validator.validate()
+
+    if not watch:
+        console.print(_validation_table(validator.plan, results))
+        return
+
+    from rich.live import Live
+
+    from core.project_validator.watcher import ProjectWatcher
+
+    watcher = ProjectWatcher(project_dir, use_inotify=not poll)
+    console.print("\n[dim]Watching for changes. Press Ctrl+C to stop.[/dim]\n")
+    try:
+        with Live(
+            _validation_table(validator.plan, results),
+            console=console,
+            auto_refresh=False,
+        ) as live:
+            for changed in watcher.changes():
+                results = validator.validate(changed)
+                live.update(_validation_table(validator.plan, results), refresh=True)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
+
+
 @cli.command()
-def status():
+@click.argument("checks_file", type=click.Path(exists=True, dir_okay=False))
+@click.argument("submissions", nargs=-1, required=True, type=click.Path(exists=True, file_okay=False))
+@click.option("--report", "-o", "report_path", type=click.Path(dir_okay=False),
+              help="Write results to a .jsonl or .csv file")
+@click.option("--workers", "-j", type=click.IntRange(min=1), help="Worker processes (default: CPU count)")
+@click.option("--timeout", default=30.0, type=click.FloatRange(min=0), show_default=True,
+              help="Seconds allowed per submission (0 for no limit)")
+def grade(checks_file, submissions, report_path, workers, timeout):
+    """Grade many project submissions against the same criteria.
+
+    CHECKS_FILE: Project definition YAML (e.g. level-1-personal-readme.yaml)
+
+    SUBMISSIONS: Learners' project directories
+    """
+    import time
+
+    from core.project_validator.grading import GradeReport, grade_submissions
+    from core.project_validator.validator import compile_checks, load_checks
+
+    console = get_console()
+    checks = load_checks(checks_file)
+    plan = compile_checks(checks)
+    for check in plan:
+        if check.error:
+            console.print(f"[red]{check.error}[/red]")
+            raise SystemExit(1)
+
+    report = GradeReport(report_path, plan) if report_path else None
+    start = time.perf_counter()
+    graded = failed = 0
+    try:
+        for result in grade_submissions(checks, submissions, workers, timeout):
+            graded += 1
+            if result.error:
+                failed += 1
+                status_str = f"[red]{result.error}[/red]"
+            else:
+                color = "green" if result.passed == len(plan) else "yellow"
+                status_str = f"[{color}]{result.passed}/{len(plan)}[/{color}]"
+            console.print(
+                f"[dim]{graded}/{len(submissions)}[/dim] {result.submission}: "
+                f"{status_str} [dim]({result.seconds:.2f}s)[/dim]"
+            )
+            if report:
+                report.write(result)
+    finally:
+        if report:
+            report.close()
+
+    elapsed = time.perf_counter() - start
+    console.print(
+        f"\n[bold]Graded {graded} submissions in {elapsed:.1f}s[/bold]"
+        + (f" [red]({failed} not graded)[/red]" if failed else "")
+    )
+    if report_path:
+        console.print(f"[dim]Report written to {report_path}[/dim]")
+
+
+def _open_tracker(user_id: Optional[str]):
+    """Open the default tracker, or a learner's tracker on a shared data directory."""
+    from core.progress_tracker.tracker import ProgressTracker
+
+    if user_id:
+        return ProgressTracker.for_user(user_id)
+    return ProgressTracker()
+
+
+def _all_users_status(console):
+    """Print progress totals across every registered learner."""
+    from rich.panel import Panel
+    from rich.table import Table
+
+    from core.progress_tracker.registry import UserRegistry
+
+    totals = UserRegistry().aggregate_summary()
+
+    summary_table = Table(show_header=False, box=None, padding=(0, 2))
+    summary_table.add_column("Metric", style="cyan")
+    summary_table.add_column("Value")
+    summary_table.add_row("Learners", f"{totals['users']} ({totals['active_users']} active)")
+    summary_table.add_row("Subjects Started", str(totals["subjects_started"]))
+    summary_table.add_row("Projects Completed", str(totals["total_projects_completed"]))
+    summary_table.add_row("Concepts Learned", str(totals["total_concepts_learned"]))
+    summary_table.add_row("Total Time", f"{totals['total_time_hours']} hours")
+    for band, count in totals["bands"].items():
+        summary_table.add_row(f"{band} Subjects", str(count))
+
+    console.print(Panel(summary_table, title="[bold]All Learners[/bold]", border_style="blue"))
+    console.print()
+
+
+@cli.command()
+@click.option("--user", "user_id", help="Learner whose progress to show on a shared machine")
+@click.option("--all-users", is_flag=True, help="Show totals across all learners")
+@click.option("--verify", is_flag=True, help="Recount the summary from full history and repair it")
+def status(user_id, all_users, verify):
     """Show your learning progress.
 
     Displays your current skill levels, completed projects,
     and suggested next steps.
     """
+    from rich.panel import Panel
+    from rich.table import Table
+
+    from core.progress_tracker.storage import ProgressStoreError
+
+    console = get_console()
     console.print("\n[bold blue]Your Learning Progress[/bold blue]\n")
 
-    tracker = ProgressTracker()
-    summary = tracker.get_summary()
-    subjects = tracker.get_subject_list()
+    try:
+        if all_users:
+            _all_users_status(console)
+            return
+        tracker = _open_tracker(user_id)
+        if verify:
+            mismatches = tracker.verify_summary()
+            for key, (stored, actual) in mismatches.items():
+                console.print(f"[yellow]Repaired {key}:[/yellow] {stored} -> {actual}")
+            if not mismatches:
+                console.print("[green]Summary counters match the full history.[/green]")
+            console.print()
+        summary = tracker.get_summary()
+        subjects = tracker.get_subject_list()
+    except ProgressStoreError as e:
+        console.print(f"[red]Could not read your progress:[/red] {e}\n")
+        raise SystemExit(1) from None
 
     # Overall summary
     summary_table = Table(show_header=False, box=None, padding=(0, 2))
@@ -226,6 +464,142 @@ def status():
     console.print("\n[dim]Complete projects to advance your skills![/dim]\n")
 
 
+@cli.command()
+@click.option("--user", "user_id", help="Learner whose progress to export on a shared machine")
+@click.option("--output", "-o", type=click.Path(dir_okay=False), help="Write to a file instead of stdout")
+def export(user_id, output):
+    """Export your progress as JSON.
+
+    Works with every storage backend and includes the full history,
+    so the output can be kept as a backup or inspected by other tools.
+    """
+    import json
+
+    from core.progress_tracker.models import progress_to_dict
+    from core.progress_tracker.storage import ProgressStoreError
+
+    try:
+        progress = _open_tracker(user_id).progress
+    except ProgressStoreError as e:
+        get_console().print(f"[red]Could not read your progress:[/red] {e}")
+        raise SystemExit(1) from None
+
+    text = json.dumps(progress_to_dict(progress), indent=2)
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        click.echo(text)
+
+
+@cli.command()
+@click.option("--subject", "subject_id", help="Only show projects in this subject")
+@click.option("--since", help="Only show completions on or after this date (YYYY-MM-DD)")
+@click.option("--until", help="Only show completions before this date (YYYY-MM-DD)")
+@click.option("--page", default=1, type=click.IntRange(min=1), help="Page to show")
+@click.option("--size", default=20, type=click.IntRange(min=1), help="Completions per page")
+@click.option("--user", "user_id", help="Learner whose history to show on a shared machine")
+def history(subject_id, since, until, page, size, user_id):
+    """Show your completed projects, newest first.
+
+    Only the requested page is read, so long histories stay fast.
+    """
+    from rich.table import Table
+
+    from core.progress_tracker.storage import ProgressStoreError
+
+    console = get_console()
+    try:
+        view = _open_tracker(user_id).history(subject_id, since, until)
+        total = view.count()
+        completions = view.page(page - 1, size)
+    except ProgressStoreError as e:
+        console.print(f"[red]Could not read your progress:[/red] {e}")
+        raise SystemExit(1) from None
+
+    if not total:
+        console.print("\n[yellow]No completed projects found.[/yellow]\n")
+        return
+
+    pages = (total + size - 1) // size
+    table = Table(show_header=True, header_style="bold")
+    table.add_column("Completed")
+    table.add_column("Subject", style="cyan")
+    table.add_column("Project")
+    table.add_column("Time", justify="right")
+    table.add_column("Notes", style="dim")
+    for pc in completions:
+        table.add_row(
+            pc.completed_at[:16].replace("T", " "),
+            pc.subject_id or "-",
+            pc.project_id,
+            f"{pc.time_spent_minutes} min" if pc.time_spent_minutes else "-",
+            pc.notes or "",
+        )
+
+    console.print(f"\n[bold blue]Project History[/bold blue] ({total} completed)\n")
+    console.print(table)
+    console.print(f"\n[dim]Page {page} of {pages}[/dim]\n")
+
+
+@cli.command()
+@click.option("--weeks", default=12, type=click.IntRange(min=1), help="Number of weeks to chart")
+@click.option("--user", "user_id", help="Learner whose stats to show on a shared machine")
+def stats(weeks, user_id):
+    """Show streaks, weekly velocity and time spent.
+
+    Reads the activity index kept up to date as you learn, so the
+    chart costs the same however long your history is.
+    """
+    from datetime import date
+
+    from rich.bar import Bar
+    from rich.table import Table
+
+    from core.progress_tracker.storage import ProgressStoreError
+
+    console = get_console()
+    try:
+        activity = _open_tracker(user_id).activity()
+    except ProgressStoreError as e:
+        console.print(f"[red]Could not read your progress:[/red] {e}")
+        raise SystemExit(1) from None
+
+    today = date.today()
+    buckets = activity.weekly(today, weeks)
+    projects = sum(counts[0] for _, counts in buckets)
+    concepts = sum(counts[1] for _, counts in buckets)
+    most_minutes = max(counts[2] for _, counts in buckets) or 1
+
+    console.print("\n[bold blue]Learning Stats[/bold blue]\n")
+    console.print(
+        f"Current streak: [bold]{activity.current_streak(today)}[/bold] days   "
+        f"Longest streak: [bold]{activity.longest_streak}[/bold] days"
+    )
+    console.print(
+        f"Velocity: [bold]{projects / weeks:.1f}[/bold] projects and "
+        f"[bold]{concepts / weeks:.1f}[/bold] concepts per week "
+        f"(last {weeks} weeks)\n"
+    )
+
+    table = Table(show_header=True, header_style="bold")
+    table.add_column("Week of")
+    table.add_column("Projects", justify="right")
+    table.add_column("Concepts", justify="right")
+    table.add_column("Time", justify="right")
+    table.add_column("Time spent", width=32)
+    for week, (week_projects, week_concepts, minutes) in buckets:
+        table.add_row(
+            week.isoformat(),
+            str(week_projects),
+            str(week_concepts),
+            f"{minutes / 60:.1f} h",
+            Bar(most_minutes, 0, minutes, color="cyan"),
+        )
+    console.print(table)
+    console.print()
+
+
 @cli.command()
 def subjects():
     """List available learning subjects.
@@ -233,27 +607,12 @@ def subjects():
     Shows all subjects you can study, with their level counts
     and estimated completion times.
     """
+    from rich.table import Table
+
+    console = get_console()
     console.print("\n[bold blue]Available Subjects[/bold blue]\n")
 
-    # Subject data (will be loaded from content files in future)
-    available_subjects = [
-        {
-            "id": "project-foundations",
-            "name": "Project Foundations",
-            "description": "Documentation and planning skills",
-            "levels": 5,
-            "hours": "15-23",
-            "status": "available",
-        },
-        {
-            "id": "command-line-mastery",
-            "name": "Command Line Mastery",
-            "description": "Terminal navigation and shell scripting",
-            "levels": 5,
-            "hours": "30-42",
-            "status": "available",
-        },
-    ]
+    available_subjects = _load_content().subjects()
 
     subjects_table = Table(show_header=True, header_style="bold")
     subjects_table.add_column("Subject", style="cyan")
@@ -263,10 +622,10 @@ def subjects():
     subjects_table.add_column("Status")
 
     for subject in available_subjects:
-        status_str = "[green]Available[/green]" if subject["status"] == "available" else "[dim]Coming Soon[/dim]"
+        status_str = "[green]Available[/green]" if subject["projects"] else "[dim]Coming Soon[/dim]"
         subjects_table.add_row(
             subject["name"],
-            subject["description"],
+            subject["summary"],
             str(subject["levels"]),
             subject["hours"],
             status_str,
@@ -278,72 +637,75 @@ def subjects():
 
 @cli.command()
 @click.argument("subject_id", required=False)
-def assess(subject_id):
+@click.option("--questions", "num_questions", default=10, help="Number of questions to ask")
+@click.option("--user", "user_id", help="Learner taking the assessment on a shared machine")
+def assess(subject_id, num_questions, user_id):
     """Take a placement assessment for a subject.
 
     SUBJECT_ID: The subject to assess (e.g., project-foundations)
     """
+    from rich.panel import Panel
+    from rich.prompt import Prompt
+
+    from core.progress_tracker.assessments import Assessment
+    from core.progress_tracker.storage import ProgressStoreError
+
+    console = get_console()
+    content = _load_content()
+    subjects = {s["id"]: s for s in content.subjects() if s["questions"]}
+
     if not subject_id:
         console.print("\n[yellow]Available assessments:[/yellow]\n")
-        console.print("  [cyan]project-foundations[/cyan] - Documentation and planning skills")
-        console.print("  [cyan]command-line-mastery[/cyan] - Terminal and shell scripting\n")
-        console.print("[dim]Usage: maker assess project-foundations[/dim]\n")
+        for subject in subjects.values():
+            console.print(f"  [cyan]{subject['id']}[/cyan] - {subject['summary']}")
+        console.print("\n[dim]Usage: maker assess project-foundations[/dim]\n")
         return
 
-    if subject_id not in ["project-foundations", "command-line-mastery"]:
+    if subject_id not in subjects:
         console.print(f"\n[red]Assessment not available for '{subject_id}'[/red]\n")
         return
 
-    # Select appropriate assessment
-    if subject_id == "project-foundations":
-        console.print("\n[bold blue]Project Foundations - Placement Assessment[/bold blue]\n")
-        assessment = PlacementAssessment()
-    else:  # command-line-mastery
-        console.print("\n[bold blue]Command Line Mastery - Placement Assessment[/bold blue]\n")
-        assessment = CommandLineAssessment()
+    console.print(f"\n[bold blue]{subjects[subject_id]['name']} - Placement Assessment[/bold blue]\n")
+    assessment = Assessment(subject_id, content)
 
     console.print("Answer these questions to find your starting level.\n")
-    tracker = ProgressTracker()
-
-    # Level names for Project Foundations
-    level_names = {
-        0: "Curious",
-        1: "Explorer",
-        2: "Tinkerer",
-        3: "Builder",
-        4: "Maker",
-    }
+    tracker = _open_tracker(user_id)
+    level_names = content.level_names(subject_id)
 
     # Start the subject
-    tracker.start_subject(subject_id, level_names)
+    try:
+        tracker.start_subject(subject_id, level_names)
+    except ProgressStoreError as e:
+        console.print(f"[red]Could not read your progress:[/red] {e}\n")
+        raise SystemExit(1) from None
 
-    correct = 0
-    total = len(assessment.questions)
+    questions = assessment.get_assessment_questions(num_questions)
+    answers = {}
+    total = len(questions)
 
-    for i, question in enumerate(assessment.questions, 1):
+    for i, question in enumerate(questions, 1):
         console.print(f"[bold]Question {i}/{total}[/bold]")
         console.print(f"{question.text}\n")
 
         for j, option in enumerate(question.options):
             console.print(f"  {j + 1}. {option}")
 
-        while True:
-            answer = Prompt.ask("\nYour answer", choices=["1", "2", "3", "4"])
-            break
+        choices = [str(j + 1) for j in range(len(question.options))]
+        answer = int(Prompt.ask("\nYour answer", choices=choices)) - 1
+        answers[question.id] = answer
 
-        if int(answer) - 1 == question.correct_index:
-            correct += 1
+        if answer == question.correct_index:
             console.print("[green]Correct![/green]\n")
         else:
             console.print(f"[red]Incorrect.[/red] {question.explanation}\n")
 
     # Calculate level
-    result = assessment.calculate_level(correct, total)
+    result = assessment.evaluate_assessment(answers)
     tracker.record_assessment(subject_id, result.recommended_level, level_names)
 
     console.print(Panel(
-        f"Score: {result.score}/{result.total} ({result.percentage}%)\n"
-        f"Recommended Level: [bold]{result.recommended_level}[/bold] ({level_names[result.recommended_level]})",
+        f"Score: {result.correct_answers}/{result.total_questions} ({result.percentage:.0f}%)\n"
+        f"Recommended Level: [bold]{result.recommended_level}[/bold] ({result.level_name})",
         title="[bold]Assessment Complete[/bold]",
         border_style="green",
     ))
@@ -0,0 +1,6 @@
+"""Make the platform's packages importable from the tests."""
+
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
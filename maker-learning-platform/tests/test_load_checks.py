@@ -0,0 +1,24 @@
+"""Loading check plans from the shipped project definitions."""
+
+from pathlib import Path
+
+from core.project_validator.validator import compile_checks, load_checks
+
+CONTENT = Path(__file__).resolve().parent.parent / "content" / "topics"
+
+
+def test_nested_layout_with_requirement_sections():
+    # requirements is a dict of sections (primary:, integrations:) here
+    checks = load_checks(
+        CONTENT / "project-foundations" / "projects" / "level-1-personal-readme.yaml"
+    )
+    plan = compile_checks(checks)
+    assert plan
+    assert plan[0].source == "file_exists('PERSONAL_README.md')"
+    assert not [check.error for check in plan if check.error]
+
+
+def test_flat_layout_requirements_become_checks():
+    checks = load_checks(CONTENT / "python" / "projects" / "level-2-contact-book.yaml")
+    sources = [check.source for check in compile_checks(checks)]
+    assert "method_exists('.', 'ContactBook', 'search')" in sources
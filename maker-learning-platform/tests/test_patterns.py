@@ -0,0 +1,39 @@
+"""Static rejection of catastrophic-backtracking patterns."""
+
+import pytest
+
+from core.project_validator.patterns import PatternError, compile_pattern
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        r"(?:\d+\.)+\d+",
+        r"^(\d+\.)+\s",
+        r"(?:\w+\s)+",
+        r"(\[.+?\]\(.+?\))+",
+        r"^(#+ .+\n)+",
+        r"(?:[a-z]+,)*[a-z]+",
+        r"(?:ab)+",
+        r"\b(TODO|FIXME)\b",
+    ],
+)
+def test_delimited_patterns_are_accepted(pattern):
+    compile_pattern(pattern)
+
+
+@pytest.mark.parametrize(
+    "pattern, reason",
+    [
+        (r"(a+)+", "nested quantifiers"),
+        (r"(\d+\d)+", "nested quantifiers"),
+        (r"(\w+\s*)+$", "nested quantifiers"),
+        (r"(a|aa)+", "repeated alternatives"),
+        (r"(?:\d|\d\d)+x", "repeated alternatives"),
+        (r"(a|a?)*b", "can match empty text"),
+        (r"(a*)*b", "can match empty text"),
+    ],
+)
+def test_exponential_patterns_are_rejected(pattern, reason):
+    with pytest.raises(PatternError, match=reason):
+        compile_pattern(pattern)